@@ -1,39 +1,99 @@
-from pycadsx.cadtypes import CadTypes
-from pycadsx.client import (
-    Client, PartCommand, EntityCommand, BaseCommand, AsmPlaneCommand, EdgeCommand,
-    EntityCommand, FaceCommand, HoleCommand, ModelCommand, PartCommand, SystemCommand
-)
-from pycadsx.edge import Edge
-from pycadsx.options import SurfaceMarkOption, Project3d2dOption
-from pycadsx.geometry import DimensionLine
-from pycadsx.geometry import DimensionValue
-from pycadsx.entity import Entity, EntityGroup, EntityRefer, EntityFactory
-from pycadsx.r_part import RPart
-from pycadsx.part import Part
-from pycadsx.face import Face
-from pycadsx.material import Material
-from pycadsx.asm_plane import AsmPlane
-from pycadsx.draft_attribute import (
-    DraftAttribute, AppendDimension, DimensionForm, GeometricTolerance, Welding, Balloon, General, Word, Notation
-)
-from pycadsx.geometry import (
-    BaseGeometry, BaseDimensionGeometry, TextAttribute, Line3D, Line2D, Point3D, Point2D, Arc3D, Arc2D, Circle3D, 
-    Circle2D, Ellipse2D, EllipseArc2D, Spline2D, OtherCurve, Cap, Plane, Cone, Cylinder, Sphere, Torus, OtherSurf, 
-    DimensionLength, DimensionAngle, DimensionDiameter, DimensionCham, Text, LeadLine, Note, Balloon, SMark, Delta, 
-    DimensionArcLength, DimensionApl, Welding, SimpleWelding, ToleranceFrame, GeometricTolerance, Datum, CutLine, 
-    ArrowView, Arrow, Symbol, SymbolMetal, Indicator, FinishMark, Other, Hatch, Mark, GeometryFactory, LineAttribute
-)
-from pycadsx.mass import Moment
-from pycadsx.mass import Mass
-from pycadsx.vs import VS
-from pycadsx.window import Window
-from pycadsx.model import Model
-from pycadsx.plotter import Plotter
-from pycadsx.print_info import PrintInfo
-from pycadsx.pycadsx import IniFileParser
-from pycadsx.pycadsx import DBLock
-from pycadsx.selection import Selection
-from pycadsx.wf import WfType
-from pycadsx.wf import WF
-from pycadsx.hole import Hole
-from pycadsx.pycadsx import PyCadSx
+import importlib
+import typing
+
+# 属性を参照した時に初めてモジュールを読み込む (import pycadsx だけで全モジュールを読まない)
+# 同じ名前が複数のモジュールにある場合は後に書いた方が優先される
+# ここに載せるのは公開 API だけ (内部のクラスはそれぞれのモジュールから import する)
+_modules = {
+    'pycadsx.cadtypes'        : [ 'CadTypes' ],
+    'pycadsx.client'          : [
+        'Client', 'PartCommand', 'EntityCommand', 'BaseCommand', 'AsmPlaneCommand', 'EdgeCommand',
+        'FaceCommand', 'HoleCommand', 'ModelCommand', 'SystemCommand'
+    ],
+    'pycadsx.edge'            : [ 'Edge' ],
+    'pycadsx.options'         : [ 'SurfaceMarkOption', 'Project3d2dOption' ],
+    'pycadsx.entity'          : [ 'Entity', 'EntityGroup', 'EntityRefer', 'EntityFactory' ],
+    'pycadsx.r_part'          : [ 'RPart' ],
+    'pycadsx.part'            : [ 'Part' ],
+    'pycadsx.face'            : [ 'Face' ],
+    'pycadsx.material'        : [ 'Material' ],
+    'pycadsx.asm_plane'       : [ 'AsmPlane' ],
+    'pycadsx.draft_attribute' : [
+        'DraftAttribute', 'AppendDimension', 'DimensionForm', 'GeometricTolerance', 'Welding', 'Balloon', 'General', 'Word', 'Notation'
+    ],
+    'pycadsx.geometry'        : [
+        'DimensionLine', 'DimensionValue',
+        'BaseGeometry', 'BaseDimensionGeometry', 'TextAttribute', 'Line3D', 'Line2D', 'Point3D', 'Point2D', 'Arc3D', 'Arc2D', 'Circle3D',
+        'Circle2D', 'Ellipse2D', 'EllipseArc2D', 'Spline2D', 'OtherCurve', 'Cap', 'Plane', 'Cone', 'Cylinder', 'Sphere', 'Torus', 'OtherSurf',
+        'DimensionLength', 'DimensionAngle', 'DimensionDiameter', 'DimensionCham', 'Text', 'LeadLine', 'Note', 'Balloon', 'SMark', 'Delta',
+        'DimensionArcLength', 'DimensionApl', 'Welding', 'SimpleWelding', 'ToleranceFrame', 'GeometricTolerance', 'Datum', 'CutLine',
+        'ArrowView', 'Arrow', 'Symbol', 'SymbolMetal', 'Indicator', 'FinishMark', 'Other', 'Hatch', 'Mark', 'GeometryFactory', 'LineAttribute'
+    ],
+    'pycadsx.mass'            : [ 'Moment', 'Mass' ],
+    'pycadsx.vs'              : [ 'VS' ],
+    'pycadsx.window'          : [ 'Window' ],
+    'pycadsx.model'           : [ 'Model' ],
+    'pycadsx.plotter'         : [ 'Plotter' ],
+    'pycadsx.print_info'      : [ 'PrintInfo' ],
+    'pycadsx.selection'       : [ 'Selection' ],
+    'pycadsx.wf'              : [ 'WfType', 'WF' ],
+    'pycadsx.hole'            : [ 'Hole' ],
+    'pycadsx.config'          : [ 'IniFileParser' ],
+    'pycadsx.pycadsx'         : [ 'DBLock', 'PyCadSx' ],
+}
+
+if typing.TYPE_CHECKING:
+    # 型チェッカー・補完用 (実行時は __getattr__ で読み込む。_modules と同じ内容に保つこと)
+    from pycadsx.cadtypes import CadTypes
+    from pycadsx.client import (
+        Client, PartCommand, EntityCommand, BaseCommand, AsmPlaneCommand, EdgeCommand, FaceCommand, HoleCommand,
+        ModelCommand, SystemCommand
+    )
+    from pycadsx.edge import Edge
+    from pycadsx.options import SurfaceMarkOption, Project3d2dOption
+    from pycadsx.entity import Entity, EntityGroup, EntityRefer, EntityFactory
+    from pycadsx.r_part import RPart
+    from pycadsx.part import Part
+    from pycadsx.face import Face
+    from pycadsx.material import Material
+    from pycadsx.asm_plane import AsmPlane
+    from pycadsx.draft_attribute import (
+        DraftAttribute, AppendDimension, DimensionForm, GeometricTolerance, Welding, Balloon, General, Word, Notation
+    )
+    from pycadsx.geometry import (
+        DimensionLine, DimensionValue, BaseGeometry, BaseDimensionGeometry, TextAttribute, Line3D, Line2D, Point3D,
+        Point2D, Arc3D, Arc2D, Circle3D, Circle2D, Ellipse2D, EllipseArc2D, Spline2D, OtherCurve, Cap, Plane, Cone,
+        Cylinder, Sphere, Torus, OtherSurf, DimensionLength, DimensionAngle, DimensionDiameter, DimensionCham, Text,
+        LeadLine, Note, Balloon, SMark, Delta, DimensionArcLength, DimensionApl, Welding, SimpleWelding, ToleranceFrame,
+        GeometricTolerance, Datum, CutLine, ArrowView, Arrow, Symbol, SymbolMetal, Indicator, FinishMark, Other, Hatch,
+        Mark, GeometryFactory, LineAttribute
+    )
+    from pycadsx.mass import Moment, Mass
+    from pycadsx.vs import VS
+    from pycadsx.window import Window
+    from pycadsx.model import Model
+    from pycadsx.plotter import Plotter
+    from pycadsx.print_info import PrintInfo
+    from pycadsx.selection import Selection
+    from pycadsx.wf import WfType, WF
+    from pycadsx.hole import Hole
+    from pycadsx.config import IniFileParser
+    from pycadsx.pycadsx import DBLock, PyCadSx
+
+_attributes = { name : module for module, names in _modules.items() for name in names }
+
+__all__ = list(_attributes)
+
+
+def __getattr__(name: str):
+    module = _attributes.get(name)
+    if module is None:
+        raise AttributeError(f"module 'pycadsx' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module), name)
+    # 2回目以降は普通の属性として参照される
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted( set(globals()) | set(_attributes) )
@@ -0,0 +1,137 @@
+import time
+from collections import OrderedDict
+from pathlib import Path
+import typing
+if typing.TYPE_CHECKING:
+    from pycadsx.pycadsx import PyCadSx
+from pycadsx.checkpoint import Checkpoint
+from pycadsx.model import Model
+
+
+class ModelPool:
+    def __init__(self, cad: 'PyCadSx', size: int = 8, read_only: bool = False) -> None:
+        self.cad                             = cad
+        self.size                            = size
+        self.read_only                       = read_only
+        self.models: OrderedDict[str, Model] = OrderedDict()
+        self.groups: dict[str, set[str]]     = {}
+        self.hits                            = 0
+        self.opens                           = 0
+
+    def key(self, path: Path):
+        return str( Path(path).resolve() ).lower()
+
+    def model_key(self, model: Model):
+        return self.key( Path(model.path) / f'{model.name}.icd' )
+
+    def find(self, key: str) -> Model | None:
+        model = self.models.get(key)
+        if model is not None and model.id in self.cad.model:
+            return model
+        self.models.pop(key, None)
+        # 他のファイルの参照先として既に開いているモデル
+        for model in self.cad.model.values():
+            if self.model_key(model) == key:
+                self.models[key] = model
+                return model
+        return None
+
+    def get(self, path: Path) -> Model:
+        self.cad.refresh_models()
+        key = self.key(path)
+        model = self.find(key)
+        if model is not None:
+            self.hits += 1
+            self.models.move_to_end(key)
+            self.cad.model_set_active(model)
+            return model
+
+        # 一緒に読み込まれたモデル (参照しているサブアセンブリ) も開いたままプールに入れておき、
+        # 後で同じファイルが来た時や、他のファイルから参照された時に読み直さないようにする
+        before = set(self.cad.model)
+        model = self.cad.open_model(Path(path), self.read_only, reuse_models=True)
+        self.opens += 1
+        group: set[str] = set()
+        for other in self.cad.model.values():
+            if other.id in before or other is model:
+                continue
+            other_key = self.model_key(other)
+            group.add(other_key)
+            self.models[other_key] = other
+            self.models.move_to_end(other_key)
+        self.models[key] = model
+        self.models.move_to_end(key)
+        self.groups[key] = group
+        self.shrink(key)
+        return model
+
+    def shrink(self, keep: str):
+        # 参照元がプールに残っているモデルは閉じない
+        keep = { keep } | self.groups.get(keep, set())
+        while len(self.models) > self.size:
+            pinned = set().union( *[ group for key, group in self.groups.items() if key in self.models ] )
+            victims = [ key for key in self.models if key not in keep and key not in pinned ]
+            if not victims:
+                return
+            self.evict(victims[0])
+
+    def evict(self, key: str):
+        model = self.models.pop(key, None)
+        self.groups.pop(key, None)
+        if model is None or model.id not in self.cad.model:
+            return
+        self.cad.model_set_active(model)
+        model.close()
+        del self.cad.model[model.id]
+
+    def close_all(self):
+        # 参照元から先に閉じる
+        while self.models:
+            pinned = set().union( *[ group for key, group in self.groups.items() if key in self.models ] )
+            victims = [ key for key in self.models if key not in pinned ]
+            self.evict( victims[0] if victims else next( iter(self.models) ) )
+
+
+class BatchRunner:
+
+    Result = Checkpoint.Result
+
+    def __init__(
+                self, cad: 'PyCadSx', callback: typing.Callable[[Model, Path], typing.Any], pattern: str = '*.icd',
+                pool_size: int = 8, checkpoint_path: Path = None, save: bool = False, read_only: bool = False
+            ) -> None:
+        self.cad                                 = cad
+        self.callback                            = callback
+        self.pattern                             = pattern
+        self.save                                = save and not read_only
+        self.pool                                = ModelPool(cad, pool_size, read_only)
+        self.checkpoint                          = Checkpoint(checkpoint_path)
+        self.results: list['BatchRunner.Result'] = []
+
+    def files(self, roots: list[Path]):
+        files: list[Path] = []
+        for root in roots:
+            root = Path(root)
+            files.extend( [ root ] if root.is_file() else sorted( root.rglob(self.pattern) ) )
+        return files
+
+    def run(self, roots: list[Path] | Path, on_done: typing.Callable[['BatchRunner.Result'], None] = None):
+        if not isinstance(roots, list):
+            roots = [ roots ]
+        try:
+            self.results = self.checkpoint.run(self.files(roots), str, self.process, on_done)
+        finally:
+            self.pool.close_all()
+        return self.results
+
+    def process(self, path: Path, timings: dict[str, float]):
+        start = time.perf_counter()
+        model = self.pool.get(path)
+        timings['open'] = time.perf_counter() - start
+        value = self.callback(model, path)
+        if self.save:
+            model.save()
+        return value
+
+    def failures(self):
+        return [ result for result in self.results if result.status != 'ok' ]
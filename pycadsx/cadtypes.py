@@ -327,145 +327,156 @@ class CadTypes:
             Element     = 2
             NonManifold = 3
 
-        def get_type(self, _type: int):
-            if _type in CadTypes.Entity.Type._value2member_map_:
-                return CadTypes.Entity.Type(_type)
-            return _type
-
-        def body_types(self):
-            return [
-                CadTypes.Entity.Type.BOX,
-                CadTypes.Entity.Type.CAP,
-                CadTypes.Entity.Type.CONE,
-                CadTypes.Entity.Type.CYL,
-                CadTypes.Entity.Type.EPRJ,
-                CadTypes.Entity.Type.FCSOLID,
-                CadTypes.Entity.Type.LPRJ,
-                CadTypes.Entity.Type.PCON,
-                CadTypes.Entity.Type.PCYL,
-                CadTypes.Entity.Type.PRJT,
-                CadTypes.Entity.Type.PRSM,
-                CadTypes.Entity.Type.ROT,
-                CadTypes.Entity.Type.SOLID,
-                CadTypes.Entity.Type.SPHR,
-                CadTypes.Entity.Type.TORUS
-            ]
-
-        def dimension_types(self):
-            return [
-                CadTypes.Entity.Type.APL,       # 角／長円／角穴／座標寸法線
-                CadTypes.Entity.Type.ARL,       # 円弧長寸法線
-                CadTypes.Entity.Type.BALL,      # 風船
-                CadTypes.Entity.Type.DANG,      # 角度寸法線
-                CadTypes.Entity.Type.DARC,      # 径寸法線
-                CadTypes.Entity.Type.DCHA,      # 面取り寸法線
-                CadTypes.Entity.Type.DELTA,     # デルタ
-                CadTypes.Entity.Type.DLIN,      # 長さ寸法線
-                CadTypes.Entity.Type.FMRK,      # 仕上記号
-                CadTypes.Entity.Type.GTOL,      # 幾何公差
-                CadTypes.Entity.Type.LBL,       # 注記
-                CadTypes.Entity.Type.LEAD,      # 矢印
-                CadTypes.Entity.Type.MARK,      # 記号
-                CadTypes.Entity.Type.MKUP,      # マークアップ
-                CadTypes.Entity.Type.MKUP_DANG, # マークアップ（角度寸法）
-                CadTypes.Entity.Type.MKUP_DARC, # マークアップ（径寸法）
-                CadTypes.Entity.Type.MKUP_DLIN, # マークアップ（長さ寸法）
-                CadTypes.Entity.Type.MKUP_LBL,  # マークアップ（注記）
-                CadTypes.Entity.Type.OTHER_DIM, # その他寸法線
-                CadTypes.Entity.Type.SMRK,      # 表面粗さ
-                CadTypes.Entity.Type.SYM        # シンボル／矢視／切断線`
-            ]
-
-        def geometry_include_types(self):
-            return [
-                CadTypes.Entity.Type.POINT,
-                CadTypes.Entity.Type.LINE,
-                CadTypes.Entity.Type.ARC,
-                CadTypes.Entity.Type.CIR,
-                CadTypes.Entity.Type.SYM,
-                CadTypes.Entity.Type.APL,
-                CadTypes.Entity.Type.SPL,
-                CadTypes.Entity.Type.TEXT,
-                CadTypes.Entity.Type.LBL,
-                CadTypes.Entity.Type.ARL,
-                CadTypes.Entity.Type.DLIN,
-                CadTypes.Entity.Type.DANG,
-                CadTypes.Entity.Type.DARC,
-                CadTypes.Entity.Type.FMRK,
-                CadTypes.Entity.Type.DCHA,
-                CadTypes.Entity.Type.BALL,
-                CadTypes.Entity.Type.DELTA,
-                CadTypes.Entity.Type.OTHER_DIM,
-                CadTypes.Entity.Type.WELD,
-                CadTypes.Entity.Type.LEAD,
-                CadTypes.Entity.Type.GTOL,
-                CadTypes.Entity.Type.SMRK,
-                CadTypes.Entity.Type.ELP,
-                CadTypes.Entity.Type.ELPA,
-                CadTypes.Entity.Type.MARK,
-                CadTypes.Entity.Type.HATCH,
-                CadTypes.Entity.Type.HATCH_EX,
-                CadTypes.Entity.Type.MKUP_LBL
-            ]
+        @staticmethod
+        def get_type(_type: int):
+            return CadTypes.Entity.Type._value2member_map_.get(_type, _type)
+
+        BODY_TYPES = frozenset([
+            Type.BOX,
+            Type.CAP,
+            Type.CONE,
+            Type.CYL,
+            Type.EPRJ,
+            Type.FCSOLID,
+            Type.LPRJ,
+            Type.PCON,
+            Type.PCYL,
+            Type.PRJT,
+            Type.PRSM,
+            Type.ROT,
+            Type.SOLID,
+            Type.SPHR,
+            Type.TORUS
+        ])
+
+        @staticmethod
+        def body_types():
+            return CadTypes.Entity.BODY_TYPES
+
+        DIMENSION_TYPES = frozenset([
+            Type.APL,       # 角／長円／角穴／座標寸法線
+            Type.ARL,       # 円弧長寸法線
+            Type.BALL,      # 風船
+            Type.DANG,      # 角度寸法線
+            Type.DARC,      # 径寸法線
+            Type.DCHA,      # 面取り寸法線
+            Type.DELTA,     # デルタ
+            Type.DLIN,      # 長さ寸法線
+            Type.FMRK,      # 仕上記号
+            Type.GTOL,      # 幾何公差
+            Type.LBL,       # 注記
+            Type.LEAD,      # 矢印
+            Type.MARK,      # 記号
+            Type.MKUP,      # マークアップ
+            Type.MKUP_DANG, # マークアップ（角度寸法）
+            Type.MKUP_DARC, # マークアップ（径寸法）
+            Type.MKUP_DLIN, # マークアップ（長さ寸法）
+            Type.MKUP_LBL,  # マークアップ（注記）
+            Type.OTHER_DIM, # その他寸法線
+            Type.SMRK,      # 表面粗さ
+            Type.SYM        # シンボル／矢視／切断線`
+        ])
+
+        @staticmethod
+        def dimension_types():
+            return CadTypes.Entity.DIMENSION_TYPES
+
+        GEOMETRY_INCLUDE_TYPES = frozenset([
+            Type.POINT,
+            Type.LINE,
+            Type.ARC,
+            Type.CIR,
+            Type.SYM,
+            Type.APL,
+            Type.SPL,
+            Type.TEXT,
+            Type.LBL,
+            Type.ARL,
+            Type.DLIN,
+            Type.DANG,
+            Type.DARC,
+            Type.FMRK,
+            Type.DCHA,
+            Type.BALL,
+            Type.DELTA,
+            Type.OTHER_DIM,
+            Type.WELD,
+            Type.LEAD,
+            Type.GTOL,
+            Type.SMRK,
+            Type.ELP,
+            Type.ELPA,
+            Type.MARK,
+            Type.HATCH,
+            Type.HATCH_EX,
+            Type.MKUP_LBL
+        ])
+
+        @staticmethod
+        def geometry_include_types():
+            return CadTypes.Entity.GEOMETRY_INCLUDE_TYPES
         
-        def entity_types(self):
-            return [
-                CadTypes.Entity.Type.POINT      ,  # 点
-                CadTypes.Entity.Type.LINE       ,  # 線
-                CadTypes.Entity.Type.ARC        ,  # 円弧
-                CadTypes.Entity.Type.CIR        ,  # 円
-                CadTypes.Entity.Type.FIL        ,  # 
-                CadTypes.Entity.Type.OLD_ELP    ,  # 
-                CadTypes.Entity.Type.OLD_ELPA   ,  # 
-                CadTypes.Entity.Type.CURV       ,  # 
-                CadTypes.Entity.Type.OTHER_DRAW ,  # その他作図要素
-                CadTypes.Entity.Type.RECT       ,  # 
-                CadTypes.Entity.Type.SYM        ,  # シンボル／矢視／切断線
-                CadTypes.Entity.Type.APL        ,  # 角／長円／角穴／座標寸法線
-                CadTypes.Entity.Type.SPL        ,  # スプライン
-                CadTypes.Entity.Type.TEXT       ,  # 文字列
-                CadTypes.Entity.Type.LBL        ,  # 注記
-                CadTypes.Entity.Type.CENL       ,  # 中心線
-                CadTypes.Entity.Type.ARL        ,  # 円弧長寸法線
-                CadTypes.Entity.Type.DLIN       ,  # 長さ寸法線
-                CadTypes.Entity.Type.DANG       ,  # 角度寸法線
-                CadTypes.Entity.Type.DARC       ,  # 径寸法線
-                CadTypes.Entity.Type.FMRK       ,  # 仕上記号
-                CadTypes.Entity.Type.DCHA       ,  # 面取り寸法線
-                CadTypes.Entity.Type.BALL       ,  # 風船
-                CadTypes.Entity.Type.DELTA      ,  # デルタ
-                CadTypes.Entity.Type.OTHER_DIM  ,  # その他寸法線
-                CadTypes.Entity.Type.WELD       ,  # 溶接記号
-                CadTypes.Entity.Type.LEAD       ,  # 矢印
-                CadTypes.Entity.Type.GTOL       ,  # 幾何公差
-                CadTypes.Entity.Type.SMRK       ,  # 表面粗さ
-                CadTypes.Entity.Type.PCON       ,  # 正多角錐／正多角錐台
-                CadTypes.Entity.Type.PRSM       ,  # 多角錐／多角錐台
-                CadTypes.Entity.Type.LPRJ       ,  # 偏心投影体
-                CadTypes.Entity.Type.EPRJ       ,  # 拡張投影体
-                CadTypes.Entity.Type.ROT        ,  # 回転体
-                CadTypes.Entity.Type.CONE       ,  # 円錐／円錐台
-                CadTypes.Entity.Type.PCYL       ,  # 正多角柱
-                CadTypes.Entity.Type.CYL        ,  # 円柱
-                CadTypes.Entity.Type.SPHR       ,  # 球／部分球
-                CadTypes.Entity.Type.CAP        ,  # キャップ
-                CadTypes.Entity.Type.TORUS      ,  # トーラス
-                CadTypes.Entity.Type.BOX        ,  # 直方体
-                CadTypes.Entity.Type.PRJT       ,  # 投影体
-                CadTypes.Entity.Type.SOLID      ,  # ソリッド
-                CadTypes.Entity.Type.FCSOLID    ,  # F.C.ソリッド
-                CadTypes.Entity.Type.ELP        ,  # 楕円
-                CadTypes.Entity.Type.ELPA       ,  # 楕円弧
-                CadTypes.Entity.Type.MARK       ,  # 記号
-                CadTypes.Entity.Type.HATCH      ,  # ハッチング
-                CadTypes.Entity.Type.HATCH_EX   ,  # 拡張ハッチング
-                CadTypes.Entity.Type.DXLN       ,  # 
-                CadTypes.Entity.Type.MKUP       , # マークアップ
-                CadTypes.Entity.Type.MKUP_DLIN  , # マークアップ（長さ寸法）
-                CadTypes.Entity.Type.MKUP_DARC  , # マークアップ（径寸法）
-                CadTypes.Entity.Type.MKUP_DANG  , # マークアップ（角度寸法）
-                CadTypes.Entity.Type.MKUP_LBL     # マークアップ（注記）
-            ]
+        ENTITY_TYPES = frozenset([
+            Type.POINT      ,  # 点
+            Type.LINE       ,  # 線
+            Type.ARC        ,  # 円弧
+            Type.CIR        ,  # 円
+            Type.FIL        ,  # 
+            Type.OLD_ELP    ,  # 
+            Type.OLD_ELPA   ,  # 
+            Type.CURV       ,  # 
+            Type.OTHER_DRAW ,  # その他作図要素
+            Type.RECT       ,  # 
+            Type.SYM        ,  # シンボル／矢視／切断線
+            Type.APL        ,  # 角／長円／角穴／座標寸法線
+            Type.SPL        ,  # スプライン
+            Type.TEXT       ,  # 文字列
+            Type.LBL        ,  # 注記
+            Type.CENL       ,  # 中心線
+            Type.ARL        ,  # 円弧長寸法線
+            Type.DLIN       ,  # 長さ寸法線
+            Type.DANG       ,  # 角度寸法線
+            Type.DARC       ,  # 径寸法線
+            Type.FMRK       ,  # 仕上記号
+            Type.DCHA       ,  # 面取り寸法線
+            Type.BALL       ,  # 風船
+            Type.DELTA      ,  # デルタ
+            Type.OTHER_DIM  ,  # その他寸法線
+            Type.WELD       ,  # 溶接記号
+            Type.LEAD       ,  # 矢印
+            Type.GTOL       ,  # 幾何公差
+            Type.SMRK       ,  # 表面粗さ
+            Type.PCON       ,  # 正多角錐／正多角錐台
+            Type.PRSM       ,  # 多角錐／多角錐台
+            Type.LPRJ       ,  # 偏心投影体
+            Type.EPRJ       ,  # 拡張投影体
+            Type.ROT        ,  # 回転体
+            Type.CONE       ,  # 円錐／円錐台
+            Type.PCYL       ,  # 正多角柱
+            Type.CYL        ,  # 円柱
+            Type.SPHR       ,  # 球／部分球
+            Type.CAP        ,  # キャップ
+            Type.TORUS      ,  # トーラス
+            Type.BOX        ,  # 直方体
+            Type.PRJT       ,  # 投影体
+            Type.SOLID      ,  # ソリッド
+            Type.FCSOLID    ,  # F.C.ソリッド
+            Type.ELP        ,  # 楕円
+            Type.ELPA       ,  # 楕円弧
+            Type.MARK       ,  # 記号
+            Type.HATCH      ,  # ハッチング
+            Type.HATCH_EX   ,  # 拡張ハッチング
+            Type.DXLN       ,  # 
+            Type.MKUP       , # マークアップ
+            Type.MKUP_DLIN  , # マークアップ（長さ寸法）
+            Type.MKUP_DARC  , # マークアップ（径寸法）
+            Type.MKUP_DANG  , # マークアップ（角度寸法）
+            Type.MKUP_LBL     # マークアップ（注記）
+        ])
+
+        @staticmethod
+        def entity_types():
+            return CadTypes.Entity.ENTITY_TYPES
 
     class Geometry:
         class Type(MyIntEnum):
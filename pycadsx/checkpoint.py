@@ -0,0 +1,91 @@
+import json
+import os
+import time
+import traceback
+from pathlib import Path
+import typing
+
+
+class Checkpoint:
+
+    class Result:
+        def __init__(self, key: str, status: str = 'ok', value=None, timings: dict[str, float] = None, error: str = '') -> None:
+            self.key                       = key
+            self.status                    = status
+            self.value                     = value
+            self.timings: dict[str, float] = timings if timings is not None else {}
+            self.error                     = error
+
+        def __repr__(self):
+            return f'Checkpoint.Result({self.key}, {self.status}, {self.seconds:.3f}s)'
+
+        @property
+        def seconds(self) -> float:
+            return self.timings.get('total', 0.0)
+
+        def to_dict(self):
+            return {
+                'status'  : self.status,
+                'value'   : None if self.value is None else str(self.value),
+                'timings' : self.timings,
+                'error'   : self.error
+            }
+
+    def __init__(self, path: Path = None) -> None:
+        self.path                     = Path(path) if path is not None else None
+        self.results: dict[str, dict] = {}
+        self.load()
+
+    def load(self):
+        if self.path is None or not self.path.is_file():
+            return self.results
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self.results = json.load(f).get('results', {})
+        return self.results
+
+    def save(self):
+        if self.path is None:
+            return
+        # 途中で CAD が落ちても壊れたファイルを残さないよう一時ファイルから置き換える
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({ 'results' : self.results }, f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, self.path)
+
+    def is_done(self, key: str):
+        result = self.results.get(key)
+        return result is not None and result.get('status') == 'ok'
+
+    def record(self, key: str, result: dict):
+        self.results[key] = result
+        self.save()
+
+    def clear(self):
+        self.results = {}
+        self.save()
+
+    def run(
+                self, items: list, key: typing.Callable[[typing.Any], str], function: typing.Callable[[typing.Any, dict[str, float]], typing.Any],
+                on_done: typing.Callable[['Checkpoint.Result'], None] = None
+            ) -> list['Checkpoint.Result']:
+        # 済んでいる項目は飛ばし、1件毎に結果と所要時間を記録する (失敗しても次の項目に進む)
+        results: list[Checkpoint.Result] = []
+        for item in items:
+            item_key = key(item)
+            if self.is_done(item_key):
+                continue
+
+            timings: dict[str, float] = {}
+            start = time.perf_counter()
+            try:
+                result = Checkpoint.Result(item_key, 'ok', function(item, timings), timings)
+            except Exception as e:
+                result = Checkpoint.Result(item_key, 'error', None, timings, f'{e}\n{traceback.format_exc()}')
+            timings['total'] = time.perf_counter() - start
+
+            self.record(item_key, result.to_dict())
+            results.append(result)
+            if on_done is not None:
+                on_done(result)
+        return results
@@ -1,4 +1,5 @@
 import base64
+from array import array
 import traceback
 import sys
 import socket
@@ -8,23 +9,29 @@ import os
 import csv
 import io
 import math
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from lxml import etree
 from pycadsx.cadtypes import CadTypes
+from pycadsx.decoder import Decoder, flag, raw, enum, xyz
 from pycadsx.edge import Edge
 from pycadsx.face import Face
 from pycadsx.model import Model
 from pycadsx.entity import Entity, EntityFactory
+from pycadsx.entity_table import EntityTable
 from pycadsx.geometry import (
-    GeometryFactory, Text, Note, Datum, ArrowView, CutLine,
+    GeometryFactory, Text, Note, Datum, ArrowView, CutLine, Plane, Cylinder, Cone, Sphere, Torus,
     DimensionValue, DimensionLine, BaseDimensionGeometry, BaseGeometry, LineAttribute
 )
+from pycadsx.geometry_batch import GeometryBatch
 from pycadsx.material import Material
 from pycadsx.part import Part
 from pycadsx.plotter import Plotter
 from pycadsx.window import Window
+from pycadsx.window_registry import WindowRegistry
 from pycadsx.vs import VS
 from pycadsx.mass import Mass
+from pycadsx.mass_cache import MassCache
 from pycadsx.print_info import PrintInfo
 from pycadsx.wf import WF
 from pycadsx.draft_attribute import DraftAttribute
@@ -32,6 +39,10 @@ from pycadsx.options import SurfaceMarkOption, Project3d2dOption
 from pycadsx.selection import Selection
 from pycadsx.hole import Hole
 from pycadsx.r_part import RPart
+from pycadsx.extra_info import ExtraInfoCache
+from pycadsx.loader import BatchLoader
+from pycadsx.placement import LabelPlacer
+from pycadsx.config import CadConfig
 from pycadsx.pycadsx import PyCadSx
 
 
@@ -52,11 +63,11 @@ class AsmPlaneCommand(BaseCommand):
 
     class Info:
         def __init__(self, element: etree._Element) -> None:
-            sx_vs = element.xpath('./sx_vs')[0]
-            sx_wf = element.xpath('./sx_wf')[0]
-            sx_pos = element.xpath('./sx_pos')[0]
+            sx_vs = element.findall('sx_vs')[0]
+            sx_wf = element.findall('sx_wf')[0]
+            sx_pos = element.findall('sx_pos')[0]
             matrix = []
-            for sx_vec in element.xpath('./sx_vec'):
+            for sx_vec in element.findall('sx_vec'):
                 matrix.append([ float(sx_vec.get(i)) for i in ['x', 'y', 'z'] ])
 
             matrix.append([
@@ -109,20 +120,61 @@ class EdgeCommand(BaseCommand):
 
     def get_geometry(self, id: int, prmno: int, edgeno: int, csgsol: int):
         element = self.send(f';JVGEOM .ENTID {id} .PRMNO {prmno} .EDGENO {edgeno} .CSGSOL {csgsol} : ;@JVEND', 'edge.get_geometry.xml')
+        for child in element:
+            return GeometryFactory.create(child)
 
     def get_geometries(self, ids: list[int], prmnos: list[int], edgenos: list[int], csgsols: list[int]):
         element = self.send(';JVGEO2\n' + '\n'.join([f'.ENTID {id} .PRMNO {prmno} .EDGENO {edgeno} .CSGSOL {csgsol} :' for id, prmno, edgeno, csgsol in zip(ids, prmnos, edgenos, csgsols)]) + '\n;@GO;@JVEND', 'edge.get_geometries.xml')
+        return [ GeometryFactory.create(child) for child in element ]
 
     def get_end_points(self, id: int, prmno: int, edgeno: int, csgsol: int):
         element = self.send(f';JVUENT .KIND 5 .ENTID {id} .PRMNO {prmno} .DSPID {csgsol} .EDGENO {edgeno} : ;@JVEND', 'edge.get_end_points.xml')
         points = []
-        for sx_pos in element.xpath('./sx_pos'):
+        for sx_pos in element.findall('sx_pos'):
             points.append([float( sx_pos.get('x') ), float( sx_pos.get('y') ), float( sx_pos.get('z') )])
         return points
+
+    def get_end_points_list(self, edges: list[Edge]):
+        if len(edges) == 0:
+            return []
+        element = self.send(';JVUEN2\n' + '\n'.join([f'.KIND 5 .ENTID {e.id} .PRMNO {e.prmno} .DSPID {e.csgsol} .EDGENO {e.edgeno} :' for e in edges]) + '\n;@GO;@JVEND', 'edge.get_end_points_list.xml')
+        points = [ [ float( sx_pos.get('x') ), float( sx_pos.get('y') ), float( sx_pos.get('z') ) ] for sx_pos in element.findall('sx_pos') ]
+        if len(points) != 2 * len(edges):
+            # 端点が2つでない辺があると以降の対応がずれるので1本ずつ取り直す
+            return [ self.get_end_points(e.id, e.prmno, e.edgeno, e.csgsol) for e in edges ]
+        return [ points[i : i + 2] for i in range(0, len(points), 2) ]
     
+    def get_edges_faces(self, edges: list[Edge]):
+        # KIND 3 の後に KIND 8 (中点) を挟み、sx_pos を区切りにして辺ごとの面を取り出す
+        if len(edges) == 0:
+            return [], []
+        command  = ';JVUEN2\n'
+        command += '\n'.join([
+            f'.KIND 3 .ENTID {e.id} .PRMNO {e.prmno} .DSPID {e.csgsol} .EDGENO {e.edgeno} :\n'
+            f'.KIND 8 .ENTID {e.id} .PRMNO {e.prmno} .DSPID {e.csgsol} .EDGENO {e.edgeno} :'
+            for e in edges
+        ])
+        command += '\n;@GO;@JVEND'
+        element = self.send(command, 'edge.get_edges_faces.xml')
+        faces_list, middle_points, faces = [], [], []
+        for child in element:
+            if child.tag == 'sx_face':
+                face = Face(self.client)
+                face.from_face( FaceCommand.Data(child) )
+                faces.append(face)
+            elif child.tag == 'sx_pos':
+                faces_list.append(faces)
+                middle_points.append([ float( child.get('x') ), float( child.get('y') ), float( child.get('z') ) ])
+                faces = []
+        if len(middle_points) != len(edges) or len(faces) > 0:
+            # 中点が返らない辺があると以降の辺の面と中点がずれるので1本ずつ取り直す
+            faces_list    = [ self.get_face_list(e.id, e.prmno, e.edgeno, e.csgsol) for e in edges ]
+            middle_points = [ self.get_middle_point(e.id, e.prmno, e.edgeno, e.csgsol) or [ math.nan ] * 3 for e in edges ]
+        return faces_list, middle_points
+
     def get_middle_point(self, id: int, prmno: int, edgeno: int, csgsol: int):
         element = self.send(f';JVUENT .KIND 8 .ENTID {id} .PRMNO {prmno} .DSPID {csgsol} .EDGENO {edgeno} : ;@JVEND', 'edge.get_middle_point.xml')
-        for sx_pos in element.xpath('./sx_pos'):
+        for sx_pos in element.findall('sx_pos'):
             return [float( sx_pos.get('x') ), float( sx_pos.get('y') ), float( sx_pos.get('z') )]
 
     def get_on_point(self, id: int, prmno: int, edgeno: int, csgsol: int, point: list[float], read: bool):
@@ -130,72 +182,141 @@ class EdgeCommand(BaseCommand):
         command += f'.ENTID {id} .PRMNO {prmno} .EDGENO {edgeno} .CSGSOL {csgsol}\n'
         command += f'.PX {point[0]:.8} .PY {point[1]:.8} .PZ {point[2]:.8} :\n;@JVEND'
         element = self.send(command, 'edge.get_on_point.xml')
-        for sx_pos in element.xpath('./sx_pos'):
+        for sx_pos in element.findall('sx_pos'):
             return [float( sx_pos.get('x') ), float( sx_pos.get('y') ), float( sx_pos.get('z') )]
         
+    def get_end_points_array(self, edges: list[Edge], chunk_size: int = 1000):
+        starts, ends = array('d'), array('d')
+        for i in range(0, len(edges), chunk_size):
+            chunk = edges[i : i + chunk_size]
+            for points in self.get_end_points_list(chunk):
+                starts.extend( points[0] if points else [ math.nan ] * 3 )
+                ends.extend( points[-1] if points else [ math.nan ] * 3 )
+        return starts, ends
+
+    def get_middle_points_array(self, edges: list[Edge], chunk_size: int = 1000):
+        points = array('d')
+        for i in range(0, len(edges), chunk_size):
+            chunk = edges[i : i + chunk_size]
+            element = self.send(';JVUEN2\n' + '\n'.join([f'.KIND 8 .ENTID {e.id} .PRMNO {e.prmno} .DSPID {e.csgsol} .EDGENO {e.edgeno} :' for e in chunk]) + '\n;@GO;@JVEND', 'edge.get_middle_points_array.xml')
+            sx_pos_list = element.findall('sx_pos')
+            if len(sx_pos_list) != len(chunk):
+                # 応答の無い辺があると以降の対応がずれるので1本ずつ取り直す
+                for e in chunk:
+                    point = self.get_middle_point(e.id, e.prmno, e.edgeno, e.csgsol)
+                    points.extend( point if point is not None else [ math.nan ] * 3 )
+                continue
+            for sx_pos in sx_pos_list:
+                points.extend([ float( sx_pos.get('x') ), float( sx_pos.get('y') ), float( sx_pos.get('z') ) ])
+        return points
+
+    def get_on_points_array(self, edges: list[Edge], points: list[list[float]], read: bool, chunk_size: int = 1000):
+        results = array('d')
+        for i in range(0, len(edges), chunk_size):
+            chunk = list( zip(edges[i : i + chunk_size], points[i : i + chunk_size]) )
+            command  = '\n'.join([
+                f';JVVEC .KIND {0 if read else 1}\n.ENTID {e.id} .PRMNO {e.prmno} .EDGENO {e.edgeno} .CSGSOL {e.csgsol}\n.PX {p[0]:.8f} .PY {p[1]:.8f} .PZ {p[2]:.8f} :'
+                for e, p in chunk
+            ])
+            command += '\n;@JVEND'
+            element = self.send(command, 'edge.get_on_points_array.xml')
+            sx_pos_list = element.findall('sx_pos')
+            if len(sx_pos_list) != len(chunk):
+                # 応答の無い辺があると以降の対応がずれるので1本ずつ取り直す
+                for e, p in chunk:
+                    point = self.get_on_point(e.id, e.prmno, e.edgeno, e.csgsol, p, read)
+                    results.extend( point if point is not None else [ math.nan ] * 3 )
+                continue
+            for sx_pos in sx_pos_list:
+                results.extend([ float( sx_pos.get('x') ), float( sx_pos.get('y') ), float( sx_pos.get('z') ) ])
+        return results
+
     def get_mass(self, id: int, prmno: int, edgeno: int, csgsol: int):
         element = self.send(f';JVUENT .KIND 7 .ENTID {id} .PRMNO {prmno} .DSPID {csgsol} .EDGENO {edgeno} : ;@JVEND', 'edge.get_mass.xml')
+        for sx_inf_mass in element.findall('sx_inf_mass'):
+            return Mass(sx_inf_mass)
 
     def get_mass_list(self, ids: list[int], prmnos: list[int], edgenos: list[int], csgsols: list[int]):
         element = self.send(';JVUEN2\n' + '\n'.join([f'.KIND 7 .ENTID {id} .PRMNO {prmno} .DSPID {csgsol} .EDGENO {edgeno} :' for id, prmno, edgeno, csgsol in zip(ids, prmnos, edgenos, csgsols)]) + '\n;@GO;@JVEND', 'edge.get_mass_list.xml')
+        return [ Mass(sx_inf_mass) for sx_inf_mass in element.findall('sx_inf_mass') ]
 
     def eval(self, id: int, prmno: int, edgeno: int, csgsol: int, point: list[float]):
         element = self.send(f';JVVEC .KIND 1 .ENTID {id} .PRMNO {prmno} .EDGENO {edgeno} .CSGSOL {csgsol} .PX {point[0]:.8} .PY {point[1]:.8} .PZ {point[2]:.8} :\n;@JVEND', 'edge.eval.xml')
 
     def get_face_list(self, id: int, prmno: int, edgeno: int, csgsol: int):
         element = self.send(f';GXDMY;JVUENT .KIND 3 .ENTID {id} .PRMNO {prmno} .DSPID {csgsol} .EDGENO {edgeno} : ;@JVEND', 'edge.get_face_list.xml')
+        faces = []
+        for sx_face in element.findall('sx_face'):
+            face = Face(self.client)
+            face.from_face( FaceCommand.Data(sx_face) )
+            faces.append(face)
+        return faces
 
     def get_face_list_from_edges(self, ids: list[int], prmnos: list[int], edgenos: list[int], csgsols: list[int]):
         element = self.send(';JVUEN2\n' + '\n'.join([f'.KIND 3 .ENTID {id} .PRMNO {prmno} .DSPID {csgsol} .EDGENO {edgeno} :' for id, prmno, edgeno, csgsol in zip(ids, prmnos, edgenos, csgsols)]) + '\n;@GO;@JVEND', 'edge.get_face_list_from_edges.xml')
+        faces = []
+        for sx_face in element.findall('sx_face'):
+            face = Face(self.client)
+            face.from_face( FaceCommand.Data(sx_face) )
+            faces.append(face)
+        return faces
 
 
 class EntityCommand(BaseCommand):
 
     class Data:
+        decoder = Decoder([
+            ('type'   , 'type'   , enum(CadTypes.Entity.Type)),
+            ('id'     , 'id'     , int),
+            ('prmno'  , 'prmno'  , int),
+            ('kind'   , 'kind'   , enum(CadTypes.Entity.Kind)),
+            ('part_id', 'part_id', int),
+            ('is3d'   , 'dim'    , flag),
+        ])
+
         def __init__(self, element: etree._Element) -> None:
-            self.type    = CadTypes.Entity().get_type( int( element.get('type') ) )
-            self.id      = int( element.get('id') )
-            self.prmno   = int( element.get('prmno') )
-            self.kind    = CadTypes.Entity.Kind( int( element.get('kind') ) )
-            self.part_id = int( element.get('part_id') )
-            self.is3d    = element.get('dim') != '0'
+            EntityCommand.Data.decoder.decode(element, self)
 
     class Info:
+        decoder = Decoder([
+            ('userid'        , 'userid'        , int),
+            ('is3d'          , 'dim'           , flag),
+            ('vswfno'        , 'vswfno'        , int),
+            ('layer'         , 'layer'         , int),
+            ('type'          , 'type'          , enum(CadTypes.Entity.Type)),
+            ('visi'          , 'visi'          , flag),
+            ('is_25d'        , 'is_25d'        , flag),
+            ('member_kind'   , 'member_kind'   , int),
+            ('prim_num'      , 'prim_num'      , int),
+            ('ent_len'       , 'ent_len'       , int),
+            ('model_id'      , 'model_id'      , int),
+            ('grp_kind'      , 'grp_kind'      , int),
+            ('cg_attr'       , 'cg_attr'       , int),
+            ('profile_attr'  , 'profile_attr'  , int),
+            ('part_id'       , 'parts_id'      , int),
+            ('arrow_id'      , 'arrow_id'      , int),
+            ('body_type'     , 'body_type'     , enum(CadTypes.Entity.BodyType)),
+            ('id'            , 'id'            , int),
+            ('vwtype'        , 'vwtype'        , int),
+            ('fc_state'      , 'fc_state'      , enum(CadTypes.Entity.FcState)),
+            ('is_transparent', 'is_transparent', flag),
+            ('is_draft'      , 'is_draft'      , flag),
+        ])
+
+        # kind 属性 → Kind (2 はグループ種別で分ける)
+        kinds = { 0 : 0, 4 : 0, 5 : 0, 3 : 3, 6 : 6 }
+
         def __init__(self, element: etree._Element) -> None:
-            self.userid         = int(element.get('userid'))
-            self.is3d           = element.get('dim') != '0'
-            self.vswfno         = int(element.get('vswfno'))
-            self.layer          = int(element.get('layer'))
-            self.type           = CadTypes.Entity().get_type( int(element.get('type')) )
-            self.visi           = element.get('visi') != '0'
-            self.is_25d         = element.get('is_25d') != '0'
-            self.member_kind    = int(element.get('member_kind'))
-            self.prim_num       = int(element.get('prim_num'))
-            self.ent_len        = int(element.get('ent_len'))
-            self.model_id       = int(element.get('model_id'))
-            self.grp_kind       = int(element.get('grp_kind'))
-            self.cg_attr        = int(element.get('cg_attr'))
-            self.profile_attr   = int(element.get('profile_attr'))
-            self.part_id        = int(element.get('parts_id'))
-            self.arrow_id       = int(element.get('arrow_id'))
-            self.body_type      = CadTypes.Entity.BodyType( int(element.get('body_type')) )
-            self.id             = int(element.get('id'))
-            self.vwtype         = int(element.get('vwtype'))
-            self.fc_state       = CadTypes.Entity.FcState( int(element.get('fc_state')) )
-            self.is_transparent = element.get('is_transparent') != '0'
-            self.is_draft       = element.get('is_draft') != '0'
+            EntityCommand.Info.decoder.decode(element, self)
 
             num3 = int(element.get('kind'))
-            if num3 in [0, 4, 5]:
-                num3 = 0
-            elif num3 == 2:
+            if num3 == 2:
                 num3 = 1 if self.grp_kind != 0 else 2
-            elif num3 == 3:
-                num3 = 3
-            elif num3 == 6:
-                num3 = 6
+            else:
+                num3 = EntityCommand.Info.kinds.get(num3, num3)
             
-            self.kind = CadTypes.Entity.Kind(num3)
+            # 未知の種別は int のまま (decoder の enum() と同じ)
+            self.kind = CadTypes.Entity.Kind.get_value(num3)
         
     def entity_data(self, element: etree._Element):
         return EntityCommand.Data(element)
@@ -206,7 +327,7 @@ class EntityCommand(BaseCommand):
     def set_dimension_text_size(self, entity_id: int, height: float, width_ratio: float, space_ratio: float, dimtol_ratio1: float, dimtol_ratio2: float, tol_space: float, tilt: int):
         command  = f';CHGATR;MOJI;CTST;TALL\n.DHT {height} .DWD {width_ratio} .DDS {space_ratio} .DKS {dimtol_ratio1} .DSC {dimtol_ratio2} .TST {tol_space} .ANG1 {tilt}\n@PICKID ID {entity_id} IDEND @GO\n;@JVEND'
         element = self.send(command, 'entity.set_dimension_text_size.xml')
-        for sx_ent in element.xpath('./sx_ent'):
+        for sx_ent in element.findall('sx_ent'):
             return EntityCommand.Data(sx_ent)
 
     def set_color(self, entity_id: int, color: int):
@@ -307,7 +428,7 @@ class EntityCommand(BaseCommand):
         element = self.send(command, 'entity.edit_text.xml')
 
         entity_data = None
-        for sx_ent in element.xpath('./sx_ent'):
+        for sx_ent in element.findall('sx_ent'):
             entity_data = EntityCommand.Data(sx_ent)
             break
 
@@ -400,7 +521,7 @@ class EntityCommand(BaseCommand):
         
         element = self.send(command, 'entity.edit_dimension_text.xml')
         entity_data = None
-        for sx_ent in element.xpath('./sx_ent'):
+        for sx_ent in element.findall('sx_ent'):
             entity_data = EntityCommand.Data(sx_ent)
             break
 
@@ -411,12 +532,20 @@ class EntityCommand(BaseCommand):
 
     def get_on_point(self, entity_id: int, prmno: int, point: list[float], real: bool):
         element = self.send(f';JVVEC .KIND {0 if real else 1} .ENTID {entity_id} .PRMNO {prmno} .PX {point[0]:.8f} .PY {point[1]:.8f} .PZ {point[2]:.8f} : ;@JVEND', 'entity.get_on_point.xml')
-        for sx_pos in element.xpath('entity.get_on_point.xml'):
+        for sx_pos in element.findall('sx_pos'):
             return [ float( sx_pos.get('x') ), float( sx_pos.get('y') ), float( sx_pos.get('z') ) ]
 
 
 class FaceCommand(BaseCommand):
 
+    class Evaluation:
+        def __init__(self) -> None:
+            self.centers                      = array('d')
+            self.on_points                    = array('d')
+            self.normals                      = array('d')
+            self.colors: list[CadTypes.Color] = []
+            self.masses: list[Mass]           = []
+
     class Data:
         def __init__(self, element: etree._Element) -> None:
             self.id        = element.get('id')
@@ -433,14 +562,16 @@ class FaceCommand(BaseCommand):
         element = self.send(f';JVGEOM .ENTID {face.id} .PRMNO {face.prmno} .FACENO {face.faceno} .CSGSOL {face.csgsol} : ;@JVEND', 'face.get_geometry.xml')
         return GeometryFactory.create(element)
 
-    def get_geometries(self, faces: list[Face]):
+    def get_geometries(self, faces: list[Face], batch: bool = False):
         element = self.send(';JVGEO2\n' + '\n'.join([ f'.ENTID {f.id} .PRMNO {f.prmno} .FACENO {f.faceno} .CSGSOL {f.csgsol} :' for f in faces]) + '\n;@GO;@JVEND', 'face.get_geometries.xml')
+        if batch:
+            return GeometryBatch.from_element(element)
         return [ GeometryFactory.create(e) for e in element ]
 
     def get_edges(self, face: Face):
         element = self.send(f';GXDMY;JVUENT .KIND 4 .ENTID {face.id} .PRMNO {face.prmno} .DSPID {face.csgsol} .FACENO {face.faceno} : ;@JVEND', 'face.get_edges.xml')
         edges = []
-        for sx_edge in element.xpath('./sx_edge'):
+        for sx_edge in element.findall('sx_edge'):
             edge = Edge(self.client)
             edge.from_edge( EdgeCommand.Info(sx_edge) )
             edges.append(edge)
@@ -449,7 +580,7 @@ class FaceCommand(BaseCommand):
     def get_faces_edges(self, faces: list[Face]):
         element = self.send(';JVUEN2\n' + '\n'.join([f'.KIND 4 .ENTID {f.id} .PRMNO {f.prmno} .DSPID {f.csgsol} .FACENO {f.faceno} :' for f in faces]) + '\n;@GO;@JVEND', 'face.get_faces_edges.xml')
         edges = []
-        for sx_edge in element.xpath('./sx_edge'):
+        for sx_edge in element.findall('sx_edge'):
             edge = Edge(self.client)
             edge.from_edge( EdgeCommand.Info(sx_edge) )
             edges.append(edge)
@@ -457,7 +588,7 @@ class FaceCommand(BaseCommand):
 
     def get_center_point(self, face: Face):
         element = self.send(f';JVUENT .KIND 8 .ENTID {face.id} .PRMNO {face.prmno} .DSPID {face.csgsol} .FACENO {face.faceno} ;@JVEND', 'face.get_center_point.xml')
-        for sx_pos in element.xpath('./sx_pos'):
+        for sx_pos in element.findall('sx_pos'):
             return [ float(sx_pos.get('x')), float(sx_pos.get('y')), float(sx_pos.get('z')) ]
 
     def get_on_point(self, face: Face, point: list[float]=None, real: bool=None):
@@ -466,32 +597,98 @@ class FaceCommand(BaseCommand):
         else:
             command  = f';JVVEC .KIND {0 if real else 1}\n.ENTID {face.id} .PRMNO {face.prmno} .FACENO {face.faceno} .CSGSOL {face.csgsol} .PX {point[0]:0.8f} .PY {point[1]:0.8f} .PZ {point[2]:0.8f} : ;@JVEND'
         element = self.send(command, 'face.get_on_point.xml')
-        for sx_pos in element.xpath('./sx_pos'):
+        for sx_pos in element.findall('sx_pos'):
             return [ float(sx_pos.get('x')), float(sx_pos.get('y')), float(sx_pos.get('z')) ]
 
     def get_mass(self, face: Face):
         command = f';JVUENT .KIND 7 .ENTID {face.id} .PRMNO {face.prmno} .DSPID {face.csgsol} .FACENO {face.faceno} : ;@JVEND'
         element = self.send(command, 'face.get_on_point.xml')
-        for sx_inf_mass in element.xpath('sx_inf_mass'):
+        for sx_inf_mass in element.findall('sx_inf_mass'):
             return Mass(sx_inf_mass)
 
     def get_masses(self, faces: list[Face]):
+        if len(faces) == 0:
+            return []
         element = self.send(';JVUEN2\n' + '\n'.join([f'.KIND 7 .ENTID {f.id} .PRMNO {f.prmno} .DSPID {f.csgsol} .FACENO {f.faceno} :' for f in faces]) + '\n;@GO;@JVEND', 'face.get_masses.xml')
-        return [ Mass(sx_inf_mass) for sx_inf_mass in element.xpath('sx_inf_mass') ]
+        # 応答の数が合わない時は1面ずつ取り直す (返ってこない面は None)
+        return self.aligned([ Mass(sx_inf_mass) for sx_inf_mass in element.findall('sx_inf_mass') ], faces, self.get_mass)
 
     def eval(self, face: Face, point: list[float]):
         command  = f';JVVEC .KIND 1 .ENTID {face.id}, .PRMNO {face.prmno} .FACENO {face.faceno} .CSGSOL {face.csgsol}\n'
         command += f'.PX {point[0]:.8f} .PY {point[1]:.8f} .PZ {point[2]:.8f} : ;@JVEND'
         element = self.send(command, 'face.eval.xml')
+        for sx_pos in element.findall('sx_pos'):
+            return [ float(sx_pos.get('x')), float(sx_pos.get('y')), float(sx_pos.get('z')) ]
 
     def get_color(self, face: Face):
         element = self.send(f';JVUENT .KIND 13 .ENTID {face.id} .PRMNO {face.prmno} .DSPID {face.csgsol} .FACENO {face.faceno} : ;@JVEND', 'face.get_color.xml')
-        for sx_int in element.xpath('./sx_int'):
-            return CadTypes.Color(int(sx_int))
+        for sx_int in element.findall('sx_int'):
+            return CadTypes.Color.get_value( int(sx_int.text) )
 
     def get_colors(self, faces: list[Face]):
-        element = self.send('\n'.join([f';JVUENT .KIND 13 .ENTID {f.id} .PRMNO {f.prmno} .DSPID {f.csgsol} .FACENO {f.faceno} :' for f in faces]) + '\n;@JVEND', 'face.get_colors.xml')
-        return [ CadTypes.Color(int(sx_int)) for sx_int in element.xpath('./sx_int') ]
+        if len(faces) == 0:
+            return []
+        element = self.send(';JVUEN2\n' + '\n'.join([f'.KIND 13 .ENTID {f.id} .PRMNO {f.prmno} .DSPID {f.csgsol} .FACENO {f.faceno} :' for f in faces]) + '\n;@GO;@JVEND', 'face.get_colors.xml')
+        return [ CadTypes.Color.get_value( int(sx_int.text) ) for sx_int in element.findall('sx_int') ]
+
+    def aligned(self, values: list, faces: list[Face], function) -> list:
+        # 一括の応答が面の数と合わないと以降の対応がずれるので、1面ずつ取り直す
+        if len(values) == len(faces):
+            return values
+        return [ function(face) for face in faces ]
+
+    def evaluate(self, faces: list[Face], points: list[list[float]] = None, center=True, color=True, mass=True, normal=True, chunk_size: int = 500):
+        evaluation = FaceCommand.Evaluation()
+        nan3 = [ math.nan ] * 3
+        for i in range(0, len(faces), chunk_size):
+            chunk = faces[i : i + chunk_size]
+            chunk_points = points[i : i + chunk_size] if points is not None else None
+
+            # KIND 8 (sx_pos), 13 (sx_int), 7 (sx_inf_mass) は返るタグが異なるので 1 回の JVUEN2 にまとめる
+            kinds = [ kind for kind, flag in [ (8, center or (normal and points is None)), (13, color), (7, mass) ] if flag ]
+            centers, colors, masses = [], [], []
+            if kinds:
+                element = self.send(';JVUEN2\n' + '\n'.join([f'.KIND {kind} .ENTID {f.id} .PRMNO {f.prmno} .DSPID {f.csgsol} .FACENO {f.faceno} :' for f in chunk for kind in kinds]) + '\n;@GO;@JVEND', 'face.evaluate.xml')
+                centers = [ [ float(sx_pos.get('x')), float(sx_pos.get('y')), float(sx_pos.get('z')) ] for sx_pos in element.iterfind('sx_pos') ]
+                colors  = [ CadTypes.Color.get_value( int(sx_int.text) ) for sx_int in element.iterfind('sx_int') ]
+                masses  = [ Mass(sx_inf_mass) for sx_inf_mass in element.iterfind('sx_inf_mass') ]
+                if 8 in kinds:
+                    centers = self.aligned(centers, chunk, self.get_center_point)
+                if 13 in kinds:
+                    colors  = self.aligned(colors, chunk, self.get_color)
+                if 7 in kinds:
+                    masses  = self.aligned(masses, chunk, self.get_mass)
+
+            on_points = []
+            if chunk_points is not None:
+                command  = '\n'.join([
+                    f';JVVEC .KIND 1\n.ENTID {f.id} .PRMNO {f.prmno} .FACENO {f.faceno} .CSGSOL {f.csgsol} .PX {p[0]:0.8f} .PY {p[1]:0.8f} .PZ {p[2]:0.8f} :'
+                    for f, p in zip(chunk, chunk_points)
+                ])
+                command += '\n;@JVEND'
+                element = self.send(command, 'face.evaluate_on_points.xml')
+                on_points = [ [ float(sx_pos.get('x')), float(sx_pos.get('y')), float(sx_pos.get('z')) ] for sx_pos in element.iterfind('sx_pos') ]
+                if len(on_points) != len(chunk):
+                    on_points = [ self.get_on_point(f, p, False) for f, p in zip(chunk, chunk_points) ]
+
+            # 取得できなかった面は nan / None (aligned で面毎に対応させてある)
+            for j in range( len(chunk) ):
+                if center:
+                    evaluation.centers.extend( centers[j] if centers[j] is not None else nan3 )
+                if chunk_points is not None:
+                    evaluation.on_points.extend( on_points[j] if on_points[j] is not None else nan3 )
+                if color:
+                    evaluation.colors.append( colors[j] )
+                if mass:
+                    evaluation.masses.append( masses[j] )
+
+            if normal:
+                base_points = on_points if chunk_points is not None else centers
+                geometries = self.aligned( self.get_geometries(chunk), chunk, lambda face: ( self.get_geometries([ face ]) or [ None ] )[0] )
+                for j in range( len(chunk) ):
+                    evaluation.normals.extend( self.client.calculate.surface_normal(geometries[j], base_points[j]) )
+
+        return evaluation
 
     def set_color(self, face: Face, color: CadTypes.Color):
         command  = ';CHGATR;FACATR;NONCOL\n' if color == CadTypes.Color.NONE else f';FCLCHG {color}\n'
@@ -500,11 +697,39 @@ class FaceCommand(BaseCommand):
         self.send(command, 'face.set_color.xml')
 
     def set_colors(self, faces: list[Face], color: CadTypes.Color):
-        command  = ';CHGATR;FACATR;NONCOL' if color == CadTypes.Color.NONE else f';FCLCHG {color}'
+        command  = ';CHGATR;FACATR;NONCOL\n' if color == CadTypes.Color.NONE else f';FCLCHG {color}\n'
         command += '\n'.join([f'@ENT @PICKID ID {f.id} MID {f.csgsol} PNO {f.prmno} FNO {f.faceno} IDEND' for f in faces])
         command += f'\n@GO\n.SHORI / 0/\n;GXDMY;@JVEND'
         self.send(command, 'face.set_colors.xml')
 
+    def recolor(self, faces: list[Face], rule, skip_same: bool = True, chunk_size: int = 500) -> dict[CadTypes.Color, list[Face]]:
+        # rule は {Face: 色} の辞書か、Face を受け取り色 (変更しない場合は None) を返す関数
+        get_color = rule.get if isinstance(rule, dict) else rule
+        targets = [ (face, get_color(face)) for face in faces ]
+        targets = [ (face, color) for face, color in targets if color is not None ]
+
+        if skip_same:
+            # 応答の数が合わないチャンクは面との対応が分からないので、省略せずに全て送る
+            changed = []
+            for i in range(0, len(targets), chunk_size):
+                chunk = targets[i : i + chunk_size]
+                current_colors = self.get_colors([ face for face, _ in chunk ])
+                if len(current_colors) != len(chunk):
+                    changed += chunk
+                    continue
+                changed += [ (face, color) for (face, color), current_color in zip(chunk, current_colors) if current_color != color ]
+            targets = changed
+
+        groups: dict[CadTypes.Color, list[Face]] = {}
+        for face, color in targets:
+            groups.setdefault(color, []).append(face)
+
+        for color, group in groups.items():
+            for i in range(0, len(group), chunk_size):
+                self.set_colors(group[i : i + chunk_size], color)
+
+        return groups
+
 
 class HoleCommand(BaseCommand):
     
@@ -604,13 +829,28 @@ class WfCommand(BaseCommand):
 class VsCommand(BaseCommand):
 
     class Data:
+        decoder = Decoder([
+            ('model_id', 'model_id', int),
+            ('vsno'    , 'vsno'    , int),
+            ('type'    , 'type'    , enum(CadTypes.VS.Type)),
+            ('refid'   , 'refid'   , int),
+        ])
+
         def __init__(self, element: etree._Element) -> None:
-            self.model_id = int(element.get('model_id'))
-            self.vsno = int(element.get('vsno'))
-            self.type = CadTypes.VS.Type( int(element.get('type')) )
-            self.refid = int(element.get('refid'))
+            VsCommand.Data.decoder.decode(element, self)
 
     class Info:
+        decoder = Decoder([
+            ('name'     , 'name'     , raw),
+            ('angle'    , 'angle'    , float),
+            ('scale'    , 'scale'    , float),
+            ('has_local', 'has_local', flag),
+            ('comment'  , 'comment'  , raw),
+            ('type'     , 'type'     , enum(CadTypes.VS.Type)),
+        ])
+
+        view_types = {'!XY': 2, '!-XZ': 1, '!YZ': 3, '!-YZ': 4, '!X-Y': 5, '!XZ': 6, '!!GLOBAL': 0}
+
         def __init__(self, element: etree._Element) -> None:
             sx_inf_vs = element.find('sx_inf_vs')
             sx_pos = sx_inf_vs.find('sx_pos')
@@ -625,16 +865,9 @@ class VsCommand(BaseCommand):
                 matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0]
             ])
 
-            view_type = {'!XY': 2, '!-XZ': 1, '!YZ': 3, '!-YZ': 4, '!X-Y': 5, '!XZ': 6, '!!GLOBAL': 0}
-
-            self.name = sx_inf_vs.get('name')
+            VsCommand.Info.decoder.decode(sx_inf_vs, self)
             self.origin = [float(sx_inf_vs.get('x')), float(sx_inf_vs.get('y')), 0.0]
-            self.angle = float(sx_inf_vs.get('angle'))
-            self.scale = float(sx_inf_vs.get('scale'))
-            self.has_local = sx_inf_vs.get('has_local') != '0'
-            self.comment = sx_inf_vs.get('comment')
-            self.type = CadTypes.VS.Type( int(sx_inf_vs.get('type')) )
-            self.view_type = CadTypes.VS.View( view_type.get(self.name, -1) )
+            self.view_type = CadTypes.VS.View( VsCommand.Info.view_types.get(self.name, -1) )
             self.local_origin = [ float(sx_pos.get(i)) for i in ['x', 'y', 'z'] ]
             self.local_matrix = [ matrix[1], matrix[2], matrix[0] ]
     
@@ -649,10 +882,7 @@ class VsCommand(BaseCommand):
         return VsCommand.Info(element)
 
     def get_window(self, vs: VS):
-        data = self.send(f';JVGPD .MODEL {vs.model_id} .VS {vs.vsno} .WF 0 : ;@JVEND', 'vs.get_window.xml')
-        for sx_pd in data.xpath('./sx_pd'):
-            window = Window(self.client, int(sx_pd.get('pdno')))
-            return window
+        return self.client.windows.get(vs.model_id, vs.vsno, 0)
 
     def set_active(self, vs: VS):
         window = self.get_window(vs)
@@ -668,12 +898,12 @@ class VsCommand(BaseCommand):
         element = self.send(command, 'vs.get_entities.xml')
         
         entities: dict[int, Entity] = {}
-        for sx_ent in element.xpath('./sx_ent'):
+        for sx_ent in element.findall('sx_ent'):
             entity: Entity = EntityFactory.create(self.client, EntityCommand.Data(sx_ent))
             entities[entity.id] = entity
         
         element = self.send(';JVEIN2\n' + '\n'.join([ f'.ID {e.id} :' for e in entities.values() ]) + '\n@GO;@JVEND', 'vs.get_intent.xml')
-        for sx_entinf in element.xpath('./sx_entinf'):
+        for sx_entinf in element.findall('sx_entinf'):
             _id = int( sx_entinf.get('id') )
             if _id in entities:
                 entities[_id].from_inf(EntityCommand.Info(sx_entinf))
@@ -687,13 +917,13 @@ class VsCommand(BaseCommand):
         data = self.send(f';JVUVW .KIND {kind} .SXDIM 2 .MODEL {vs.model_id} .VWNO {vs.vsno} .PNAME /{partname}/ : ;@JVEND', 'vs.get_r_parts.xml')
 
         r_parts: dict[int, RPart] = {}
-        for sx_ent in data.xpath('./sx_ent'):
+        for sx_ent in data.findall('sx_ent'):
             r_part = RPart(self.client, vs.model_id, 0, vs.vsno)
             r_part.from_ent(RPartCommand.Data(sx_ent))
             r_parts[r_part.id] = r_part
         
         data = self.send(';JVGPI2\n' + '\n'.join([ f'.KIND 0 .ID {r_part.id} :' for r_part in r_parts.values() ]) + '\n;@GO;@JVEND', 'vs.get_inf_r_parts.xml')
-        for inf_r_part in data.xpath('./sx_inf_rpart'):
+        for inf_r_part in data.findall('sx_inf_rpart'):
             part_id = int( inf_r_part.get('id') )
             r_part = r_parts[part_id]
             r_part.from_inf_r_part(RPartCommand.Info(inf_r_part))
@@ -702,8 +932,9 @@ class VsCommand(BaseCommand):
 
     def get_entities_in_rect(self, vs: VS, p0: list[float], p1: list[float], part: bool, cross: bool):
 
+        # 交差モードはユーザーが GUI で変えられるので毎回問い合わせ、終わったら元に戻す
         element = self.send(';JVGSIF;GXDMY;@JVEND', 'pycadsx.get_inf_sys.xml')
-        sx_inf_sys = element.xpath('./sx_inf_sys')
+        sx_inf_sys = element.findall('sx_inf_sys')
         _cross = sx_inf_sys[0].get('cross', '0') != '0' if len(sx_inf_sys) > 0 else False
 
         window = self.set_active(vs)
@@ -718,12 +949,12 @@ class VsCommand(BaseCommand):
         element = self.send(command, 'vs.get_entities_in_rect.xml')
         
         entities: dict[int, Entity] = {}
-        for sx_ent in element.xpath('./sx_ent'):
+        for sx_ent in element.findall('sx_ent'):
             entity: Entity = EntityFactory.create(self.client, EntityCommand.Data(sx_ent))
             entities[entity.id] = entity
         
         element = self.send(';JVEIN2\n' + '.\n'.join([ f'.ID {e.id} :' for e in entities.values() ]) + '\n@GO;@JVEND', 'vs.get_intent.xml')
-        for sx_entinf in element.xpath('./sx_entinf'):
+        for sx_entinf in element.findall('sx_entinf'):
             _id = int( sx_entinf.get('id') )
             if _id in entities:
                 entities[_id].from_inf( EntityCommand.Info(sx_entinf) )
@@ -732,7 +963,7 @@ class VsCommand(BaseCommand):
 
     def get_extent(self, vs: VS):
         element = self.send(f';JVUVW .KIND 0 .SXDIM 2 .MODEL {vs.model_id} .VWNO {vs.vsno} : ;@JVEND', 'vs.get_extent.xml')
-        for sx_box in element.xpath('./sx_box'):
+        for sx_box in element.findall('sx_box'):
             points = [ [ float(sx_box.get(f'{j}{i}')) for j in ['x', 'y', 'z'] ] for i in ['1', '2'] ]
             _id = int( sx_box.get('id') )
             return points
@@ -741,15 +972,27 @@ class VsCommand(BaseCommand):
         point = [0.113 * vs.vsno, 0.137 * vs.vsno]
         return vs.convert_point(point)
 
-    def move(self, vs: VS, point: list[float]):
+    def move_command(self, vs: VS, point: list[float]):
         if vs.refid != 0:
             command = f';VWTRNS @ENT @PICKID ID {vs.refid} IDEND '
         else:
             #point = self.get_view_position(vs)
             pdno = vs.get_window().pdno
             command = f';VWTRNS @HIT S {pdno} X {vs.origin[0] + 0.1:.8f} Y {vs.origin[1] + 0.1:.8f} Z 0.0 , '
-        command += f'.TRANSX {point[0] - vs.origin[0]:.8f} .TRANSY {point[1] - vs.origin[1]:.8f} : ;@JVEND'
-        self.send(command, 'vs.get_extent.xml')
+        command += f'.TRANSX {point[0] - vs.origin[0]:.8f} .TRANSY {point[1] - vs.origin[1]:.8f} : '
+        return command
+
+    def move(self, vs: VS, point: list[float]):
+        self.send(self.move_command(vs, point) + ';@JVEND', 'vs.get_extent.xml')
+        vs.origin = [ point[0], point[1] ] + vs.origin[2:]
+
+    def move_views(self, moves: list[tuple[VS, list[float]]]):
+        # 複数ビューの VWTRNS を1回で送り、原点はローカルで更新する (get_inf 不要)
+        if len(moves) == 0:
+            return
+        self.send('\n'.join([ self.move_command(vs, point) for vs, point in moves ]) + ';@JVEND', 'vs.move_views.xml')
+        for vs, point in moves:
+            vs.origin = [ point[0], point[1] ] + vs.origin[2:]
 
     def set_scale(self, vs: VS, scale: float, move_view: bool = False):
         if vs.type == CadTypes.VS.Type.WORK_VS:
@@ -765,6 +1008,7 @@ class VsCommand(BaseCommand):
                 command += ';SCALE1 ' if move_view else ';SCALE2 '
             command += f'.SCL {scale:.8f} : ;@JVEND'
             self.send(command, 'vs.set_scale.xml')
+        vs.invalidate()
 
 
 class ModelCommand(BaseCommand):
@@ -794,6 +1038,8 @@ class ModelCommand(BaseCommand):
         [ 'A0', 1189, 841, 0.0001]
     ]
 
+    entity_data_fields = ['type', 'id', 'prmno', 'kind', 'part_id', 'is3d']
+
     class Data:
         def __init__(self, element: etree._Element) -> None:
             self.path: str          = element.get('path')
@@ -811,10 +1057,13 @@ class ModelCommand(BaseCommand):
     
     def create(self):
         self.send(';NEW;CLR;@JVEND', 'model.create.xml')
+        self.client.windows.clear()
+        # 新しいモデルは閉じたモデルの ID を使うことがある
+        self.client.extra_info_cache.clear()
     
     def get_inf(self, model: Model):
         element = self.send(f';JVGMIF .NAME {model.id} : ;GXDMY;@JVEND', 'model.get_inf.xml')
-        for sx_inf_model in element.xpath('./sx_inf_model'):
+        for sx_inf_model in element.findall('sx_inf_model'):
             model_data = ModelCommand.Data(sx_inf_model)
             model.path: str          = model_data.path
             model.name: str          = model_data.name
@@ -842,11 +1091,11 @@ class ModelCommand(BaseCommand):
     def get_wf_list(self, model: Model):
         wf_list, wf_global = [], None
         element = self.send(f';JVGVWL .MODEL {model.id} .VWMODE 3 : ;@JVEND', 'model.get_wf_list.xml')
-        for sx_wf in element.xpath('./sx_wf'):
+        for sx_wf in element.findall('sx_wf'):
             wf = WF(self.client)
             wf.from_data( WfCommand.Data(sx_wf) )
             sx_inf_wf = self.send(f';JVGWVI .MODEL {model.id} .VS 0 .WF {wf.wfno} : ;@JVEND', 'model.get_inf_wf.xml')
-            wf.from_inf( WfCommand.Info(sx_inf_wf.xpath('./sx_inf_wf')[0]) )
+            wf.from_inf( WfCommand.Info(sx_inf_wf.findall('sx_inf_wf')[0]) )
             wf_list.append(wf)
             if wf.Type.GLOBAL_WF == wf.type:
                 wf_global = wf
@@ -862,6 +1111,7 @@ class ModelCommand(BaseCommand):
         command += self.join_entities(entities)
         command += '\nIDEND\n;@GO\n.MSG /ALL /\n.SHORI / 0/\n;GXDMY;@JVEND'
         self.send(command, 'model.delete_entities.xml')
+        self.client.extra_info_cache.discard_ids([ entity.id for entity in entities ])
 
     def delete_print_infos(self, print_infos: list[PrintInfo]):
         if len(print_infos) == 0:
@@ -885,37 +1135,39 @@ class ModelCommand(BaseCommand):
             command = f';VWERSE;DEL;@POS @ON S {window.pdno:d} X {point2[0]:.8f} Y {point2[1]:.8f} Z 0.0 ,\n'
         command += '@GO .MSG /YES/ ;@JVEND'
         self.send(command, 'model.delete_vs.xml')
+        self.client.windows.discard_vs(vs.model_id, vs.vsno)
 
     def get_tree(self, model: Model, wf: WF = None):
 
         try:
             element = self.send(f';JVUVW .KIND 10 .SXDIM 3 .MODEL {model.id} .VWNO {wf.wfno} : ;@JVEND', 'model.get_modified_parts_list.xml')
-            model.modified_ids = [ int( sx_ent.get('id') ) for sx_ent in element.xpath('./sx_ent') ]
+            model.modified_ids = [ int( sx_ent.get('id') ) for sx_ent in element.findall('sx_ent') ]
         except:
             model.modified_ids = []
 
         try:
             element = self.send(f';JVGPID .KIND 5 .MODEL {model.id} .WFNO {wf.wfno} : ;@JVEND', 'model.get_tree.xml')
             
-            stack = [ (model.top_part, element) for element in element.xpath('./sx_inf_parttree') ]
+            stack = [ (model.top_part, element) for element in element.findall('sx_inf_parttree') ]
             while stack:
                 parent_part, element = stack.pop()
                 
-                for sx_inf_parttree in element.xpath('./sx_inf_parttree'):
+                for sx_inf_parttree in element.findall('sx_inf_parttree'):
 
                     child_part = Part(self.client, model.id, wf.wfno)
 
-                    for sx_ent in sx_inf_parttree.xpath('./sx_ent'):
+                    for sx_ent in sx_inf_parttree.findall('sx_ent'):
                         child_part.from_ent( PartCommand.Data(sx_ent) )
                         break
 
-                    for sx_inf_part in sx_inf_parttree.xpath('./sx_inf_part'):
+                    for sx_inf_part in sx_inf_parttree.findall('sx_inf_part'):
                         child_part.from_inf_part( PartCommand.Info(sx_inf_part) )
                         break
 
-                    sx_str_list = sx_inf_parttree.xpath('./sx_str')
+                    sx_str_list = sx_inf_parttree.findall('sx_str')
                     if len(sx_str_list) > 0:
                         child_part.extra_info = self.client.extra_info_to_dict([i.text for i in sx_str_list])
+                        self.client.extra_info_cache.store(child_part, child_part.extra_info)
                     
                     child_part.parent = parent_part
                     child_part.is_modified = child_part.id in model.modified_ids
@@ -933,25 +1185,26 @@ class ModelCommand(BaseCommand):
 
                 try:
                     element = self.send(f';JVGPID .KIND 5 .ID {parent_part.id} : ;@JVEND', 'part.get_tree_element.xml')
-                    stack2 = [ ( parent_part, element.xpath('./sx_inf_parttree')[0] ) ]
+                    stack2 = [ ( parent_part, element.findall('sx_inf_parttree')[0] ) ]
                     while stack2:
                         parent_part, element = stack2.pop()
 
-                        for sx_inf_parttree in element.xpath('./sx_inf_parttree'):
+                        for sx_inf_parttree in element.findall('sx_inf_parttree'):
                         
                             child_part = Part(self.client, model.id, wf.wfno)
 
-                            for sx_ent in sx_inf_parttree.xpath('./sx_ent'):
+                            for sx_ent in sx_inf_parttree.findall('sx_ent'):
                                 child_part.from_ent( PartCommand.Data(sx_ent) )
                                 break
 
-                            for sx_inf_part in sx_inf_parttree.xpath('./sx_inf_part'):
+                            for sx_inf_part in sx_inf_parttree.findall('sx_inf_part'):
                                 child_part.from_inf_part( PartCommand.Info(sx_inf_part) )
                                 break
 
-                            sx_str_list = sx_inf_parttree.xpath('./sx_str')
+                            sx_str_list = sx_inf_parttree.findall('sx_str')
                             if len(sx_str_list) > 0:
                                 child_part.extra_info = self.client.extra_info_to_dict([i.text for i in sx_str_list])
+                                self.client.extra_info_cache.store(child_part, child_part.extra_info)
 
                             child_part.parent = parent_part
                             child_part.is_modified = child_part.id in model.modified_ids
@@ -981,45 +1234,65 @@ class ModelCommand(BaseCommand):
                     texts = []
             for part in parts:
                 part.extra_info = self.client.extra_info_to_dict( extra_info.get(part.id, []) )
+                self.client.extra_info_cache.store(part, part.extra_info)
 
-    def set_extra_infos(self, parts: list['Part'], extra_infos: list[dict[str, str]]):
-        for i in range(len(parts)):
-            if parts[i].id == 0:
-                top_part = parts.pop(i)
-                top_part_extra_info = extra_infos.pop(i)
-                top_part.set_extra_info(top_part_extra_info)
-                break
+    def set_extra_infos(self, parts: list['Part'], extra_infos: list[dict[str, str]], force: bool = False, max_bytes: int = 65536):
+        # キャッシュはこのクライアントから読み書きした内容なので、
+        # CAD の画面で編集や UNDO をした後は force=True にするか extra_info_cache.clear() を呼ぶこと
+        cache = self.client.extra_info_cache
 
-        if len(parts) == 0:
-            return
-        
-        for i in list( range( len(parts) ) )[::-1]:
-            if not extra_infos[i]:
-                parts.pop(i)
-                extra_infos.pop(i)
+        targets: list[tuple[Part, dict[str, str]]] = []
+        for part, extra_info in zip(parts, extra_infos):
+            if part.id == 0:
+                if force or cache.is_changed(part, extra_info):
+                    part.set_extra_info(extra_info)
+                continue
+            if not extra_info:
+                continue
+            if not force and not cache.is_changed(part, extra_info):
+                part.extra_info = extra_info
+                continue
+            targets.append( (part, extra_info) )
+
+        if len(targets) == 0:
+            return []
+
+        batch, batch_size = [], 0
+        for part, extra_info in targets:
+            line = f'@WINID ID {part.id} IDEND {self.extra_info_command(extra_info)} ;@GO\n'
+            line_size = len( line.encode(self.client.encoding) )
+            if batch and batch_size + line_size > max_bytes:
+                self.send_extra_infos(batch)
+                batch, batch_size = [], 0
+            batch.append( (part, extra_info, line) )
+            batch_size += line_size
+        self.send_extra_infos(batch)
+
+        return [ part for part, _ in targets ]
+
+    def extra_info_command(self, extra_info: dict[str, str]):
+        base64_string = self.client.extra_info_to_base64string(extra_info)
+        array = []
+        for i, text in enumerate( re.split('[\n,\0]', base64_string) ):
+            text3 = 'NEWLINE' if i != 0 else ' '
+            for j in range( 0, len(text), 32 ):
+                array.append(f'/{ text3 }/\n/ { text[j : j + 32].replace("/", "//") } /')
+        return '\n'.join(array)
 
-        if len(parts) == 0:
+    def send_extra_infos(self, batch: list[tuple['Part', dict[str, str], str]]):
+        if len(batch) == 0:
             return
-        
-        extra_info_commands = []
-        for extra_info in extra_infos:
-            base64_string = self.client.extra_info_to_base64string(extra_info)
-            array = []
-            for i, text in enumerate( re.split('[\n,\0]', base64_string) ):
-                text3 = 'NEWLINE' if i != 0 else ' '
-                for j in range( 0, len(text), 32 ):
-                    array.append(f'/{ text3 }/\n/ { text[j : j + 32].replace("/", "//") } /')
-            extra_info_commands.append('\n'.join(array))
-        
-        for i in range( 0, len(parts), 100 ):
-            command  = ';JVPIX3;PSET\n'
-            command += '\n'.join([ f'@WINID ID {p.id} IDEND {e} ;@GO\n' for p, e in zip(parts[i:i+100], extra_info_commands[i:i+100]) ])
-            command += '\n;@GO;@JVEND'
-            self.send(command, 'model.set_extra_infos.xml')
+        command  = ';JVPIX3;PSET\n'
+        command += '\n'.join([ line for _, _, line in batch ])
+        command += '\n;@GO;@JVEND'
+        self.send(command, 'model.set_extra_infos.xml')
+        for part, extra_info, _ in batch:
+            part.extra_info = extra_info
+            self.client.extra_info_cache.store(part, extra_info)
 
     def get_modified_parts_list(self, model: Model):
         element = self.send(f';JVUVW .KIND 10 .SXDIM 3 .MODEL {model.id} .VWNO {model.wf_global.wfno} : ;@JVEND', 'model.get_modified_parts_list.xml')
-        modified_ids = [ int( sx_ent.get('id') ) for sx_ent in element.xpath('./sx_ent') ]
+        modified_ids = [ int( sx_ent.get('id') ) for sx_ent in element.findall('sx_ent') ]
         for part in model.parts.values():
             part.is_modified = part.id in modified_ids
         model.modified_ids = modified_ids
@@ -1032,9 +1305,7 @@ class ModelCommand(BaseCommand):
         self.send(command, 'model.set_entities_visible.xml')
 
     def get_window(self, model: Model, wfno: int=0):
-        data = self.send(f';JVGPD .MODEL {model.id} .VS 0 .WF {wfno} : ;@JVEND', 'model.get_window.xml')
-        for sx_pd in data.xpath('./sx_pd'):
-            return Window( self.client, int(sx_pd.get('pdno')) )
+        return self.client.windows.get(model.id, 0, wfno)
 
     def zoom_full(self):
         self.send('@ZOOMFUL ;@JVEND', 'model.zoom_full.xml')
@@ -1043,7 +1314,7 @@ class ModelCommand(BaseCommand):
         element = self.send(f';JVUVW .KIND 1 .SXDIM 3 .MODEL {model.id} .VWNO {wf.wfno} .NUM0 {offset} .NUM1 {num} .VISI {1 if visible else 0} .RPART {1 if part else 0} .LAYER {1 if layer else 0} .STYPE {1 if _type else 0} : ;@JVEND', 'model.get_entities.xml')
 
         entities: dict[int, Entity] = {}
-        for sx_ent in element.xpath('./sx_ent'):
+        for sx_ent in element.findall('sx_ent'):
             entity: Entity = EntityFactory.create(self.client, EntityCommand.Data(sx_ent))
             entities[entity.id] = entity
 
@@ -1053,13 +1324,64 @@ class ModelCommand(BaseCommand):
 
         #element = self.send(command, 'model.get_intent.xml')
         element = self.send(';JVEIN2\n' + '\n'.join([ f'.ID {e.id} :' for e in entities.values() ]) + '\n@GO;@JVEND', 'model.get_intent.xml')
-        for sx_entinf in element.xpath('./sx_entinf'):
+        for sx_entinf in element.findall('sx_entinf'):
             _id = int( sx_entinf.get('id') )
             if _id in entities:
                 entities[_id].from_inf( EntityCommand.Info(sx_entinf) )
 
         return entities
     
+    def iter_entities(self, model: Model, wf: WF, page_size: int, visible: bool, part: bool, layer: bool, _type: bool, fields: list[str] = None, prefetch: bool = True):
+        # 次のページの JVUVW を別スレッドで送っておき、その間に今のページを解析して JVEIN2 を送る
+        # 先読みの応答を待ってから呼び出し側に返すので、呼び出し側がループの中で送るコマンドとは重ならない
+        # (手元に持つのは今のページと先読みした1ページだけ)
+        is_info = fields is None or any([ field not in ModelCommand.entity_data_fields for field in fields ])
+
+        def fetch(offset: int):
+            return self.send(f';JVUVW .KIND 1 .SXDIM 3 .MODEL {model.id} .VWNO {wf.wfno} .NUM0 {offset} .NUM1 {page_size} .VISI {1 if visible else 0} .RPART {1 if part else 0} .LAYER {1 if layer else 0} .STYPE {1 if _type else 0} : ;@JVEND', 'model.get_entities.xml')
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset  = 0
+            element = fetch(offset)
+            while True:
+                sx_ents = element.findall('sx_ent') if element is not None else []
+                if len(sx_ents) == 0:
+                    return
+                offset += page_size
+                future  = executor.submit(fetch, offset) if prefetch else None
+
+                entities: dict[int, Entity] = {}
+                for sx_ent in sx_ents:
+                    entity: Entity = EntityFactory.create(self.client, EntityCommand.Data(sx_ent))
+                    entities[entity.id] = entity
+                del element, sx_ents
+                if is_info:
+                    info = self.send(';JVEIN2\n' + '\n'.join([ f'.ID {_id} :' for _id in entities ]) + '\n@GO;@JVEND', 'model.get_intent.xml')
+                    for sx_entinf in info.iterfind('sx_entinf'):
+                        _id = int( sx_entinf.get('id') )
+                        if _id in entities:
+                            entities[_id].from_inf( EntityCommand.Info(sx_entinf) )
+                    del info
+
+                element = future.result() if future is not None else None
+                for entity in entities.values():
+                    yield entity
+                if future is None:
+                    element = fetch(offset)
+
+    def get_entity_table(self, model: Model, wf: WF, page_size: int, visible: bool, part: bool, layer: bool, _type: bool, table: EntityTable = None) -> EntityTable:
+        if table is None:
+            table = EntityTable(self.client)
+        offset = 0
+        while True:
+            element = self.send(f';JVUVW .KIND 1 .SXDIM 3 .MODEL {model.id} .VWNO {wf.wfno} .NUM0 {offset} .NUM1 {page_size} .VISI {1 if visible else 0} .RPART {1 if part else 0} .LAYER {1 if layer else 0} .STYPE {1 if _type else 0} : ;@JVEND', 'model.get_entities.xml')
+            prmnos = { sx_ent.get('id') : sx_ent.get('prmno') for sx_ent in element.iterfind('sx_ent') } if element is not None else {}
+            if len(prmnos) == 0:
+                break
+            table.extend( self.send(';JVEIN2\n' + '\n'.join([ f'.ID {_id} :' for _id in prmnos ]) + '\n@GO;@JVEND', 'model.get_intent.xml'), prmnos )
+            offset += page_size
+        return table
+
     def get_entities_in_box(self, model: Model, box: list[list[float]], part: bool, org: list[float]=[0.0, 0.0, 0.0], zvec: list[float]=[0.0, 0.0, 1.0], xvec: list[float]=[1.0, 0.0, 0.0]):
         command  = f";JVSBOX .KIND 1 .MID {model.id} .WFNO {model.wf_global.wfno} .EMODE {1 if part else 0}\n"
         command += f".MINX {box[0][0]:.8f}\n"
@@ -1082,7 +1404,7 @@ class ModelCommand(BaseCommand):
         element = self.send(command, 'model.get_entities_in_box.xml')
 
         entities: dict[int, Entity] = {}
-        for sx_ent in element.xpath('./sx_ent'):
+        for sx_ent in element.findall('sx_ent'):
             entity: Entity = EntityFactory.create(self.client, EntityCommand.Data(sx_ent))
             entities[entity.id] = entity
         
@@ -1092,12 +1414,12 @@ class ModelCommand(BaseCommand):
         element = self.send(f';JVUVW .KIND 2 .SXDIM 3 .MODEL {model.id} .VWNO {wf.wfno} .NUM0 {offset} .NUM1 {num} .VISI {1 if visible else 0} .LAYER {1 if layer else 0} .STYPE {1 if _type else 0} : ;@JVEND', 'model.get_entities.xml')
 
         entities: dict[int, Entity] = {}
-        for sx_ent in element.xpath('./sx_ent'):
+        for sx_ent in element.findall('sx_ent'):
             entity: Entity = EntityFactory.create(self.client, EntityCommand.Data(sx_ent))
             entities[entity.id] = entity
 
         element = self.send(';JVEIN2\n' + '\n'.join([ f'.ID {e.id} :' for e in entities.values() ]) + '\n@GO;@JVEND', 'model.get_intent.xml')
-        for sx_entinf in element.xpath('./sx_entinf'):
+        for sx_entinf in element.findall('sx_entinf'):
             _id = int( sx_entinf.get('id') )
             if _id in entities:
                 entities[_id].from_inf( EntityCommand.Info(sx_entinf) )
@@ -1117,7 +1439,7 @@ class ModelCommand(BaseCommand):
     def get_materials(self, entities: list['Entity']):
         data = self.send(';JVUEN2\n' + '\n'.join([f'.KIND 0 .ENTID {entity.id} :' for entity in entities]) + '\n;@GO;@JVEND', 'model.get_materials.xml')
         materials: list[Material] = []
-        for sx_inf_mat in data.xpath('./sx_inf_mat'):
+        for sx_inf_mat in data.findall('sx_inf_mat'):
             materials.append( Material(sx_inf_mat) )
         return materials
 
@@ -1226,7 +1548,7 @@ class ModelCommand(BaseCommand):
         element = self.send(f';JVUVW .KIND {kind} .SXDIM 3 .MODEL {model.id} .VWNO {wfno} .PNAME /{_partname}/ : ;GXDMY;@JVEND', 'model.get_parts_by_name.xml')
         
         parts: dict[int, Part] = {}
-        for sx_ent in element.xpath('./sx_ent'):
+        for sx_ent in element.findall('sx_ent'):
             if int(sx_ent.get('type')) == CadTypes.Entity.Type.PART:
                 part = Part(self.client, model.id, model.wf_global.wfno)
                 part.from_ent( PartCommand.Data(sx_ent) )
@@ -1237,7 +1559,7 @@ class ModelCommand(BaseCommand):
             id_command = '\n'.join([f'.KIND 0 .ID {p.id} :' for p in parts3[i:i+10000] if p.id != 0])
             element = self.send(f';JVGPI2\n{id_command}\n;@GO ;@JVEND', 'model.get_infparts.xml')
             infos = {}
-            for sx_inf_part in element.xpath('./sx_inf_part'):
+            for sx_inf_part in element.findall('sx_inf_part'):
                 info = PartCommand.Info(sx_inf_part)
                 infos[info.id] = info
         
@@ -1265,7 +1587,7 @@ class ModelCommand(BaseCommand):
         part_ids = list(parts2.keys())
         for part_id in part_ids:
             if part_id in parts2:
-                sx_ents = self.send(f';JVGPI2 .KIND 2 . ID {part_id} : ;@JVEND', 'model.get_inf_entities.xml').xpath('./sx_ent')
+                sx_ents = self.send(f';JVGPI2 .KIND 2 . ID {part_id} : ;@JVEND', 'model.get_inf_entities.xml').findall('sx_ent')
                 parts2[part_id].children= [ parts2.pop(int(sx_ent.get('id'))) for sx_ent in sx_ents ]
         
         return parts, parts2
@@ -1277,6 +1599,7 @@ class ModelCommand(BaseCommand):
 
     def set_display_layer(self, layers: list[int], mode: bool):
         num = 255 if layers is None else sum(1 for layer in layers if 0 < layer < 256)
+        a, b = '', ''
         if num > 0:
             a = ' ALL' if layers is None else ''.join(f' {layer}' for layer in layers if 0 < layer < 256) + ' @GO'
             if not mode:
@@ -1288,7 +1611,7 @@ class ModelCommand(BaseCommand):
         if wf is None:
             wf = model.wf_global
         element = self.send(f';JVUVW .KIND 0 .SXDIM 3 .MODEL {model.id} .VWNO {wf.wfno} : ;@JVEND', 'model.get_extent.xml')
-        for sx_box in element.xpath('./sx_box'):
+        for sx_box in element.findall('sx_box'):
             points = [ [ float(sx_box.get(f'{j}{i}')) for j in ['x', 'y', 'z'] ] for i in ['1', '2'] ]
             _id = int( sx_box.get('id') )
             return points
@@ -1304,7 +1627,7 @@ class ModelCommand(BaseCommand):
 
     def get_draft_attribute(self):
         element = self.send(f';JVUMDL / / .KIND 3 .MODEL {-1} : ;@JVEND', 'model.get_draft_attribute.xml')
-        for sx_draft_atr in element.xpath('./sx_draft_atr'):
+        for sx_draft_atr in element.findall('sx_draft_atr'):
             self.draft_attribute = DraftAttribute(sx_draft_atr)
             return self.draft_attribute
         return None
@@ -1432,7 +1755,7 @@ class ModelCommand(BaseCommand):
         
         command += ';@JVEND'
         element = self.send(command, 'model.create_surface_mark.xml')
-        for sx_ent in element.xpath('./sx_ent'):
+        for sx_ent in element.findall('sx_ent'):
             entity: Entity = EntityFactory.create(self.client, EntityCommand.Data(sx_ent))
             return entity
         return None
@@ -1491,7 +1814,7 @@ class ModelCommand(BaseCommand):
             entities[entity.id] = entity
 
         element = self.send(';JVEIN2\n' + '\n'.join([ f'.ID {e.id} :' for e in entities.values() ]) + '\n@GO;@JVEND', 'model.get_intent.xml')
-        for sx_entinf in element.xpath('./sx_entinf'):
+        for sx_entinf in element.findall('sx_entinf'):
             _id = int( sx_entinf.get('id') )
             if _id in entities:
                 entities[_id].from_inf(EntityCommand.Info(sx_entinf))
@@ -1502,7 +1825,7 @@ class ModelCommand(BaseCommand):
         font_name = self.client.string_to_base64string(font_name)
         element = self.send(f';JVFONT /{font_name}/ ;@JVEND', 'model.get_local_font.xml')
         text = ''
-        for sx_str in element.xpath('./sx_str'):
+        for sx_str in element.findall('sx_str'):
             text += sx_str.text if sx_str.text is not None else ''
         return text
 
@@ -1514,7 +1837,7 @@ class ModelCommand(BaseCommand):
         self.send(command, 'model.create_line_2d.xml')
 
     def get_geometries(self, entities: list['Entity']):
-        geometry_include_entities = [ entity for entity in entities if entity.type in CadTypes.Entity().geometry_include_types() ]
+        geometry_include_entities = [ entity for entity in entities if entity.type in CadTypes.Entity.geometry_include_types() ]
         geometries: list[BaseDimensionGeometry] = []
         element = self.send(';JVGEO2\n' + '\n'.join([ f'.ENTID {e.id} .PRMNO {e.prmno} :' for e in geometry_include_entities ]) + '\n@GO;@JVEND', 'model.get_geometries.xml')
         text_info, line_info = None, None
@@ -1555,7 +1878,7 @@ class ModelCommand(BaseCommand):
     def get_print_infos(self, model: Model):
         element = self.send(f';JVGDIL .MODEL {model.id} : ;@JVEND', 'model.get_print_infos.xml')
         print_infos: list[PrintInfo] = []
-        for sx_inf_print in element.xpath('./sx_inf_print'):
+        for sx_inf_print in element.findall('sx_inf_print'):
             print_infos.append( PrintInfo(sx_inf_print) )
         return print_infos
     
@@ -1609,7 +1932,7 @@ class ModelCommand(BaseCommand):
 
         element = self.send(command, 'model.copy_entities.xml')
         entities = []
-        for sx_ent in element.xpath('./sx_ent'):
+        for sx_ent in element.findall('sx_ent'):
             if int(sx_ent.get('type')) == CadTypes.Entity.Type.PART:
                 entity = Part(self.client, model.id, model.wf_global.wfno)
                 entity.from_ent( PartCommand.Data(sx_ent) )
@@ -1637,12 +1960,12 @@ class ModelCommand(BaseCommand):
 
         element = self.send(command, 'model.copy_entities_2d.xml')
         entities2: dict[int, Entity] = {}
-        for sx_ent in element.xpath('./sx_ent'):
+        for sx_ent in element.findall('sx_ent'):
             entity = EntityFactory.create(self.client, EntityCommand.Data(sx_ent))
             entities2[entity.id] = entity
             
         element = self.send(';JVEIN2\n' + '\n'.join([ f'.ID {e.id} :' for e in entities2.values() ]) + '\n@GO;@JVEND', 'part.get_intent.xml')
-        for sx_entinf in element.xpath('./sx_entinf'):
+        for sx_entinf in element.findall('sx_entinf'):
             _id = int( sx_entinf.get('id') )
             if _id in entities2:
                 entities2[_id].from_inf( EntityCommand.Info(sx_entinf) )
@@ -1673,28 +1996,33 @@ class ModelCommand(BaseCommand):
 
     def get_global_vs(self, model: Model):
         element = self.send(f';JVGNVW .SXDIM 2 .MODEL {model.id} .NAME /        /: ;@JVEND', 'model.get_global_vs.xml')
-        for sx_vs in element.xpath('./sx_vs'):
+        for sx_vs in element.findall('sx_vs'):
             model.vs_global = VS(self.client)
             model.vs_global.from_data( VsCommand.Data(sx_vs) )
             return model.vs_global
 
     def get_search_layer(self) -> list[bool]:
         element = self.send(';JVGMSK .KIND 1 : ;@JVEND', 'model.get_search_layer.xml')
-        return [ i == '1' for i in element.xpath('./sx_bool')[0].text.strip().split('\n') ]
+        return [ i == '1' for i in element.findall('sx_bool')[0].text.strip().split('\n') ]
 
     def get_display_layer(self) -> list[bool]:
         element = self.send(';JVGMSK .KIND 0 : ;@JVEND', 'model.get_display_layer.xml')
-        return [ i == '1' for i in element.xpath('./sx_bool')[0].text.strip().split('\n') ]
+        return [ i == '1' for i in element.findall('sx_bool')[0].text.strip().split('\n') ]
     
     def get_mass(
                 self, entities: list['Entity'], density=1.0, unit_type=CadTypes.Mass.Unit.MM_KG,
-                is_si=True, mode_accuracy=CadTypes.Mass.Accuracy.Low, is_create_point=False, vector=[0.0, 0.0, 1.0]
+                is_si=True, mode_accuracy=CadTypes.Mass.Accuracy.Low, is_create_point=False, vector=[0.0, 0.0, 1.0], part: Part = None
             ):
         
-        body_types = CadTypes.Entity().body_types()
+        body_types = CadTypes.Entity.body_types()
         entities = [ entity for entity in entities if entity.type in body_types ]
         if len(entities) == 0:
             return None
+
+        key = self.client.mass_cache.key(part, density, unit_type, is_si, mode_accuracy, is_create_point, entities)
+        mass = self.client.mass_cache.get(key, part)
+        if mass is not None:
+            return mass
         
         command  = f';VOL3D;VOL0;@ION AREA;@ION CENT;@ION MOME\n.SCL {density}\n@WINID ID\n'
         command += self.join_entities(entities)
@@ -1709,8 +2037,10 @@ class ModelCommand(BaseCommand):
         command += ';@JVEND'
 
         data = self.send(command, 'model.get_mass.xml')
-        for sx_inf_mass in data.xpath('./sx_inf_mass'):
-            return Mass(sx_inf_mass)
+        for sx_inf_mass in data.findall('sx_inf_mass'):
+            mass = Mass(sx_inf_mass)
+            self.client.mass_cache.store(key, part, mass)
+            return mass
 
         return None
 
@@ -1989,20 +2319,37 @@ class ModelCommand(BaseCommand):
         window.set_dimension(False)
         self.send(f';CRTVW;MENUCVIS\n@HIT S        {window.pdno} X {point[0]:>18.8f} Y {point[1]:>18.8f} Z {0.0:>18.8f} ,\n;GXDMY;@JVEND', 'model.project_drawing_isometric.xml')
 
-    def set_drawing_frame(self, model: Model, frame_file_path: Path):
+    def project_drawings(self, model: Model, origins: list[tuple[CadTypes.VS.View, list[float]]]):
+        # 複数ビューの投影を1回のコマンドで送る
+        if len(origins) == 0:
+            return
+        window = self.get_window(model)
+        window.set_dimension(False)
+        commands = []
+        for view_type, point in origins:
+            menu = 'MENUCVIS' if view_type == CadTypes.VS.View.ISOME else 'MENUCVST;PUT'
+            commands.append(f';CRTVW;{menu}\n@HIT S        {window.pdno} X {point[0]:>18.8f} Y {point[1]:>18.8f} Z {0.0:>18.8f} ,\n;GXDMY')
+        self.send('\n'.join(commands) + ';@JVEND', 'model.project_drawings.xml')
+
+    def drawing_frame_command(self, frame_file_path: Path):
         folder_name = str(frame_file_path.parent)
         folders  = [ f'{folder_name[i:i+64]:<64}' for i in range(0, len(folder_name), 64) ]
         if len(folders) < 4:
             folders = folders + ['                                                                ' for _ in range(4-len(folders))]
-        
-        window = self.get_window(model)
-        window.set_dimension(False)
 
         command  = ';CRTVW;MENUCVTL;CVTLEXEC\n'
         command += f'.FILE /{frame_file_path.stem}/\n'
         command += f'.PASSWD /        /\n'
         command += '\n'.join([ f'.DIR{i+1} /{folder}/' for i, folder in enumerate(folders) ])
         command += '\n;@JVEND'
+        return command
+
+    def set_drawing_frame(self, model: Model, frame_file_path: Path, command: str = None):
+        if command is None:
+            command = self.drawing_frame_command(frame_file_path)
+
+        window = self.get_window(model)
+        window.set_dimension(False)
 
         self.send(command, 'model.create_drawing_view.xml')
 
@@ -2036,7 +2383,7 @@ class ModelCommand(BaseCommand):
                 text = text.replace('/', '//')
 
             element = self.send(f';JVSEL .KIND {num} .MSG /{text}/ :', 'model.select.xml', is_macro=True)
-            for sx_inf_select in element.xpath('./sx_inf_select'):
+            for sx_inf_select in element.findall('sx_inf_select'):
                 return Selection(self.client, sx_inf_select, model.id, model.wf_global.wfno)
         except:
             print(traceback.format_exc())
@@ -2049,8 +2396,8 @@ class ModelCommand(BaseCommand):
             element = self.send(f';JVENTS .KIND {kind} :', 'model.select_entities.xml', is_macro=True)
             
             entities = []
-            for sx_ent in element.xpath('sx_ent'):
-                if CadTypes.Entity().get_type( int( sx_ent.get('type') ) ) == CadTypes.Entity.Type.PART:
+            for sx_ent in element.findall('sx_ent'):
+                if CadTypes.Entity.get_type( int( sx_ent.get('type') ) ) == CadTypes.Entity.Type.PART:
                     part = Part(self.client, model.id, model.wf_global.wfno)
                     part.from_ent( PartCommand.Data(sx_ent) )
                     part.get_inf()
@@ -2087,7 +2434,7 @@ class ModelCommand(BaseCommand):
         text = text if text and len(text.encode('utf-8')) <= 72 else ' '
         text = text.replace('/', '//')
         element = self.send(f';JVSEL .KIND {num} .MSG /{text}/ : ;GXDMY;@JVEND')
-        for sx_inf_select in element.xpath('./sx_inf_select'):
+        for sx_inf_select in element.findall('sx_inf_select'):
             return Selection(sx_inf_select)
         return None
 
@@ -2154,7 +2501,7 @@ class ModelCommand(BaseCommand):
         element = self.send(command, 'model.copy_mirror.xml')
 
         mirrored_parts: list[Part] = []
-        for sx_ent in element.xpath('./sx_ent'):
+        for sx_ent in element.findall('sx_ent'):
             #if sx_ent.get('type') == '204':
             if int( sx_ent.get('type') ) == CadTypes.Entity.Type.PART:
                 mirrored_part = Part(self.client, model.id, model.wf_global.wfno)
@@ -2164,7 +2511,7 @@ class ModelCommand(BaseCommand):
                 mirrored_parts.append(mirrored_part)
 
         element = self.send(';JVGPI2\n' + '\n'.join([f'.KIND 0 .ID {part.id} :' for part in mirrored_parts]) + '\n;@GO ;@JVEND', 'model.get_infparts.xml')
-        for child, infpart in zip(mirrored_parts, element.xpath('./sx_inf_part')):
+        for child, infpart in zip(mirrored_parts, element.findall('sx_inf_part')):
             child.from_inf_part( PartCommand.Info(infpart) )
         
         element = self.send(';JVPIX3;PGET\n' + '\n'.join([f'@WINID ID {part.id} IDEND' for part in mirrored_parts if part.id != 0]) + '\n;@GO;@JVEND', 'model.get_ex_infs.xml')
@@ -2366,7 +2713,7 @@ class ModelCommand(BaseCommand):
         if paper_size is None:
             return None, None, None
         
-        dimension_types = CadTypes.Entity().dimension_types()
+        dimension_types = CadTypes.Entity.dimension_types()
 
         self.set_scale(scale)
 
@@ -2448,7 +2795,7 @@ class ModelCommand(BaseCommand):
     def get_line_attributes(self, entities: list[Entity]):
         element = self.send(';GXDMY;JVUEN2\n' + '\n'.join([ f'.KIND 1 .ENTID {e.id} .PRMNO {0} :' for e in entities ]) + '\n@GO;@JVEND', 'model.get_line_attributes.xml')
         line_attributes: list[LineAttribute] = []
-        for sx_int in element.xpath('./sx_int'):
+        for sx_int in element.findall('sx_int'):
             line_attributes.append( LineAttribute(sx_int) )
         return line_attributes
 
@@ -2463,7 +2810,7 @@ class ModelCommand(BaseCommand):
     def get_extent_list(self, entities: list[Entity]):
         element = self.send(';JVBOX2\n' + '\n'.join([f'.ID {e.id} :' for e in entities]) + '\n;@GO;@JVEND', 'get_extent_list.xml')
         boxes: list[list[float]] = []
-        for sx_box in element.xpath('./sx_box'):
+        for sx_box in element.findall('sx_box'):
             points = [ [ float(sx_box.get(f'{j}{i}')) for j in ['x', 'y', 'z'] ] for i in ['1', '2'] ]
             _id = int( sx_box.get('id') )
             boxes.append(points)
@@ -2527,49 +2874,48 @@ class ModelCommand(BaseCommand):
 class PartCommand(BaseCommand):
 
     class Data:
+        decoder = Decoder([
+            ('type'   , 'type'   , int),
+            ('id'     , 'id'     , int),
+            ('prmno'  , 'prmno'  , int),
+            ('kind'   , 'kind'   , int),
+            ('part_id', 'part_id', int),
+            ('is3d'   , 'dim'    , flag),
+        ])
+
         def __init__(self, element: etree._Element) -> None:
-            self.type       = int( element.get('type') )    if element is not None else None
-            self.id         = int( element.get('id') )      if element is not None else None
-            self.prmno      = int( element.get('prmno') )   if element is not None else None
-            self.kind       = int( element.get('kind') )    if element is not None else None
-            self.part_id    = int( element.get('part_id') ) if element is not None else None
-            self.is3d: bool = element.get('dim') != '0'     if element is not None else None
+            PartCommand.Data.decoder.decode(element, self)
     
     class Info:
+        decoder = Decoder([
+            ('name'          , 'name'                    , raw),
+            ('comment'       , 'comment'                 , raw),
+            ('is_mirror'     , 'is_mirror'               , flag),
+            ('is_external'   , 'is_external'             , flag),
+            ('is_read_only'  , 'is_read_only'            , flag),
+            ('is_unloaded'   , 'is_dummy'                , flag),
+            ('ref_model_name', 'ref_model_name'          , raw),
+            ('path'          , 'path'                    , raw),
+            ('date'          , 'date'                    , int),
+            ('time'          , 'time'                    , int),
+            ('is_active'     , 'is_active'               , flag),
+            ('has_grp'       , 'has_grp'                 , flag),
+            ('id'            , 'id'                      , int),
+            ('origin'        , xyz('org')                , float, 0.0),
+            ('matrix'        , (xyz('xvec'), xyz('zvec')), float, 0.0),
+        ])
+
         def __init__(self, element: etree._Element) -> None:
-            self.name: str           = element.get('name')                if element is not None else None
-            self.comment: str        = element.get('comment')             if element is not None else None
-            self.is_mirror: bool     = element.get('is_mirror') != '0'    if element is not None else None
-            self.is_external: bool   = element.get('is_external') != '0'  if element is not None else None
-            self.is_read_only: bool  = element.get('is_read_only') != '0' if element is not None else None
-            self.is_unloaded: bool   = element.get('is_dummy') != '0'     if element is not None else None
+            PartCommand.Info.decoder.decode(element, self)
             #self.is_modified: bool   = element.get('edit') == '1'         if element is not None else None
             self.is_modified: bool   = False
-            self.ref_model_name: str = element.get('ref_model_name')      if element is not None else None
-            self.path: str           = element.get('path')                if element is not None else None
-            self.date                = int( element.get('date') )         if element is not None else None
-            self.time                = int( element.get('time') )         if element is not None else None
-            self.is_active: bool     = element.get('is_active') != '0'    if element is not None else None
-            self.has_grp: bool       = element.get('has_grp') != '0'      if element is not None else None
-            self.id                  = int( element.get('id') )           if element is not None else None
-            
-            self.origin = [
-                float(element.get('orgx', 0.0)),
-                float(element.get('orgy', 0.0)),
-                float(element.get('orgz', 0.0))
-            ]
-
-            self.matrix = [
-                [ float(element.get('xvecx', 0.0)), float(element.get('xvecy', 0.0)), float(element.get('xvecz', 0.0)) ],
-                [],
-                [ float(element.get('zvecx', 0.0)), float(element.get('zvecy', 0.0)), float(element.get('zvecz', 0.0)) ]
-            ]
 
-            self.matrix[1] = [
-                self.matrix[2][1] * self.matrix[0][2] - self.matrix[2][2] * self.matrix[0][1],
-                self.matrix[2][2] * self.matrix[0][0] - self.matrix[2][0] * self.matrix[0][2],
-                self.matrix[2][0] * self.matrix[0][1] - self.matrix[2][1] * self.matrix[0][0]
-            ]
+            # [ xvec, zvec ] の間に yvec = zvec × xvec を入れる
+            self.matrix.insert(1, [
+                self.matrix[1][1] * self.matrix[0][2] - self.matrix[1][2] * self.matrix[0][1],
+                self.matrix[1][2] * self.matrix[0][0] - self.matrix[1][0] * self.matrix[0][2],
+                self.matrix[1][0] * self.matrix[0][1] - self.matrix[1][1] * self.matrix[0][0]
+            ])
 
     def part_data(self, element: etree._Element):
         return PartCommand.Data(element)
@@ -2647,7 +2993,7 @@ class PartCommand(BaseCommand):
             command = ';TD5NEW\n' + '\n'.join([f'@PICKID ID {parent.id} IDEND :' for _ in range(quantity)]) + '\n;@JVEND'
         data = self.send(command, 'part.create_children.xml')
         parts = []
-        for sx_ent in data.xpath('./sx_ent'):
+        for sx_ent in data.findall('sx_ent'):
             part = Part(self.client)
             part.parent = parent
             part.from_ent( PartCommand.Data(sx_ent) )
@@ -2659,6 +3005,7 @@ class PartCommand(BaseCommand):
 
     def delete(self, part: Part):
         self.send(f';ERASE;OPT;@IOFF FEATURE ;@IOFF HSCH @WINID ID {part.id} IDEND\n;@GO\n.MSG /ALL /\n.SHORI / 0/\n;GXDMY;@JVEND', 'part.delete.xml')
+        self.client.extra_info_cache.discard(part)
 
     def free(self, part: Part):
         self.send(f';TD4MOD;PTFRE @PICKID ID {part.id} IDEND ;@GO\n.SHORI / 0/\n;GXDMY;@JVEND', 'part.free.xml')
@@ -2667,13 +3014,32 @@ class PartCommand(BaseCommand):
         if part.id == 0:
             return
         element = self.send(f';JVGPID .KIND 0 .ID {part.id} .MODEL 1 : ;@JVEND', 'part.get_inf.xml')
-        for sx_inf_part in element.xpath('sx_inf_part'):
-            part.from_inf_part( PartCommand.Info(sx_inf_part) )
-            return
+        for sx_inf_part in element.findall('sx_inf_part'):
+            info = PartCommand.Info(sx_inf_part)
+            part.from_inf_part(info)
+            return info
+
+    def get_infs(self, parts: list[Part]):
+        # 応答は id で対応を取り、返ってこなかった部品だけ1つずつ取り直す (それでも無ければ None)
+        infos: list[PartCommand.Info] = [ None ] * len(parts)
+        targets = [ (i, part) for i, part in enumerate(parts) if part.id != 0 ]
+        if len(targets) == 0:
+            return infos
+        element = self.send(';JVGPI2\n' + '\n'.join([f'.KIND 0 .ID {part.id} :' for _, part in targets]) + '\n;@GO ;@JVEND', 'part.get_infparts.xml')
+        replies = { int( sx_inf_part.get('id', '0') ) : sx_inf_part for sx_inf_part in element.iterfind('sx_inf_part') }
+        for i, part in targets:
+            sx_inf_part = replies.get(part.id)
+            if sx_inf_part is None:
+                infos[i] = self.get_inf(part)
+                continue
+            infos[i] = PartCommand.Info(sx_inf_part)
+            part.from_inf_part(infos[i])
+        return infos
 
     def get_extra_info(self, part: Part):
         element = self.send(f';JVPIX;PGET @WINID ID {part.model_id if part.id == 0 else part.id} IDEND ;@JVEND', 'part.get_ex_inf.xml')
-        part.extra_info = self.client.extra_info_to_dict([ i.text for i in element.xpath('./sx_str') ])
+        part.extra_info = self.client.extra_info_to_dict([ i.text for i in element.findall('sx_str') ])
+        self.client.extra_info_cache.store(part, part.extra_info)
         return part.extra_info
 
     def get_entities(self, part: Part):
@@ -2688,7 +3054,7 @@ class PartCommand(BaseCommand):
             entities[entity.id] = entity
         
         element = self.send(';JVEIN2\n' + '\n'.join([ f'.ID {e.id} :' for e in entities.values() ]) + '\n@GO;@JVEND', 'part.get_intent.xml')
-        for sx_entinf in element.xpath('./sx_entinf'):
+        for sx_entinf in element.findall('sx_entinf'):
             _id = int( sx_entinf.get('id') )
             if _id in entities:
                 entities[_id].from_inf( EntityCommand.Info(sx_entinf) )
@@ -2710,17 +3076,21 @@ class PartCommand(BaseCommand):
             edges.append(edge)
         return edges
     
-    def get_edges_geometries(self, edges: list[Edge]):
+    def get_edges_geometries(self, edges: list[Edge], batch: bool = False):
         geometries: list[BaseGeometry] = []
         element = self.send(';JVGEO2\n' + '\n'.join([f'.ENTID {e.id} .PRMNO {e.prmno} .EDGENO {e.edgeno} .CSGSOL {e.csgsol} :' for e in edges]) + '\n;@GO;@JVEND', 'part.get_edges_geometries.xml')
+        if batch:
+            return GeometryBatch.from_element(element)
         for child in element:
             geometry = GeometryFactory.create(child)
             geometries.append(geometry)
         return geometries
 
-    def get_geometries(self, entities: list[Entity]):
+    def get_geometries(self, entities: list[Entity], batch: bool = False):
         geometries = []
         element = self.send(';JVGEO2\n' + '\n'.join([ f'.ENTID {e.id} .PRMNO {e.prmno} :' for e in entities ]) + '\n@GO;@JVEND', 'part.get_geometries.xml')
+        if batch:
+            return GeometryBatch.from_element(element)
         for child in element:
             geometry = GeometryFactory.create(child)
             if geometry is not None:
@@ -2781,7 +3151,7 @@ class PartCommand(BaseCommand):
             part.children.append(part2)
         
         infparts = self.send(';JVGPI2\n' + '\n'.join([f'.KIND 0 .ID {child.id} :' for child in part.children]) + '\n;@GO ;@JVEND', 'part.get_infparts.xml')
-        for child, infpart in zip(part.children, infparts.xpath('./sx_inf_part')):
+        for child, infpart in zip(part.children, infparts.findall('sx_inf_part')):
             child.from_inf_part( PartCommand.Info(infpart) )
         
         command = ';JVPIX3;PGET\n'
@@ -2802,6 +3172,7 @@ class PartCommand(BaseCommand):
                     texts = []
             for child in part.children:
                 child.extra_info = extra_info.get(child.id, {})
+                self.client.extra_info_cache.store(child, child.extra_info)
         
         parts = { child.id : child for child in part.children }
 
@@ -2809,14 +3180,14 @@ class PartCommand(BaseCommand):
     
     def get_parent(self, part: Part):
         element = self.send(f';JVGPID .KIND 1 .ID {part.id} : ;@JVEND', 'part.get_parent.xml')
-        for sx_ent in element.xpath('./sx_ent'):
+        for sx_ent in element.findall('sx_ent'):
             parent = Part(self.client, part.model_id, part.wfno)
             parent.from_ent( PartCommand.Data(sx_ent) )
             parent.get_inf()
             return parent
         parent = Part(self.client, part.model_id, part.wfno)
         element = self.send(f';JVGMIF .NAME {part.model_id} : ;GXDMY;@JVEND', 'part.get_inf_model.xml')
-        for sx_inf_model in element.xpath('./sx_inf_model'):
+        for sx_inf_model in element.findall('sx_inf_model'):
             parent.path: str          = sx_inf_model.get('path', '')
             parent.name: str          = sx_inf_model.get('name', '')
             parent.comment: str       = sx_inf_model.get('comment', '')
@@ -2834,29 +3205,29 @@ class PartCommand(BaseCommand):
         
         part.children = []
 
-        stack = [ (part, i) for i in element.xpath('./sx_inf_parttree') ]
+        stack = [ (part, i) for i in element.findall('sx_inf_parttree') ]
         while stack:
             parent, sx_inf_parttree = stack.pop()
             
             part = Part(self.client, part.model_id, part.wfno)
             part.parent = parent
 
-            for sx_ent in sx_inf_parttree.xpath('./sx_ent'):
+            for sx_ent in sx_inf_parttree.findall('sx_ent'):
                 part.from_ent( PartCommand.Data(sx_ent) )
                 break
 
-            for sx_inf_part in sx_inf_parttree.xpath('./sx_inf_part'):
+            for sx_inf_part in sx_inf_parttree.findall('sx_inf_part'):
                 part.from_inf_part( PartCommand.Info(sx_inf_part) )
                 break
 
-            sx_str_list = sx_inf_parttree.xpath('./sx_str')
+            sx_str_list = sx_inf_parttree.findall('sx_str')
             if len(sx_str_list) > 0:
                 part.extra_info = self.client.extra_info_to_dict([i.text for i in sx_str_list])
 
             parts[part.id] = part
             parent.children.append(part)
 
-            stack.extend([ (part, i) for i in sx_inf_parttree.xpath('./sx_inf_parttree') ])
+            stack.extend([ (part, i) for i in sx_inf_parttree.findall('sx_inf_parttree') ])
 
         return parts
 
@@ -2936,6 +3307,7 @@ class PartCommand(BaseCommand):
             self.send(command, 'part.set_access.xml')
 
     def set_active(self, part: Part):
+        # アクティブ部品は GUI でも変えられるので、毎回問い合わせてから切り替える
         self.get_inf(part)
         if part.is_active:
             return
@@ -2943,10 +3315,10 @@ class PartCommand(BaseCommand):
 
             active_part_id = None
             element = self.send(';JVGSIF;GXDMY;@JVEND', 'part.get_inf_sys.xml')
-            sx_inf_sys = element.xpath('./sx_inf_sys')
+            sx_inf_sys = element.findall('sx_inf_sys')
             if sx_inf_sys:
                 sx_inf_sys: etree._Element = sx_inf_sys[0]
-                sx_ent = sx_inf_sys.xpath('./sx_ent')
+                sx_ent = sx_inf_sys.findall('sx_ent')
                 if len(sx_ent) > 0:
                     active_part_id = int( sx_ent[0].get('id') )
             if active_part_id is None:
@@ -2973,6 +3345,7 @@ class PartCommand(BaseCommand):
         
         self.send(command, 'part.set_exinf.xml')
         part.extra_info = extra_info
+        self.client.extra_info_cache.store(part, extra_info)
 
     def set_model_info(self, part: Part, titles: list[str], infos: list[str]):
         datas = ''
@@ -2996,7 +3369,13 @@ class PartCommand(BaseCommand):
         self.send(command, 'part.set_model_info.xml')
 
     def get_mass(self, part: Part, density=1.0, unit_type=CadTypes.Mass.Unit.MM_KG, is_si=True, mode_accuracy=CadTypes.Mass.Accuracy.Low, is_create_point=False):
-        body_types = CadTypes.Entity().body_types()
+        # キャッシュにあれば get_entities も VOL3D も行わない
+        key = self.client.mass_cache.key(part, density, unit_type, is_si, mode_accuracy, is_create_point)
+        mass = self.client.mass_cache.get(key, part)
+        if mass is not None:
+            return mass
+
+        body_types = CadTypes.Entity.body_types()
         entities = [ entity for entity in self.get_entities(part).values() if entity.type in body_types ]
         if len(entities) == 0:
             return None
@@ -3016,16 +3395,23 @@ class PartCommand(BaseCommand):
         command += ';@JVEND'
 
         data = self.send(command, 'part.get_mass.xml')
-        for sx_inf_mass in data.xpath('./sx_inf_mass'):
-            return Mass(sx_inf_mass)
+        for sx_inf_mass in data.findall('sx_inf_mass'):
+            mass = Mass(sx_inf_mass)
+            self.client.mass_cache.store(key, part, mass)
+            return mass
 
         return None
 
-    def get_entities_mass(self, entities: list[Entity], density=1.0, unit_type=CadTypes.Mass.Unit.MM_KG, is_si=True, mode_accuracy=CadTypes.Mass.Accuracy.Low, is_create_point=False):
-        body_types = CadTypes.Entity().body_types()
+    def get_entities_mass(self, entities: list[Entity], density=1.0, unit_type=CadTypes.Mass.Unit.MM_KG, is_si=True, mode_accuracy=CadTypes.Mass.Accuracy.Low, is_create_point=False, part: Part = None):
+        body_types = CadTypes.Entity.body_types()
         entities = [ entity for entity in entities if entity.type in body_types ]
         if len(entities) == 0:
             return None
+
+        key = self.client.mass_cache.key(part, density, unit_type, is_si, mode_accuracy, is_create_point, entities)
+        mass = self.client.mass_cache.get(key, part)
+        if mass is not None:
+            return mass
         
         command  = ';VOL3D;VOL0;@ION AREA;@ION CENT;@ION MOME\n'
         command += f'.SCL {density}\n'
@@ -3042,8 +3428,10 @@ class PartCommand(BaseCommand):
         command += ';@JVEND'
 
         data = self.send(command, 'part.get_mass.xml')
-        for sx_inf_mass in data.xpath('./sx_inf_mass'):
-            return Mass(sx_inf_mass)
+        for sx_inf_mass in data.findall('sx_inf_mass'):
+            mass = Mass(sx_inf_mass)
+            self.client.mass_cache.store(key, part, mass)
+            return mass
 
         return None
 
@@ -3094,7 +3482,7 @@ class PartCommand(BaseCommand):
 
         element = self.send(command, 'part.put.xml')
         parts = []
-        for sx_ent in element.xpath('./element'):
+        for sx_ent in element.findall('element'):
             part2 = Part(self.client, part.model_id, part.wfno)
             part2.from_ent( PartCommand.Data(sx_ent) )
             parts.append(part2)
@@ -3103,15 +3491,46 @@ class PartCommand(BaseCommand):
 
     def get_materials(self, part: Part):
         part.material = []
-        body_types = CadTypes.Entity().body_types()
+        body_types = CadTypes.Entity.body_types()
         bodies = [ entity for entity in self.get_entities(part).values() if entity.type in body_types ]
         if len(bodies) == 0:
             return
         elemenet = self.send(';JVUEN2\n' + '\n'.join([f'.KIND 0 .ENTID {body.id} :' for body in bodies]) + '\n;@GO;@JVEND', 'part.get_materials.xml')
-        for sx_inf_mat in elemenet.xpath('./sx_inf_mat'):
+        for sx_inf_mat in elemenet.findall('sx_inf_mat'):
             part.material.append( Material(sx_inf_mat) )
         return part.material
 
+    def get_materials_list(self, parts: list[Part], chunk_size: int = 1000) -> dict[int, list[Material]]:
+        # 部品ごとの get_entities + JVUEN2 の代わりに、要素取得と材質取得をそれぞれ一括で行う
+        body_types = CadTypes.Entity.body_types()
+        parts_dict = { part.id : part for part in parts }
+        owners: dict[int, int] = {}
+        for part in parts:
+            part.material = []
+
+        if 0 in parts_dict:
+            for entity in self.get_entities( parts_dict[0] ).values():
+                if entity.type in body_types:
+                    owners[entity.id] = 0
+
+        part_ids = [ part_id for part_id in parts_dict if part_id != 0 ]
+        for i in range(0, len(part_ids), chunk_size):
+            element = self.send(';JVUEN2\n' + '\n'.join([ f'.KIND 2 .ENTID {part_id} :' for part_id in part_ids[i : i + chunk_size] ]) + '\n;@GO;@JVEND', 'part.get_materials_list_entities.xml')
+            for sx_ent in element.iterfind('sx_ent'):
+                data = EntityCommand.Data(sx_ent)
+                if data.type in body_types and data.part_id in parts_dict:
+                    owners[data.id] = data.part_id
+
+        body_ids = list(owners)
+        for i in range(0, len(body_ids), chunk_size):
+            element = self.send(';JVUEN2\n' + '\n'.join([ f'.KIND 0 .ENTID {body_id} :' for body_id in body_ids[i : i + chunk_size] ]) + '\n;@GO;@JVEND', 'part.get_materials_list.xml')
+            for sx_inf_mat in element.iterfind('sx_inf_mat'):
+                material = Material(sx_inf_mat)
+                if material.id in owners:
+                    parts_dict[ owners[material.id] ].material.append(material)
+
+        return { part.id : part.material for part in parts }
+
     def set_material(self, part: Part, material: Material):
         if material is None:
             command  = f';VOL3D;SET0;DEL1\n@WINID ID {part.id} VISI 6 IDEND\n@GO'
@@ -3137,7 +3556,7 @@ class PartCommand(BaseCommand):
     def get_hole_infos(self, entities: list[Entity]):
         elemenet = self.send(';JVUEN2\n' + '\n'.join([f'.KIND 14 .ENTID {entity.id} :\n' for entity in entities ]) + '\n;@GO;@JVEND', 'part.set_material.xml')
         holes = { entity.id : [] for entity in entities }
-        for sx_inf_hole in elemenet.xpath('./sx_inf_hole'):
+        for sx_inf_hole in elemenet.findall('sx_inf_hole'):
             hole = Hole()
             hole.from_inf( HoleCommand.Data(sx_inf_hole) )
             holes[hole.id].append(hole)
@@ -3148,7 +3567,7 @@ class PartCommand(BaseCommand):
         message_command = '.MSG /NO  /\n'
         if same_name:
             elemenet = self.send(f';JVUENT .KIND 10 .ENTID {part.id} : ;@JVEND', 'part.take_in.xml')
-            if len( elemenet.xpath('sx_ent') ) > 0:
+            if len( elemenet.findall('sx_ent') ) > 0:
                 message_command = '.MSG /ALL /\n'
 
         command  = f';TD4MOD;OUTCHG\n@I{"ON" if all_level else "OFF"};ALLLEV\n@PICKID ID {part.id} IDEND\n;@GO\n'
@@ -3162,7 +3581,7 @@ class PartCommand(BaseCommand):
     def take_out(self, part: Part, is_all: bool, path: Path):
         if is_all:
             elemenet = self.send(f';JVUENT .KIND 10 .ENTID {part.id} : ;@JVEND', 'part.take_out.xml')
-            if len( elemenet.xpath('sx_ent') ) > 0:
+            if len( elemenet.findall('sx_ent') ) > 0:
                 message_command = '.MSG /ALL /\n'
             else:
                 message_command = '.MSG /NO  /\n'
@@ -3186,7 +3605,7 @@ class PartCommand(BaseCommand):
 
     def get_extent(self, part: Part):
         element = self.send(f';JVBOX .ID {part.id} : ;@JVEND', 'part.create_3d_point.xml')
-        for sx_box in element.xpath('./sx_box'):
+        for sx_box in element.findall('sx_box'):
             points = [ [ float(sx_box.get(f'{j}{i}')) for j in ['x', 'y', 'z'] ] for i in ['1', '2'] ]
             _id = int( sx_box.get('id') )
             return points
@@ -3201,7 +3620,7 @@ class PartCommand(BaseCommand):
 class SystemCommand(BaseCommand):
     
     class Data:
-        def __init__(self, client: 'Client', element: etree._Element) -> None:
+        def __init__(self, client: 'Client', element: etree._Element, models: dict[int, Model] = None, active_only: bool = False) -> None:
             self.version                 = int( element.get('version', '-1') )
             self.level                   = int( element.get('level', '-1') )
             self.path: str               = element.get('path', '')
@@ -3223,32 +3642,45 @@ class SystemCommand(BaseCommand):
             self.active_part: Part       = None 
             self.active_model: Model     = None
             self.model: dict[int, Model] = {}
+            self.is_partial: bool        = active_only
 
-            for sx_ent in element.xpath('./sx_ent'):
+            for sx_ent in element.findall('sx_ent'):
                 self.active_part = Part(client, self.active_model_id)
                 self.active_part.from_ent( PartCommand.Data(sx_ent) )
                 self.active_part.get_inf()
                 self.active_part.get_parent()
                 break
 
-            for sx_model in element.xpath('./sx_model'):
+            # 既に読み込んでいるモデルは作り直さない (Model の生成は往復が多い)
+            for sx_model in element.findall('sx_model'):
                 model_id = int( sx_model.get('model_id', '0') )
-                self.model[model_id] = Model(client, model_id)
+                if active_only and model_id != self.active_model_id:
+                    continue
+                if models is not None and model_id in models:
+                    self.model[model_id] = models[model_id]
+                else:
+                    self.model[model_id] = Model(client, model_id)
                 if model_id == self.active_model_id:
                     self.active_model = self.model[model_id]
 
-    def system_data(self, element: etree._Element):
-        return SystemCommand.Data(self.client, element)
+    def __init__(self, client: 'Client') -> None:
+        super().__init__(client)
+        self.material_table: dict[str, Material] = None
+
+    def system_data(self, element: etree._Element, models: dict[int, Model] = None, active_only: bool = False):
+        return SystemCommand.Data(self.client, element, models, active_only)
 
-    def get_inf_sys(self):
+    def get_inf_sys(self, models: dict[int, Model] = None, active_only: bool = False):
         element = self.send(';JVGSIF;GXDMY;@JVEND', 'system.get_inf_sys.xml')
-        for sx_inf_sys in element.xpath('./sx_inf_sys'):
-            return SystemCommand.Data(self.client, sx_inf_sys)
+        for sx_inf_sys in element.findall('sx_inf_sys'):
+            return SystemCommand.Data(self.client, sx_inf_sys, models, active_only)
 
     def open_model(self, cad: PyCadSx, path: Path, read_only: bool = False, password: str = None):
-        model_paths = [ Path(model.path)/f'{model.name}.icd' for model in cad.model.values() ]
-        if path in model_paths:
-            return
+        # 既に開いている場合は読み込まずにそのモデルを返す (新しく開いた場合は None)
+        cad.refresh_models()
+        for model in cad.model.values():
+            if Path(model.path)/f'{model.name}.icd' == path:
+                return model
         password = "        " if password is None or password == "" else password
         command  = f";GXDMY;OPEN;LOD .FILE /{path.stem}/\n"
         command += f'.PASSWD /{password}/\n'
@@ -3256,19 +3688,31 @@ class SystemCommand(BaseCommand):
         command += f'.OPMODE /{1 if read_only else 0}/\n'
         command += ';GXDMY;@JVEND'
         self.send(command, 'pycadsx.open_model.xml')
+        self.client.windows.clear()
+        self.client.extra_info_cache.clear()
 
     def get_materials(self):
         materials: list[Material] = []
         data = self.send(';JVGMAT;@JVEND', 'get_inf_materials.xml')
-        for sx_inf_mat in data.xpath('./sx_inf_mat'):
+        for sx_inf_mat in data.findall('sx_inf_mat'):
             materials.append(Material(sx_inf_mat))
+        self.material_table = { material.matid : material for material in materials }
         return materials
 
+    def get_material_table(self, refresh: bool = False) -> dict[str, Material]:
+        # 材質マスタは変わらないので1回だけ取得して matid で引けるようにしておく
+        if self.material_table is None or refresh:
+            self.get_materials()
+        return self.material_table
+
+    def find_material(self, matid: str) -> Material | None:
+        return self.get_material_table().get(matid)
+
     def get_local_font(self, font_name: str):
         font_name = self.client.string_to_base64string(font_name)
         element = self.send(f';JVFONT /{font_name}/ ;@JVEND', 'pycadsx.get_local_font.xml')
         text = ''
-        for sx_str in element.xpath('./sx_str'):
+        for sx_str in element.findall('sx_str'):
             text += sx_str.text if sx_str.text is not None else ''
         return text
     
@@ -3278,10 +3722,10 @@ class SystemCommand(BaseCommand):
         element = self.send(';JVPLOT;@JVEND', 'pycadsx.get_plotters.xml')
         default_plotter_number = 'PLOT01'
         
-        for sx_inf_def_plot in element.xpath('./sx_inf_def_plot'):
+        for sx_inf_def_plot in element.findall('sx_inf_def_plot'):
             default_plotter_number = sx_inf_def_plot.get('no')
 
-        for sx_inf_plot_list in element.xpath('./sx_inf_plot_list'):
+        for sx_inf_plot_list in element.findall('sx_inf_plot_list'):
             plotters.append( Plotter(sx_inf_plot_list) )
             if plotters[-1].no == default_plotter_number:
                 default_plotter = plotters[-1]
@@ -3293,7 +3737,7 @@ class WindowCommand(BaseCommand):
     
     class Info:
         def __init__(self, element: etree._Element) -> None:
-            for sx_inf_pd in element.xpath('./sx_inf_pd'):
+            for sx_inf_pd in element.findall('sx_inf_pd'):
                 self.is_base  = sx_inf_pd.get('is_base') == '1'
                 self.model_id = int( sx_inf_pd.get('model_id') )
                 self.vsno     = int( sx_inf_pd.get('vsno') )
@@ -3324,18 +3768,23 @@ class WindowCommand(BaseCommand):
         self.send(f'@ZOOM {ratio} : ;@JVEND', 'window.zoom_rasio.xml')
 
     def set_dimension(self, window: Window, is3d: bool):
+        # 2D/3D は GUI でも変えられるので、毎回ウィンドウの状態を問い合わせて必要な時だけ切り替える
         self.get_inf(window)
         if is3d and window.vsno != 0:
             self.send(';DIMSW1 @GO ;@JVEND', 'window.set_dimension.xml')
 
         if not is3d and window.wfno != 0:
             self.send(';DIMSW1 @GO ;@JVEND', 'window.set_dimension.xml')
+        window.invalidate()
 
     def close(self, window: Window):
         if window.is_base:
             self.send(f';WKSCR1 {window.pdno} ;CLOSE ;CLS .MSG /NO/ ;GXDMY;@JVEND', 'window.close.xml')
+            self.client.windows.discard_model(window.model_id)
+            self.client.extra_info_cache.clear(window.model_id)
         else:
             self.send(f';@XSCLOS {window.pdno} ;@JVEND', 'window.close.xml')
+        self.client.windows.discard_window(window.pdno)
 
     def rotate(self, window: Window, zvec: list, xvec: list):
         self.send(f'@RMSET /{window.pdno}/ /{xvec[0]:.15f}/ /{xvec[1]:.15f}/ /{xvec[2]:.15f}/ /{zvec[0]:.15f}/ /{zvec[1]:.15f}/ /{zvec[2]:.15f}/ ;@JVEND')
@@ -3351,12 +3800,17 @@ class WindowCommand(BaseCommand):
     
     def switch_dimension(self):
         self.send(f';DIMSW1 @GO : ;@JVEND')
+        self.client.windows.invalidate_infs()
     
     def set_vs(self, window: Window, model_id: int, vsno: int):
         self.send(f';JVUVW .KIND 8 .SXDIM 2 .MODEL {model_id} .VWNO {vsno} .NUM0 {window.pdno} : ;@JVEND')
+        self.client.windows.discard_window(window.pdno)
+        window.invalidate()
 
     def set_wf(self, window: Window, model_id: int, wfno: int):
         self.send(f';JVUVW .KIND 8 .SXDIM 3 .MODEL {model_id} .VWNO {wfno} .NUM0 {window.pdno} : ;@JVEND')
+        self.client.windows.discard_window(window.pdno)
+        window.invalidate()
     
     def set_system_view(self, view: 'CadTypes.Window.View'):
         if view == CadTypes.Window.View.TOP:
@@ -3393,7 +3847,7 @@ class WindowCommand(BaseCommand):
 
     def get_virtual_position(self, window: Window, point: list[float]):
         element = self.send(f';JVGPSV .PDNO {window.pdno} .SCX {point[0]} .SCY {point[1]} : ;@JVEND', 'window.get_virtual_position.xml')
-        for sx_pos in element.xpath('./sx_pos'):
+        for sx_pos in element.findall('sx_pos'):
             return [ float(sx_pos.get('x')), float(sx_pos.get('y')), float(sx_pos.get('z')) ]
 
 class Calculate:
@@ -3413,40 +3867,50 @@ class Calculate:
     def is_point_in_rect(self, point: list[float], rect: list[list[float]]):
         return rect[0][0] <= point[0] <= rect[1][0] and rect[0][1] <= point[1] <= rect[1][1]
 
+    def surface_normal(self, geometry: BaseGeometry, point: list[float]):
+        if type(geometry) is Plane:
+            return self.normalize(geometry.matrix[2])
+        if point is None or type(geometry) not in [ Sphere, Cylinder, Cone, Torus ]:
+            return [ math.nan ] * 3
+        v = [ point[i] - geometry.origin[i] for i in range(3) ]
+        if type(geometry) is Sphere:
+            n = self.normalize(v)
+        else:
+            axis = self.normalize(geometry.matrix[2])
+            d = sum([ v[i] * axis[i] for i in range(3) ])
+            radial = self.normalize([ v[i] - d * axis[i] for i in range(3) ])
+            if type(geometry) is Cylinder:
+                n = radial
+            elif type(geometry) is Cone:
+                angle = math.radians(geometry.half_angle)
+                n = self.normalize([ radial[i] * math.cos(angle) - axis[i] * math.sin(angle) for i in range(3) ])
+            else:
+                center = [ geometry.origin[i] + radial[i] * geometry.max_radius for i in range(3) ]
+                n = self.normalize([ point[i] - center[i] for i in range(3) ])
+        if not geometry.orient:
+            n = [ -n[0], -n[1], -n[2] ]
+        return n
+
     def find_unique_point(self, rects: list[list[list[float]]], target_rect: list[list[float]], step=2.0):
-        x_min, y_min = target_rect[0]
-        x_max, y_max = target_rect[1]
-        
-        x_min, y_min = x_min + 1, y_min + 1
-        x_max, y_max = x_max - 1, y_max - 1
-        
-        x = x_min
-        while x <= x_max:
-            y = y_min
-            while y <= y_max:
-                point = [x, y]
-                if self.is_point_in_rect(point, target_rect):
-                    in_other_rects = False
-                    for rect in rects:
-                        if rect != target_rect and self.is_point_in_rect(point, rect):
-                            in_other_rects = True
-                            break
-                    if not in_other_rects:
-                        return point
-                y += step
-            x += step
-        
-        return None
+        area = [ [ target_rect[0][0] + 1, target_rect[0][1] + 1 ], [ target_rect[1][0] - 1, target_rect[1][1] - 1 ] ]
+        if area[0][0] > area[1][0] or area[0][1] > area[1][1]:
+            return None
+        placer = LabelPlacer([ rect for rect in rects if rect != target_rect ], area, step)
+        point = placer.find_point()
+        if point is None:
+            point = placer.find_position([ 0.0, 0.0 ], margin=1e-6)
+        return point
 
 
 class Client:
-    def __init__(self, is_debug=False, host='localhost', port=3999, encoding='utf-16le'):
+    def __init__(self, is_debug=False, host='localhost', port=3999, encoding='utf-16le', timeout: float = None):
         self.log_path                = Path(sys.argv[0]).parent / 'xml'
         self.send_string_template    = 'license=ON\nmode=__mode__\nret_ent=__ret_ent__\n__commands__\nSxMsg_End'
         self._is_debug               = is_debug
         self.host                    = host
         self.port                    = port
         self.encoding                = encoding
+        self.timeout                 = timeout
         self.system                  = SystemCommand(self)
         self.asm_plane               = AsmPlaneCommand(self)
         self.edge                    = EdgeCommand(self)
@@ -3458,6 +3922,11 @@ class Client:
         self.vs                      = VsCommand(self)
         self.window                  = WindowCommand(self)
         self.calculate               = Calculate()
+        self.extra_info_cache        = ExtraInfoCache()
+        self.loader                  = BatchLoader(self)
+        self.mass_cache              = MassCache()
+        self.windows                 = WindowRegistry(self)
+        self.config                  = CadConfig()
         
     def send(self, command: str, xml_file_name=None, is_recieve=True, is_macro=False, ret_ent=True) -> etree._Element:
         mode = 'COMMAND' if is_macro else 'MACRO,NODISP'
@@ -3473,6 +3942,7 @@ class Client:
         recieved_string = None
         
         _client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        _client.settimeout(self.timeout)
 
         try:
             _client.connect( (self.host, self.port) )
@@ -3511,7 +3981,7 @@ class Client:
 
                 element: etree._Element = etree.fromstring(recieved_string)
 
-                error = element.xpath('./sx_err')
+                error = element.findall('sx_err')
                 if error:
                     error: etree._Element = error[0]
                     ir_code = [ error.get('ir0'), error.get('ir1'), error.get('ir2') ]
@@ -3522,6 +3992,9 @@ class Client:
         
         return element
 
+    def flush(self):
+        self.loader.flush()
+
     def string_to_base64string(self, _string: str):
         _bytes = _string.replace('\n', '\r\n').replace('\r\r\n', '\r\n').encode('utf-16le')
         base64_data = base64.urlsafe_b64encode(_bytes)
@@ -3558,12 +4031,7 @@ class Client:
         return split_comments
 
     def get_language(self):
-        with open(f'{os.getenv("ICADDIR")}\\LANG\\Language', mode='r', encoding='cp932') as f:
-            language_lines = f.readlines()
-        for line in language_lines:
-            if line.startswith('ILANGID='):
-                return int( line.replace('ILANGID=', '') )
-        return 1
+        return self.config.get_language()
 
     def base64string_to_string(self, base64_string):
         b64decoded = base64.urlsafe_b64decode(base64_string)
@@ -0,0 +1,147 @@
+import threading
+import time
+import traceback
+from collections import deque
+import typing
+from pycadsx.client import Client
+
+
+class ClientPool:
+
+    class Result:
+        def __init__(self, index: int, item, status: str = 'ok', value=None, error: str = '', worker: int = -1, seconds: float = 0.0) -> None:
+            self.index   = index
+            self.item    = item
+            self.status  = status
+            self.value   = value
+            self.error   = error
+            self.worker  = worker
+            self.seconds = seconds
+
+        def __repr__(self):
+            return f'ClientPool.Result({self.item}, {self.status}, worker={self.worker})'
+
+    class Worker:
+        def __init__(self, no: int, client: Client) -> None:
+            self.no                  = no
+            self.client              = client
+            self.queue: deque[tuple] = deque()
+            self.is_alive            = True
+            self.done                = 0
+            self.stolen              = 0
+            self.error               = ''
+
+    def __init__(
+                self, addresses: list[tuple[str, int] | int], is_debug: bool = False, timeout: float = None,
+                max_retries: int = 2, health_command: str = ';JVGSIF;GXDMY;@JVEND', health_timeout: float = 10.0
+            ) -> None:
+        # timeout はジョブのコマンドに掛ける時間制限 (VOL3D や投影は長いので既定では無制限)
+        # インスタンスを外すかどうかは health_timeout 内にヘルスチェックに応答するかで決める
+        self.max_retries                        = max_retries
+        self.health_command                     = health_command
+        self.health_timeout                     = health_timeout
+        self.lock                               = threading.Lock()
+        self.workers: list['ClientPool.Worker'] = []
+        for no, address in enumerate(addresses):
+            host, port = ('localhost', address) if isinstance(address, int) else address
+            self.workers.append( ClientPool.Worker(no, Client(is_debug, host, port, timeout=timeout)) )
+
+    def __len__(self):
+        return len(self.workers)
+
+    def is_healthy(self, client: Client):
+        # クライアントは各ワーカーのスレッドだけが使うので一時的に時間制限を差し替えてよい
+        timeout = client.timeout
+        client.timeout = self.health_timeout
+        try:
+            return client.send(self.health_command, 'pool.health.xml') is not None
+        except Exception:
+            return False
+        finally:
+            client.timeout = timeout
+
+    def check(self):
+        # 応答しないインスタンスは以降のジョブ割り当てから外す
+        for worker in self.workers:
+            if worker.is_alive and not self.is_healthy(worker.client):
+                worker.is_alive = False
+                worker.error = 'health check failed'
+        return [ worker.no for worker in self.workers if worker.is_alive ]
+
+    def next_job(self, worker: 'ClientPool.Worker'):
+        with self.lock:
+            if worker.queue:
+                return worker.queue.popleft()
+            # 自分のキューが空になったら一番残りの多いキューの末尾から奪う
+            victims = [ w for w in self.workers if w is not worker and w.queue ]
+            if not victims:
+                return None
+            victim = max(victims, key=lambda w: len(w.queue))
+            worker.stolen += 1
+            return victim.queue.pop()
+
+    def requeue(self, job: tuple):
+        with self.lock:
+            alive = [ w for w in self.workers if w.is_alive ]
+            if not alive:
+                return False
+            min(alive, key=lambda w: len(w.queue)).queue.append(job)
+            return True
+
+    def run_worker(self, worker: 'ClientPool.Worker', function, results: list):
+        while worker.is_alive:
+            job = self.next_job(worker)
+            if job is None:
+                return
+            index, item, retries = job
+            start = time.perf_counter()
+            try:
+                value = function(worker.client, item)
+                results[index] = ClientPool.Result(index, item, 'ok', value, '', worker.no, time.perf_counter() - start)
+                worker.done += 1
+            except Exception as e:
+                error = f'{e}\n{traceback.format_exc()}'
+                if self.is_healthy(worker.client):
+                    results[index] = ClientPool.Result(index, item, 'error', None, error, worker.no, time.perf_counter() - start)
+                    continue
+                # インスタンスが落ちた場合は他のインスタンスでやり直す
+                worker.is_alive = False
+                worker.error = error
+                if retries >= self.max_retries or not self.requeue( (index, item, retries + 1) ):
+                    results[index] = ClientPool.Result(index, item, 'error', None, error, worker.no, time.perf_counter() - start)
+
+    def map(self, function: typing.Callable[[Client, typing.Any], typing.Any], items: list, check: bool = True) -> list['ClientPool.Result']:
+        items = list(items)
+        results: list[ClientPool.Result] = [ None ] * len(items)
+        alive = self.check() if check else [ worker.no for worker in self.workers if worker.is_alive ]
+        if not alive:
+            raise Exception('no CAD instance is available')
+
+        for worker in self.workers:
+            worker.queue.clear()
+        for i, item in enumerate(items):
+            self.workers[ alive[i % len(alive)] ].queue.append( (i, item, 0) )
+
+        # 他のスレッドが終了した後に再投入されたジョブがあればもう一巡する
+        while any([ worker.queue for worker in self.workers ]) and any([ worker.is_alive for worker in self.workers ]):
+            threads = [
+                threading.Thread(target=self.run_worker, args=(worker, function, results), daemon=True)
+                for worker in self.workers if worker.is_alive
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # 全インスタンスが落ちて残ったジョブ
+        for worker in self.workers:
+            while worker.queue:
+                index, item, _ = worker.queue.popleft()
+                results[index] = ClientPool.Result(index, item, 'error', None, 'no CAD instance is available')
+        return results
+
+    def values(self, results: list['ClientPool.Result']):
+        return [ result.value for result in results ]
+
+    def failures(self, results: list['ClientPool.Result']):
+        return [ result for result in results if result.status != 'ok' ]
@@ -0,0 +1,92 @@
+import os
+from pathlib import Path
+
+
+class IniFileParser:
+
+    # パス毎に (更新時刻, 解析結果) を持っておき、ファイルが変わった時だけ読み直す
+    cache: dict[str, tuple[int, 'IniFileParser']] = {}
+
+    @classmethod
+    def load(cls, filepath: Path) -> 'IniFileParser':
+        key    = str(filepath)
+        mtime  = os.stat(filepath).st_mtime_ns
+        cached = cls.cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        parser = cls(filepath)
+        cls.cache[key] = (mtime, parser)
+        return parser
+
+    def __init__(self, filepath: Path) -> None:
+        # セクションより前に書かれたキーは '' のセクションに入れる
+        section    = ''
+        self._data = { section : {} }
+        with open(filepath, encoding='cp932') as f:
+            text = f.read()
+        for line in text.splitlines():
+            if line == '' or line.startswith(';') or line.startswith('；'):
+                continue
+            elif line.startswith('[') and line.endswith(']'):
+                section = line[1:-1]
+                self._data[section] = {}
+            else:
+                key, _, value = line.partition('=')
+                self._data[section][key] = value
+
+    def __getitem__(self, key) -> dict:
+        return self._data.get(key, {})
+
+    def get(self, key) -> dict:
+        return self.__getitem__(key)
+
+    def sections(self) -> list[str]:
+        return [ section for section in self._data if section != '' or self._data[section] ]
+
+
+class CadConfig:
+    def __init__(self, icaddir: Path | str = None) -> None:
+        # None の場合は参照する度に環境変数 ICADDIR を見る
+        self._icaddir = icaddir
+
+    @property
+    def icaddir(self) -> Path:
+        icaddir = self._icaddir if self._icaddir is not None else os.getenv('ICADDIR')
+        if icaddir is None:
+            raise Exception('ICADDIR is not set')
+        return Path(icaddir)
+
+    @property
+    def ini_path(self) -> Path:
+        return self.icaddir / 'ETC' / 'ICAD.ini'
+
+    @property
+    def language_path(self) -> Path:
+        return self.icaddir / 'LANG' / 'Language'
+
+    @property
+    def ini(self) -> IniFileParser:
+        return IniFileParser.load(self.ini_path)
+
+    @property
+    def language(self) -> IniFileParser:
+        return IniFileParser.load(self.language_path)
+
+    def get_language(self) -> int:
+        # 1 : 日本語
+        language = self.language
+        value = language.get('LANGUAGE').get('ILANGID')
+        if value is None:
+            values = [ language.get(section)['ILANGID'] for section in language.sections() if 'ILANGID' in language.get(section) ]
+            value = values[0] if values else '1'
+        return int(value)
+
+    def is_japanese(self) -> bool:
+        return self.get_language() == 1
+
+    def get_part_info_tab_names(self) -> list[str]:
+        parts_info = self.ini.get('@PARTSINFO')
+        return [ parts_info.get(f'TAB_NAME{i}') for i in range(1, 5) ]
+
+    def get_model_info_titles(self) -> list[str]:
+        return ['設計情報', '加工情報', '組付情報'] + self.get_part_info_tab_names()
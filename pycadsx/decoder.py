@@ -0,0 +1,66 @@
+import math
+
+
+def flag(value: str):
+    return value != '0'
+
+
+def raw(value: str):
+    return value
+
+
+def degree(value: str):
+    return float(value) / math.pi * 180.0
+
+
+def enum(cls):
+    # MyIntEnum.get_value と同じく未知の値は int のまま返す
+    members = cls._value2member_map_
+    def function(value: str):
+        value = int(value)
+        return members.get(value, value)
+    return function
+
+
+def xyz(prefix: str = '', suffix: str = ''):
+    return tuple([ f'{prefix}{axis}{suffix}' for axis in ['x', 'y', 'z'] ])
+
+
+def matrix3(prefix: str = ''):
+    return tuple([ xyz(f'{prefix}{axis}') for axis in ['x', 'y', 'z'] ])
+
+
+class Decoder:
+    def __init__(self, fields: list[tuple]) -> None:
+        # (属性名, XML の属性名 または 属性名のタプル, 変換関数, 既定値)
+        self.raw_fields = list(fields)
+        self.names      = [ field[0] for field in fields ]
+        # 既定値を省略したフィールドは None を既定値にしておく (element.get と同じ)
+        # 属性名が1つのフィールドとタプルのフィールドは分けておき、ループ中で判定しない
+        fields          = [ (field[0], field[1], field[2], field[3] if len(field) > 3 else None) for field in fields ]
+        self.fields     = [ field for field in fields if not isinstance(field[1], tuple) ]
+        self.tuples     = [ field for field in fields if isinstance(field[1], tuple) ]
+
+    def extend(self, fields: list[tuple]):
+        return Decoder(self.raw_fields + list(fields))
+
+    def slots(self, base: 'Decoder' = None):
+        # 基底クラスの __slots__ にある属性は除く
+        names = base.names if base is not None else []
+        return tuple([ name for name in self.names if name not in names ])
+
+    def read(self, get, key, function, default):
+        # 属性名のタプルはリストにして返す (入れ子のタプルは入れ子のリスト)
+        return [ self.read(get, k, function, default) if isinstance(k, tuple) else function(get(k, default)) for k in key ]
+
+    def decode(self, element, target):
+        if element is None:
+            for name in self.names:
+                setattr(target, name, None)
+            return target
+        get = element.get
+        for name, key, function, default in self.fields:
+            setattr(target, name, function(get(key, default)))
+        for name, key, function, default in self.tuples:
+            setattr(target, name, self.read(get, key, function, default))
+        return target
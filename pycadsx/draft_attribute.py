@@ -2,42 +2,49 @@ from lxml import etree
 
 
 class DraftAttribute:
+    __slots__ = (
+        'general', 'word_dimension', 'word_1', 'word_2', 'word_3', 'notation', 'smark', 'balloon', 'welding',
+        'geometric_tolerance', 'dimension_form', 'append_dimension'
+    )
+
     def __init__(self, element: etree._Element) -> None:
-        for sx_draft_atr_general in element.xpath('./sx_draft_atr_general'):
+        for sx_draft_atr_general in element.findall('sx_draft_atr_general'):
             self.general = General(sx_draft_atr_general)
             
-        for sx_draft_atr_word in element.xpath('./sx_draft_atr_word'):
-            sx_draft_atr_texts = sx_draft_atr_word.xpath('./sx_draft_atr_text')
+        for sx_draft_atr_word in element.findall('sx_draft_atr_word'):
+            sx_draft_atr_texts = sx_draft_atr_word.findall('sx_draft_atr_text')
             self.word_dimension = Word(sx_draft_atr_texts[0])
             self.word_1 = Word(sx_draft_atr_texts[1])
             self.word_2 = Word(sx_draft_atr_texts[2])
             self.word_3 = Word(sx_draft_atr_texts[3])
 
-        for sx_draft_atr_notation in element.xpath('./sx_draft_atr_notation'):
+        for sx_draft_atr_notation in element.findall('sx_draft_atr_notation'):
             self.notation = Notation(sx_draft_atr_notation)
 
-        for sx_draft_atr_smark in element.xpath('./sx_draft_atr_smark'):
-            self.smark = Word(sx_draft_atr_smark.xpath('./sx_draft_atr_text')[0])
+        for sx_draft_atr_smark in element.findall('sx_draft_atr_smark'):
+            self.smark = Word(sx_draft_atr_smark.findall('sx_draft_atr_text')[0])
 
-        for sx_draft_atr_balloon in element.xpath('./sx_draft_atr_balloon'):
+        for sx_draft_atr_balloon in element.findall('sx_draft_atr_balloon'):
             self.balloon = Balloon(sx_draft_atr_balloon)
             
-        for sx_draft_atr_weld in element.xpath('./sx_draft_atr_weld'):
+        for sx_draft_atr_weld in element.findall('sx_draft_atr_weld'):
             self.welding = Welding(sx_draft_atr_weld)
             
-        for sx_draft_atr_geotol in element.xpath('./sx_draft_atr_geotol'):
+        for sx_draft_atr_geotol in element.findall('sx_draft_atr_geotol'):
             self.geometric_tolerance = GeometricTolerance(sx_draft_atr_geotol)
             
-        for sx_draft_atr_dimform in element.xpath('./sx_draft_atr_dimform'):
+        for sx_draft_atr_dimform in element.findall('sx_draft_atr_dimform'):
             self.dimension_form = DimensionForm(sx_draft_atr_dimform)
             
-        for sx_draft_appdim in element.xpath('./sx_draft_appdim'):
+        for sx_draft_appdim in element.findall('sx_draft_appdim'):
             self.append_dimension = AppendDimension(sx_draft_appdim)
 
 
 class AppendDimension:
+    __slots__ = ( 'finish_mark_len', 'delta_len', 'word_arron', 'word_cutline' )
+
     def __init__(self, element: etree._Element) -> None:
-        sx_draft_atr_text = element.xpath('./sx_draft_atr_text')
+        sx_draft_atr_text = element.findall('sx_draft_atr_text')
         self.finish_mark_len = float(element.get('finish_mark_len'))
         self.delta_len = float(element.get('delta_len'))
         self.word_arron = Word(sx_draft_atr_text[0])
@@ -45,6 +52,10 @@ class AppendDimension:
 
 
 class DimensionForm:
+    __slots__ = (
+        'dimval_space', 'note_underline_len', 'underline1_len', 'underline2_len', 'step_space', 'prog_diameter', 'prog_space', 'prog_bend_width', 'note_space'
+    )
+
     def __init__(self, element: etree._Element) -> None:
         self.dimval_space = float(element.get('dimval_space'))
         self.note_underline_len = float(element.get('note_underline_len'))
@@ -58,14 +69,21 @@ class DimensionForm:
 
 
 class GeometricTolerance:
+    __slots__ = ( 'frame_ratio', 'datum_ratio', 'datum_fill', 'word' )
+
     def __init__(self, element: etree._Element) -> None:
         self.frame_ratio = float(element.get('frame_ratio'))
         self.datum_ratio = float(element.get('datum_ratio'))
         self.datum_fill = element.get('datum_fill') != '0'
-        self.word = Word(element.xpath('./sx_draft_atr_text')[0])
+        self.word = Word(element.findall('sx_draft_atr_text')[0])
 
 
 class Welding:
+    __slots__ = (
+        'route_ratio', 'ang_ratio', 'form_cir_ratio', 'form_site_ratio', 'form_base_ratio', 'form_baseline_head_ratio',
+        'form_baseline_tail_ratio', 'form_tail_ratio', 'word'
+    )
+
     def __init__(self, element: etree._Element) -> None:
         self.route_ratio = float(element.get('route_ratio'))
         self.ang_ratio = float(element.get('ang_ratio'))
@@ -75,17 +93,23 @@ class Welding:
         self.form_baseline_head_ratio = float(element.get('form_baseline_head_ratio'))
         self.form_baseline_tail_ratio = float(element.get('form_baseline_tail_ratio'))
         self.form_tail_ratio = float(element.get('form_tail_ratio'))
-        self.word = Word(element.xpath('./sx_draft_atr_text')[0])
+        self.word = Word(element.findall('sx_draft_atr_text')[0])
 
 
 class Balloon:
+    __slots__ = ( 'diameter', 'auto_size', 'word' )
+
     def __init__(self, element: etree._Element) -> None:
         self.diameter = float( element.get('diameter', 0.0) )
         self.auto_size = element.get('auto_size') != '0'
-        self.word = Word(element.xpath('./sx_draft_atr_text')[0])
+        self.word = Word(element.findall('sx_draft_atr_text')[0])
 
 
 class General:
+    __slots__ = (
+        'color', 'width', 'aidline_extlen', 'aidline_space', 'aidline_tilt', 'arrow_type', 'disp_baseline', 'arrow_width', 'arrow_ang', 'dot_diam'
+    )
+
     def __init__(self, element: etree._Element) -> None:
         self.color          = int(element.get('color'))
         self.width          = int(element.get('width'))
@@ -100,6 +124,8 @@ class General:
 
 
 class Word:
+    __slots__ = ( 'font', 'font_name', 'height', 'width_ratio', 'tilt', 'space_ratio', 'row_space', 'color', 'width' )
+
     def __init__(self, element: etree._Element) -> None:
         self.font = element.get('font') != '0'
         self.font_name = element.get('font_name')
@@ -113,6 +139,11 @@ class Word:
 
 
 class Notation:
+    __slots__ = (
+        'rouway', 'round', 'suppress', 'multiple_mode', 'multiple', 'dimtol1_ratio', 'dimtol2_ratio', 'dimtol2_space',
+        'dimtol_pos', 'angtype', 'dispang', 'dispang_angdim', 'dimval_scale'
+    )
+
     def __init__(self, element: etree._Element) -> None:
         self.rouway = int(element.get('rouway'))
         self.round = int(element.get('round'))
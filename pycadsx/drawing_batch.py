@@ -0,0 +1,87 @@
+import time
+from pathlib import Path
+import typing
+if typing.TYPE_CHECKING:
+    from pycadsx.pycadsx import PyCadSx
+from pycadsx.cadtypes import CadTypes
+from pycadsx.checkpoint import Checkpoint
+from pycadsx.model import Model
+
+
+class DrawingBatch:
+
+    Result = Checkpoint.Result
+
+    def __init__(
+                self, cad: 'PyCadSx', scale: float, views: list[CadTypes.VS.View], template_path: Path = None,
+                margin: float = 20.0, checkpoint_path: Path = None, save: bool = False, close: bool = False
+            ) -> None:
+        self.cad                                  = cad
+        self.client                               = cad.client
+        self.scale                                = scale
+        self.views                                = views
+        self.template_path                        = Path(template_path) if template_path is not None else None
+        self.margin                               = margin
+        self.save                                 = save
+        self.close                                = close
+        self.checkpoint                           = Checkpoint(checkpoint_path)
+        self.results: list['DrawingBatch.Result'] = []
+        self.frame_command: str                   = None
+
+    def key(self, item: Model | Path | str):
+        if isinstance(item, Model):
+            return str( Path(item.path) / f'{item.name}.icd' )
+        return str( Path(item) )
+
+    def open(self, item: Model | Path | str) -> Model:
+        if isinstance(item, Model):
+            self.cad.model_set_active(item)
+            return item
+        return self.cad.open_model( Path(item) )
+
+    def run(self, items: list[Model | Path | str], on_done: typing.Callable[['DrawingBatch.Result'], None] = None):
+        # 枠テンプレートのコマンドは全品目で共通なので1回だけ作る
+        if self.template_path is not None and self.frame_command is None:
+            self.frame_command = self.client.model.drawing_frame_command(self.template_path)
+
+        self.results = self.checkpoint.run(items, self.key, self.process, on_done)
+        return self.results
+
+    def process(self, item: Model | Path | str, timings: dict[str, float]):
+        model = self.stage(timings, 'open', self.open, item)
+        self.draw(model, timings)
+        if self.save:
+            self.stage(timings, 'save', model.save)
+        if self.close and not isinstance(item, Model):
+            self.stage(timings, 'close', model.close)
+
+    def stage(self, timings: dict[str, float], name: str, function, *args):
+        start = time.perf_counter()
+        result = function(*args)
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+        return result
+
+    def reset(self, model: Model):
+        # ビューや印刷枠が無いモデルでは削除コマンドを送らない
+        if any([ vs != model.vs_global for vs in model.vs_list ]):
+            model.delete_all_vs(True)
+        else:
+            model.vs_global.set_active()
+            entities = list( model.vs_global.get_entities(0, 0, True, True, True, True).values() )
+            model.delete_entities(entities)
+        print_infos = model.get_print_infos()
+        if len(print_infos) > 0:
+            model.delete_print_infos(print_infos)
+
+    def draw(self, model: Model, timings: dict[str, float]):
+        window = model.get_window()
+        window.set_dimension(True)
+        self.stage(timings, 'scale', model.set_scale, self.scale)
+        box = self.stage(timings, 'extent', model.get_extent)
+        self.stage(timings, 'reset', self.reset, model)
+        if self.frame_command is not None:
+            self.stage(timings, 'frame', model.set_drawing_frame, self.template_path, self.frame_command)
+        self.stage(timings, 'project', model.project_drawings, model.drawing_origins(box, self.views, self.margin))
+        model.vs_global.set_active()
+        self.stage(timings, 'scale', model.set_scale, self.scale)
+        self.stage(timings, 'fit', model.fit_views, self.margin)
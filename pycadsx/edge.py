@@ -4,6 +4,9 @@ if typing.TYPE_CHECKING:
 
 
 class Edge:
+
+    __slots__ = ( 'client', 'geometry', 'type', 'edge_type', 'id', 'csgsol', 'prmno', 'edgeno' )
+
     def __init__(self, client: 'Client'):
         self.client = client
         self.geometry = None
@@ -17,7 +20,8 @@ class Edge:
         self.edgeno    = data.edgeno
 
     def get_geometry(self):
-        self.client.edge.get_geometry(self.id, self.prmno, self.edgeno, self.csgsol)
+        self.geometry = self.client.edge.get_geometry(self.id, self.prmno, self.edgeno, self.csgsol)
+        return self.geometry
         
     def get_geometries(self, edges: list['Edge']):
         ids, prmnos, edgenos, csgsols = [], [], [], []
@@ -26,19 +30,22 @@ class Edge:
             prmnos.append(edge.prmno)
             edgenos.append(edge.edgeno)
             csgsols.append(edge.csgsol)
-        self.client.edge.get_geometries(ids, prmnos, edgenos, csgsols)
+        return self.client.edge.get_geometries(ids, prmnos, edgenos, csgsols)
 
     def get_end_points(self):
         return self.client.edge.get_end_points(self.id, self.prmno, self.edgeno, self.csgsol)
+
+    def defer_end_points(self):
+        return self.client.loader.defer('edge.end_points', self)
     
     def get_middle_point(self):
         return self.client.edge.get_middle_point(self.id, self.prmno, self.edgeno, self.csgsol)
 
     def get_on_point(self, point: list[float], read: bool):
-        return self.client.edge.get_on_point(self.id, self.prmno, self.edgeno, self.csgsol, self, point, read)
+        return self.client.edge.get_on_point(self.id, self.prmno, self.edgeno, self.csgsol, point, read)
         
     def get_mass(self):
-        self.client.edge.get_mass(self.id, self.prmno, self.edgeno, self.csgsol)
+        return self.client.edge.get_mass(self.id, self.prmno, self.edgeno, self.csgsol)
         
     def get_mass_list(self, edges: list['Edge']):
         ids, prmnos, edgenos, csgsols = [], [], [], []
@@ -47,13 +54,13 @@ class Edge:
             prmnos.append(edge.prmno)
             edgenos.append(edge.edgeno)
             csgsols.append(edge.csgsol)
-        self.client.edge.get_mass_list(ids, prmnos, edgenos, csgsols)
+        return self.client.edge.get_mass_list(ids, prmnos, edgenos, csgsols)
 
     def eval(self, point: list[float]):
         self.client.edge.eval(self.id, self.prmno, self.edgeno, self.csgsol, point)
 
     def get_face_list(self):
-        self.client.edge.get_face_list(self.id, self.prmno, self.edgeno, self.csgsol)
+        return self.client.edge.get_face_list(self.id, self.prmno, self.edgeno, self.csgsol)
         
     def get_face_list_from_edges(self, edges: list['Edge']):
         ids, prmnos, edgenos, csgsols = [], [], [], []
@@ -62,4 +69,4 @@ class Edge:
             prmnos.append(edge.prmno)
             edgenos.append(edge.edgeno)
             csgsols.append(edge.csgsol)
-        self.client.edge.get_face_list_from_edges(ids, prmnos, edgenos, csgsols)
+        return self.client.edge.get_face_list_from_edges(ids, prmnos, edgenos, csgsols)
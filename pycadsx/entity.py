@@ -9,6 +9,14 @@ from pycadsx.geometry import DimensionValue, DimensionLine
 
 
 class Entity:
+
+    # 要素は大量に作られるので属性辞書を持たせない
+    __slots__ = (
+        'client', 'geometry', 'edges', 'type', 'id', 'prmno', 'kind', 'part_id', 'is3d', 'userid', 'vswfno', 'layer', 'visi',
+        'is_25d', 'member_kind', 'prim_num', 'ent_len', 'model_id', 'grp_kind', 'cg_attr', 'profile_attr', 'arrow_id',
+        'body_type', 'vwtype', 'fc_state', 'is_transparent', 'is_draft'
+    )
+
     def __init__(self, client: 'Client'):
         self.client         = client
         self.geometry       = None
@@ -86,6 +94,9 @@ class Entity:
 
     def get_geometry(self):
         return self.client.entity.get_geometry(self.id, self.prmno)
+
+    def defer_geometry(self):
+        return self.client.loader.defer('entity.geometry', self)
         
     def edit_text(self, texts: list[str]):
         entity_data = self.client.entity.edit_text(self.type, self.id, self.prmno, self.visi, texts)
@@ -107,11 +118,15 @@ class Entity:
 
 
 class EntityGroup(Entity):
+    __slots__ = ()
+
     def __init__(self, data: etree._Element) -> None:
         super().__init__(data)
 
 
 class EntityRefer(Entity):
+    __slots__ = ()
+
     def __init__(self, data: etree._Element) -> None:
         super().__init__(data)
 
@@ -0,0 +1,120 @@
+from array import array
+from lxml import etree
+import typing
+if typing.TYPE_CHECKING:
+    from pycadsx.client import Client
+from pycadsx.cadtypes import CadTypes
+from pycadsx.entity import Entity, EntityFactory
+
+
+class EntityTable:
+
+    # field, sx_entinf attribute, array typecode (prmno は sx_ent の値)
+    columns_info = [
+        ('id',             'id',             'q'),
+        ('prmno',          'prmno',          'q'),
+        ('type',           'type',           'l'),
+        ('kind',           'kind',           'B'),
+        ('layer',          'layer',          'l'),
+        ('part_id',        'parts_id',       'q'),
+        ('model_id',       'model_id',       'l'),
+        ('userid',         'userid',         'q'),
+        ('vswfno',         'vswfno',         'l'),
+        ('member_kind',    'member_kind',    'l'),
+        ('prim_num',       'prim_num',       'l'),
+        ('ent_len',        'ent_len',        'q'),
+        ('grp_kind',       'grp_kind',       'l'),
+        ('cg_attr',        'cg_attr',        'l'),
+        ('profile_attr',   'profile_attr',   'l'),
+        ('arrow_id',       'arrow_id',       'q'),
+        ('body_type',      'body_type',      'l'),
+        ('vwtype',         'vwtype',         'l'),
+        ('fc_state',       'fc_state',       'l'),
+        ('is3d',           'dim',            'b'),
+        ('visi',           'visi',           'b'),
+        ('is_25d',         'is_25d',         'b'),
+        ('is_transparent', 'is_transparent', 'b'),
+        ('is_draft',       'is_draft',       'b'),
+    ]
+
+    kinds = { 0 : 0, 4 : 0, 5 : 0, 3 : 3, 6 : 6 }
+
+    def __init__(self, client: 'Client') -> None:
+        self.client  = client
+        self.columns = { field : array(typecode) for field, _, typecode in EntityTable.columns_info }
+        self.rows    = {}
+
+    def __len__(self):
+        return len(self.columns['id'])
+
+    def __getitem__(self, field: str) -> array:
+        return self.columns[field]
+
+    def append(self, sx_entinf: etree._Element, prmno: int = 0):
+        get = sx_entinf.get
+        for field, attribute, typecode in EntityTable.columns_info:
+            if field == 'prmno':
+                self.columns[field].append( int(prmno) )
+            elif field == 'kind':
+                kind = int( get('kind') )
+                if kind == 2:
+                    kind = 1 if get('grp_kind') != '0' else 2
+                self.columns[field].append( EntityTable.kinds.get(kind, kind) )
+            elif typecode == 'b':
+                self.columns[field].append( get(attribute) != '0' )
+            else:
+                self.columns[field].append( int( get(attribute) ) )
+        self.rows[ self.columns['id'][-1] ] = len(self) - 1
+
+    def extend(self, element: etree._Element, prmnos: dict[str, str] = None):
+        # sx_entinf には prmno が無いので JVUVW の sx_ent から id で引く
+        if prmnos is None:
+            prmnos = {}
+        for sx_entinf in element.iterfind('sx_entinf'):
+            self.append( sx_entinf, prmnos.get(sx_entinf.get('id'), 0) )
+
+    def row(self, entity_id: int) -> int | None:
+        return self.rows.get(entity_id)
+
+    def where(self, types: list[int] = None, layers: list[int] = None, part_ids: list[int] = None, kinds: list[int] = None, body_types: list[int] = None, visible: bool = None, rows: list[int] = None) -> list[int]:
+        if rows is None:
+            rows = range( len(self) )
+        for field, values in [
+            ('type', types), ('layer', layers), ('part_id', part_ids), ('kind', kinds), ('body_type', body_types)
+        ]:
+            if values is None:
+                continue
+            column, values = self.columns[field], set( [ int(value) for value in values ] )
+            rows = [ i for i in rows if column[i] in values ]
+        if visible is not None:
+            column = self.columns['visi']
+            rows = [ i for i in rows if column[i] == visible ]
+        return list(rows)
+
+    def ids(self, rows: list[int] = None) -> list[int]:
+        column = self.columns['id']
+        if rows is None:
+            return column.tolist()
+        return [ column[i] for i in rows ]
+
+    def entity(self, row: int) -> Entity:
+        columns = self.columns
+        entity_class = EntityFactory.class_.get(columns['kind'][row], Entity)
+        entity: Entity = entity_class(self.client)
+        for field, _, typecode in EntityTable.columns_info:
+            value = columns[field][row]
+            setattr(entity, field, bool(value) if typecode == 'b' else value)
+        entity.type      = CadTypes.Entity.get_type(entity.type)
+        entity.kind      = CadTypes.Entity.Kind.get_value(entity.kind)
+        entity.body_type = CadTypes.Entity.BodyType.get_value(entity.body_type)
+        entity.fc_state  = CadTypes.Entity.FcState.get_value(entity.fc_state)
+        return entity
+
+    def entities(self, rows: list[int] = None) -> dict[int, Entity]:
+        if rows is None:
+            rows = range( len(self) )
+        entities: dict[int, Entity] = {}
+        for row in rows:
+            entity = self.entity(row)
+            entities[entity.id] = entity
+        return entities
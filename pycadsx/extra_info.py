@@ -0,0 +1,45 @@
+import typing
+if typing.TYPE_CHECKING:
+    from pycadsx.part import Part
+
+
+class ExtraInfoCache:
+    def __init__(self) -> None:
+        self.states: dict[tuple[int, int], dict[str, str]] = {}
+
+    def key(self, part: 'Part'):
+        return (part.model_id, part.id)
+
+    def normalize(self, extra_info: dict[str, str]):
+        # サーバーに保存されるのは値が空でない User_* のみ
+        if not extra_info:
+            return {}
+        return {
+            key : value
+            for key, value in extra_info.items()
+            if (value != '') and (value is not None) and key.startswith('User_')
+        }
+
+    def get(self, part: 'Part') -> dict[str, str] | None:
+        return self.states.get( self.key(part) )
+
+    def store(self, part: 'Part', extra_info: dict[str, str]):
+        self.states[ self.key(part) ] = self.normalize(extra_info)
+
+    def is_changed(self, part: 'Part', extra_info: dict[str, str]):
+        state = self.get(part)
+        return state is None or state != self.normalize(extra_info)
+
+    def discard(self, part: 'Part'):
+        self.states.pop( self.key(part), None )
+
+    def discard_ids(self, ids: list[int]):
+        # 削除した要素の ID は再利用されることがあるので残さない
+        ids = set(ids)
+        self.states = { key : value for key, value in self.states.items() if key[1] not in ids }
+
+    def clear(self, model_id: int = None):
+        if model_id is None:
+            self.states = {}
+            return
+        self.states = { key : value for key, value in self.states.items() if key[0] != model_id }
@@ -5,6 +5,9 @@ from pycadsx.cadtypes import CadTypes
 
 
 class Face:
+
+    __slots__ = ( 'client', 'id', 'prmno', 'faceno', 'csgsol', 'type', 'face_type' )
+
     def __init__(self, client: 'Client') -> None:
         self.client = client
         self.id = 0
@@ -25,8 +28,8 @@ class Face:
     def get_geometry(self):
         return self.client.face.get_geometry(self)
     
-    def get_geometries(self, faces: list['Face']):
-        return self.client.face.get_geometries(faces)
+    def get_geometries(self, faces: list['Face'], batch: bool = False):
+        return self.client.face.get_geometries(faces, batch)
 
     def get_edges(self):
         return self.client.face.get_edges(self)
@@ -43,6 +46,9 @@ class Face:
     def get_mass(self):
         return self.client.face.get_mass(self)
 
+    def defer_mass(self):
+        return self.client.loader.defer('face.mass', self)
+
     def get_masses(self, faces: list['Face']):
         return self.client.face.get_masses(faces)
 
@@ -55,8 +61,14 @@ class Face:
     def get_colors(self, faces: list['Face']):
         return self.client.face.get_colors(faces)
 
+    def evaluate(self, faces: list['Face'], points: list[list[float]] = None):
+        return self.client.face.evaluate(faces, points)
+
     def set_color(self, color: CadTypes.Color):
         return self.client.face.set_color(self, color)
 
     def set_colors(self, faces: list['Face'], color: CadTypes.Color):
         return self.client.face.set_colors(faces, color)
+
+    def recolor(self, faces: list['Face'], rule, skip_same: bool = True):
+        return self.client.face.recolor(faces, rule, skip_same)
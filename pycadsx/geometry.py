@@ -1,235 +1,271 @@
 import base64
+import copy
 import math
+from functools import cached_property
 from lxml.etree import _Element
 from pycadsx.cadtypes import CadTypes
+from pycadsx.decoder import Decoder, flag, degree, enum, xyz, matrix3
+
+
+ORIGIN = xyz()
+MATRIX = matrix3()
+VECTOR = xyz('v')
+TEXT_KEYS = tuple([ f'str{i:02d}' for i in range(1, 21) ])
 
 
 class BaseGeometry:
+    decoder = Decoder([
+        ('id'  , 'id'  , int                         , 0),
+        ('type', 'type', enum(CadTypes.Geometry.Type), '767'),
+    ])
+    __slots__ = decoder.slots()
+
     def __init__(self, element: _Element) -> None:
-        self.id   = int(element.get('id', 0))
-        self.type = self._type(element)
+        # サブクラスの decoder でまとめて読む
+        type(self).decoder.decode(element, self)
 
     def _type(self, element: _Element):
         return CadTypes.Geometry.Type.get_value( int( element.get('type', '767') ) )
 
     def _origin(self, element: _Element):
-        return [ float( element.get(i) ) for i in ['x', 'y', 'z'] ]
+        return [ float( element.get(i) ) for i in ORIGIN ]
 
     def _matrix(self, element: _Element):
-        return [ [ float( element.get(f'{a0}{a1}') ) for a1 in ['x', 'y', 'z'] ] for a0 in ['x', 'y', 'z'] ]
+        return [ [ float( element.get(key) ) for key in row ] for row in MATRIX ]
     
     def _base64_string_to_string(self, base64_string: str):
         return base64.urlsafe_b64decode(base64_string).decode('utf-16le')
 
 
+class DraftGeometry(BaseGeometry):
+    # 引出線や文字列などの入れ子の要素は参照された時に読む
+    # 応答の XML 全体を持ち続けないように、使う子要素だけを複製して持っておく
+    child_tags = [ 'sx_inf_geom_draft_leadline' ]
+
+    def __init__(self, element: _Element) -> None:
+        super().__init__(element)
+        self.children = { tag : [ copy.deepcopy(e) for e in element.findall(tag) ] for tag in type(self).child_tags }
+
+    @cached_property
+    def lead_lines(self) -> list['LeadLine']:
+        return [ LeadLine(e) for e in self.children['sx_inf_geom_draft_leadline'] ]
+
+
 class BaseDimensionGeometry(BaseGeometry):
+    decoder = BaseGeometry.decoder.extend([
+        ('origin', ORIGIN, float),
+        ('matrix', MATRIX, float),
+    ])
+
     def __init__(self, element: _Element):
         super().__init__(element)
-        self.origin                    = self._origin(element)
-        self.matrix                    = self._matrix(element)
         self.text_info: DimensionValue = None
         self.line_info: DimensionLine  = None
 
 
 class Line3D(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin = self._origin(element)
-        self.vector = [ float(element.get(i)) for i in ['vx', 'vy', 'vz'] ]
-        self.length = float(element.get('leng'))
-        self.csgsol = int(element.get('csgsol'))
-        self.prmno  = int(element.get('prmno'))
-        self.edgeno = int(element.get('edgeno'))
+    decoder = BaseGeometry.decoder.extend([
+        ('origin', ORIGIN  , float),
+        ('vector', VECTOR  , float),
+        ('length', 'leng'  , float),
+        ('csgsol', 'csgsol', int),
+        ('prmno' , 'prmno' , int),
+        ('edgeno', 'edgeno', int),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class Line2D(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin = self._origin(element)
-        self.vector = [ float(element.get(i)) for i in ['vx', 'vy', 'vz'] ]
-        self.length = float(element.get('leng'))
+    decoder = BaseGeometry.decoder.extend([
+        ('origin', ORIGIN, float),
+        ('vector', VECTOR, float),
+        ('length', 'leng', float),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class Point3D(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin = self._origin(element)
+    decoder = BaseGeometry.decoder.extend([
+        ('origin', ORIGIN, float),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class Point2D(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin = self._origin(element)
+    decoder = BaseGeometry.decoder.extend([
+        ('origin', ORIGIN, float),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class Arc3D(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.radius       = float(element.get('r'))
-        self.origin       = self._origin(element)
-        self.vector       = [ float(element.get(i)) for i in ['vx', 'vy', 'vz'] ]
-        self.vector_start = [ float(element.get(i)) for i in ['sx', 'sy', 'sz'] ]
-        self.vector_end   = [ float(element.get(i)) for i in ['ex', 'ey', 'ez'] ]
-        self.csgsol       = int(element.get('csgsol'))
-        self.prmno        = int(element.get('prmno'))
-        self.edgeno       = int(element.get('edgeno'))
+    decoder = BaseGeometry.decoder.extend([
+        ('radius'      , 'r'     , float),
+        ('origin'      , ORIGIN  , float),
+        ('vector'      , VECTOR  , float),
+        ('vector_start', xyz('s'), float),
+        ('vector_end'  , xyz('e'), float),
+        ('csgsol'      , 'csgsol', int),
+        ('prmno'       , 'prmno' , int),
+        ('edgeno'      , 'edgeno', int),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class Arc2D(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin       = self._origin(element)
-        self.radius       = float(element.get('r'))
-        self.angle_start = float(element.get('sang')) / math.pi * 180.0
-        self.angle_end   = float(element.get('eang')) / math.pi * 180.0
+    decoder = BaseGeometry.decoder.extend([
+        ('origin'     , ORIGIN, float),
+        ('radius'     , 'r'   , float),
+        ('angle_start', 'sang', degree),
+        ('angle_end'  , 'eang', degree),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class Circle3D(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin = self._origin(element)
-        self.radius = float(element.get('r'))
-        self.vector = [ float(element.get(i)) for i in ['vx', 'vy', 'vz'] ]
-        self.csgsol = int(element.get('csgsol'))
-        self.prmno  = int(element.get('prmno'))
-        self.edgeno = int(element.get('edgeno'))
+    decoder = BaseGeometry.decoder.extend([
+        ('origin', ORIGIN  , float),
+        ('radius', 'r'     , float),
+        ('vector', VECTOR  , float),
+        ('csgsol', 'csgsol', int),
+        ('prmno' , 'prmno' , int),
+        ('edgeno', 'edgeno', int),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class Circle2D(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin      = self._origin(element)
-        self.radius      = float(element.get('r'))
-        self.angle_start = float(element.get('sang')) / math.pi * 180.0
-        self.angle_end   = float(element.get('eang')) / math.pi * 180.0
+    decoder = BaseGeometry.decoder.extend([
+        ('origin'     , ORIGIN, float),
+        ('radius'     , 'r'   , float),
+        ('angle_start', 'sang', degree),
+        ('angle_end'  , 'eang', degree),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class Ellipse2D(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin      = self._origin(element)
-        self.radius1     = float(element.get('r1'))
-        self.radius2     = float(element.get('r2'))
-        self.angle       = float(element.get('ang')) / math.pi * 180.0
-        self.angle_start = float(element.get('sang')) / math.pi * 180.0
-        self.angle_end   = float(element.get('eang')) / math.pi * 180.0
+    decoder = BaseGeometry.decoder.extend([
+        ('origin'     , ORIGIN, float),
+        ('radius1'    , 'r1'  , float),
+        ('radius2'    , 'r2'  , float),
+        ('angle'      , 'ang' , degree),
+        ('angle_start', 'sang', degree),
+        ('angle_end'  , 'eang', degree),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class EllipseArc2D(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin      = self._origin(element)
-        self.radius1     = float(element.get('r1'))
-        self.radius2     = float(element.get('r2'))
-        self.angle       = float(element.get('ang')) / math.pi * 180.0
-        self.angle_start = float(element.get('sang')) / math.pi * 180.0
-        self.angle_end   = float(element.get('eang')) / math.pi * 180.0
+    decoder = BaseGeometry.decoder.extend([
+        ('origin'     , ORIGIN, float),
+        ('radius1'    , 'r1'  , float),
+        ('radius2'    , 'r2'  , float),
+        ('angle'      , 'ang' , degree),
+        ('angle_start', 'sang', degree),
+        ('angle_end'  , 'eang', degree),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class Spline2D(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin      = self._origin(element)
-        self.kind        = CadTypes.Entity.SplineKind.get_value( int(element.get('kind')) )
-        self.angle_start = float(element.get('sang')) / math.pi * 180.0
-        self.angle_end   = float(element.get('eang')) / math.pi * 180.0
+    decoder = BaseGeometry.decoder.extend([
+        ('origin'     , ORIGIN, float),
+        ('kind'       , 'kind', enum(CadTypes.Entity.SplineKind)),
+        ('angle_start', 'sang', degree),
+        ('angle_end'  , 'eang', degree),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class OtherCurve(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.csgsol      = int(element.get('csgsol'))
-        self.prmno       = int(element.get('prmno'))
-        self.edgeno      = int(element.get('edgeno'))
+    decoder = BaseGeometry.decoder.extend([
+        ('csgsol', 'csgsol', int),
+        ('prmno' , 'prmno' , int),
+        ('edgeno', 'edgeno', int),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class Cap(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin      = self._origin(element)
-        self.matrix      = self._matrix(element)
-        self.radius1     = float(element.get('r1'))
-        self.radius2     = float(element.get('r2'))
-        self.orient      = element.get('orient') != '0'
-        self.csgsol      = int(element.get('csgsol'))
-        self.prmno       = int(element.get('prmno'))
-        self.edgeno      = int(element.get('edgeno'))
+    decoder = BaseGeometry.decoder.extend([
+        ('origin' , ORIGIN  , float),
+        ('matrix' , MATRIX  , float),
+        ('radius1', 'r1'    , float),
+        ('radius2', 'r2'    , float),
+        ('orient' , 'orient', flag),
+        ('csgsol' , 'csgsol', int),
+        ('prmno'  , 'prmno' , int),
+        ('edgeno' , 'edgeno', int),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class Plane(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin      = self._origin(element)
-        self.matrix      = self._matrix(element)
-        self.csgsol      = int(element.get('csgsol'))
-        self.prmno       = int(element.get('prmno'))
-        self.edgeno      = int(element.get('edgeno'))
+    decoder = BaseGeometry.decoder.extend([
+        ('origin', ORIGIN  , float),
+        ('matrix', MATRIX  , float),
+        ('csgsol', 'csgsol', int),
+        ('prmno' , 'prmno' , int),
+        ('edgeno', 'edgeno', int),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class Cone(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin      = self._origin(element)
-        self.matrix      = self._matrix(element)
-        self.radius      = float(element.get('r'))
-        self.half_angle  = float(element.get('half_ang')) / math.pi * 180.0
-        self.orient      = element.get('orient') != '0'
-        self.csgsol      = int(element.get('csgsol'))
-        self.prmno       = int(element.get('prmno'))
-        self.faceno      = int(element.get('faceno'))
+    decoder = BaseGeometry.decoder.extend([
+        ('origin'    , ORIGIN    , float),
+        ('matrix'    , MATRIX    , float),
+        ('radius'    , 'r'       , float),
+        ('half_angle', 'half_ang', degree),
+        ('orient'    , 'orient'  , flag),
+        ('csgsol'    , 'csgsol'  , int),
+        ('prmno'     , 'prmno'   , int),
+        ('faceno'    , 'faceno'  , int),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class Cylinder(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin      = self._origin(element)
-        self.matrix      = self._matrix(element)
-        self.radius      = float(element.get('r'))
-        self.half_angle  = float(element.get('half_ang')) / math.pi * 180.0
-        self.orient      = element.get('orient') != '0'
-        self.csgsol      = int(element.get('csgsol'))
-        self.prmno       = int(element.get('prmno'))
-        self.faceno      = int(element.get('faceno'))
+    decoder   = Cone.decoder
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class Sphere(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin      = self._origin(element)
-        self.matrix      = self._matrix(element)
-        self.radius      = float(element.get('r'))
-        self.half_angle  = float(element.get('half_ang')) / math.pi * 180.0
-        self.orient      = element.get('orient') != '0'
-        self.csgsol      = int(element.get('csgsol'))
-        self.prmno       = int(element.get('prmno'))
-        self.faceno      = int(element.get('faceno'))
+    decoder   = Cone.decoder
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class Torus(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.origin      = self._origin(element)
-        self.matrix      = self._matrix(element)
-        self.max_radius  = float(element.get('maxr'))
-        self.min_radius  = float(element.get('minr'))
-        self.orient      = element.get('orient') != '0'
-        self.csgsol      = int(element.get('csgsol'))
-        self.prmno       = int(element.get('prmno'))
-        self.faceno      = int(element.get('faceno'))
+    decoder = BaseGeometry.decoder.extend([
+        ('origin'    , ORIGIN  , float),
+        ('matrix'    , MATRIX  , float),
+        ('max_radius', 'maxr'  , float),
+        ('min_radius', 'minr'  , float),
+        ('orient'    , 'orient', flag),
+        ('csgsol'    , 'csgsol', int),
+        ('prmno'     , 'prmno' , int),
+        ('faceno'    , 'faceno', int),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
 class OtherSurf(BaseGeometry):
-    def __init__(self, element: _Element):
-        super().__init__(element)
-        self.orient      = element.get('orient') != '0'
-        self.csgsol      = int(element.get('csgsol'))
-        self.prmno       = int(element.get('prmno'))
-        self.faceno      = int(element.get('faceno'))
+    decoder = BaseGeometry.decoder.extend([
+        ('orient', 'orient', flag),
+        ('csgsol', 'csgsol', int),
+        ('prmno' , 'prmno' , int),
+        ('faceno', 'faceno', int),
+    ])
+    __slots__ = decoder.slots(BaseGeometry.decoder)
 
 
-class Text(BaseGeometry):
+class Text(DraftGeometry):
+    child_tags = DraftGeometry.child_tags + [ 'sx_draft_atr_text' ]
+
     def __init__(self, element: _Element):
         super().__init__(element)
+        self.raw_texts = tuple([ element.get(key) for key in TEXT_KEYS ])
         self.origin    = self._origin(element)
         self.matrix    = self._matrix(element)
         self.base_pnt  = int(element.get('base_pnt'))
@@ -237,8 +273,15 @@ class Text(BaseGeometry):
         self.lres      = [ int( element.get(f'lres{i:02d}') ) for i in range(2, 10) ]
         self.dres      = [ float( element.get(f'dres{i:02d}') ) for i in range(10) ]
         self.position  = [ float( element.get(f'pntx') ), float( element.get(f'pnty') ), float( element.get(f'pntz') ) ]
-        self.texts     = [ self._base64_string_to_string( element.get(f'str{i:02d}') ) for i in range(1, 21) ]
-        self.attribute = TextAttribute(element.xpath('./sx_draft_atr_text')[0])
+
+    @cached_property
+    def texts(self) -> list[str]:
+        return [ self._base64_string_to_string(text) for text in self.raw_texts ]
+
+    @cached_property
+    def attribute(self) -> 'TextAttribute':
+        sx_draft_atr_text = self.children['sx_draft_atr_text']
+        return TextAttribute(sx_draft_atr_text[0]) if sx_draft_atr_text else None
 
 
 class LeadLine(BaseGeometry):
@@ -246,12 +289,15 @@ class LeadLine(BaseGeometry):
         super().__init__(element)
         self.arrow_type = CadTypes.Geometry.DimensionLine.Arrow.get_value( int(element.get('arrow_type')) )
         self.pnt_num = element.get('pnt_num')
-        self.point = [ [ float( sx_pos.get(i) ) for i in ['x', 'y', 'z'] ] for sx_pos in element.xpath('./sx_pos') ]
+        self.point = [ [ float( sx_pos.get(i) ) for i in ['x', 'y', 'z'] ] for sx_pos in element.findall('sx_pos') ]
+
 
+class Note(DraftGeometry):
+    child_tags = DraftGeometry.child_tags + [ 'sx_draft_atr_text' ]
 
-class Note(BaseGeometry):
     def __init__(self, element: _Element):
         super().__init__(element)
+        self.raw_texts = tuple([ element.get(key) for key in TEXT_KEYS ])
 
         self.origin   = self._origin(element)
         self.matrix   = self._matrix(element)
@@ -261,8 +307,6 @@ class Note(BaseGeometry):
         self.lead_line_count = int(element.get('lead_line_num'))
         self.text_line_num = int(element.get('text_line_num'))
 
-        self.texts = [ self._base64_string_to_string( element.get(f'str{i:02d}') ) for i in range(1, 21) ]
-
         self.lres05 = int(element.get('lres05'))
         self.lres06 = int(element.get('lres06'))
         self.lres07 = int(element.get('lres07'))
@@ -280,18 +324,17 @@ class Note(BaseGeometry):
         self.dres08 = float(element.get('dres08'))
         self.dres09 = float(element.get('dres09'))
 
-        self.lead_lines = []
-        leadline = element.get('./sx_inf_geom_draft_leadline')
-        if leadline is not None:
-            self.lead_lines = [ LeadLine(i) for i in leadline ]
-        
-        self.attribute = None
-        sx_draft_atr_text = element.get('./sx_draft_atr_text')
-        if sx_draft_atr_text is not None:
-            self.attribute = TextAttribute(sx_draft_atr_text[0])
+    @cached_property
+    def texts(self) -> list[str]:
+        return [ self._base64_string_to_string(text) for text in self.raw_texts ]
+
+    @cached_property
+    def attribute(self) -> 'TextAttribute':
+        sx_draft_atr_text = self.children['sx_draft_atr_text']
+        return TextAttribute(sx_draft_atr_text[0]) if sx_draft_atr_text else None
 
 
-class Balloon(BaseGeometry):
+class Balloon(DraftGeometry):
     def __init__(self, element: _Element):
         super().__init__(element)
         self.origin            = self._origin(element)
@@ -334,12 +377,8 @@ class Balloon(BaseGeometry):
         self.cres08            = element.get('cres08')
         self.cres09            = element.get('cres09')
 
-        leadline = element.get('./sx_inf_geom_draft_leadline')
-        if leadline is not None:
-            self.lead_lines = [ LeadLine(leadline) for leadline in element.get('./sx_inf_geom_draft_leadline') ]
 
-
-class SMark(BaseGeometry):
+class SMark(DraftGeometry):
     def __init__(self, element: _Element):
         super().__init__(element)
         self.origin            = self._origin(element)
@@ -379,10 +418,6 @@ class SMark(BaseGeometry):
         
         self.cres09            = element.get('cres09')
 
-        leadline = element.get('./sx_inf_geom_draft_leadline')
-        if leadline is not None:
-            self.lead_lines = [ LeadLine(leadline) for leadline in element.get('./sx_inf_geom_draft_leadline') ]
-
 
 class Delta(BaseGeometry):
     def __init__(self, element: _Element):
@@ -417,7 +452,7 @@ class Delta(BaseGeometry):
         self.cres09            = element.get('cres09')
 
 
-class Welding(BaseGeometry):
+class Welding(DraftGeometry):
     def __init__(self, element: _Element):
         super().__init__(element)
         self.origin                    = self._origin(element)
@@ -471,10 +506,6 @@ class Welding(BaseGeometry):
             self.weld_points = 0
             self.upper_weld_points = int(element.get('upper_weld_points'))
             self.lower_weld_points = int(element.get('lower_weld_points'))
-        
-        leadline = element.get('./sx_inf_geom_draft_leadline')
-        if leadline is not None:
-            self.lead_lines = [ LeadLine(leadline) for leadline in element.get('./sx_inf_geom_draft_leadline') ]
 
 
 class SimpleWelding(BaseGeometry):
@@ -492,7 +523,9 @@ class SimpleWelding(BaseGeometry):
         self.point1    = [ float(element.get('pnt1x')), float(element.get('pnt1y')), float(element.get('pnt1z')) ]
 
 
-class GeometricTolerance(BaseGeometry):
+class GeometricTolerance(DraftGeometry):
+    child_tags = DraftGeometry.child_tags + [ 'sx_inf_geom_draft_tolframe' ]
+
     def __init__(self, element: _Element):
         super().__init__(element)
         self.origin        = self._origin(element)
@@ -524,10 +557,10 @@ class GeometricTolerance(BaseGeometry):
         self.point16       = [ float(element.get('pnt16x')), float(element.get('pnt16y')), float(element.get('pnt16z')) ]
         self.point17       = [ float(element.get('pnt17x')), float(element.get('pnt17y')), float(element.get('pnt17z')) ]
         self.point18       = [ float(element.get('pnt18x')), float(element.get('pnt18y')), float(element.get('pnt18z')) ]
-        self.frame         = [ ToleranceFrame(e) for e in element.xpath('./sx_inf_geom_draft_tolframe') ]
-        leadline = element.get('./sx_inf_geom_draft_leadline')
-        if leadline is not None:
-            self.lead_lines = [ LeadLine(leadline) for leadline in element.get('./sx_inf_geom_draft_leadline') ]
+
+    @cached_property
+    def frame(self) -> list['ToleranceFrame']:
+        return [ ToleranceFrame(e) for e in self.children['sx_inf_geom_draft_tolframe'] ]
 
 
 class ToleranceFrame:
@@ -554,7 +587,7 @@ class ToleranceFrame:
         self.circle_mark     = element.get('circle_mark') != '0'
 
 
-class Datum(BaseGeometry):
+class Datum(DraftGeometry):
     def __init__(self, element: _Element):
         super().__init__(element)
         self.origin        = self._origin(element)
@@ -566,9 +599,6 @@ class Datum(BaseGeometry):
         self.point2        = [ float(element.get('pnt2x')),  float(element.get('pnt2y')),  float(element.get('pnt2z')) ]
         self.point3        = [ float(element.get('pnt3x')),  float(element.get('pnt3y')),  float(element.get('pnt3z')) ]
         self.text          = element.get('text')
-        leadline = element.get('./sx_inf_geom_draft_leadline')
-        if leadline is not None:
-            self.lead_lines = [ LeadLine(leadline) for leadline in element.get('./sx_inf_geom_draft_leadline') ]
 
 
 class CutLine(BaseGeometry):
@@ -613,7 +643,7 @@ class Arrow(BaseGeometry):
         self.arrow_width = float(element.get('arrow_width'))
         self.arrow_angle = float(element.get('arrow_ang'))
         self.dot_diam    = float(element.get('dot_diam'))
-        self.points      = [ [ float( sx_pos.get(i) ) for i in ['x', 'y', 'z'] ] for sx_pos in element.xpath('./sx_pos') ]
+        self.points      = [ [ float( sx_pos.get(i) ) for i in ['x', 'y', 'z'] ] for sx_pos in element.findall('sx_pos') ]
 
 
 class Symbol(BaseGeometry):
@@ -658,7 +688,7 @@ class Indicator(BaseGeometry):
         self.point2      = [ float(element.get('pnt2x')),  float(element.get('pnt2y')),  float(element.get('pnt2z')) ]
         self.point3      = [ float(element.get('pnt3x')),  float(element.get('pnt3y')),  float(element.get('pnt3z')) ]
         self.point4      = [ float(element.get('pnt4x')),  float(element.get('pnt4y')),  float(element.get('pnt4z')) ]
-        self.points      = [ [ float( sx_pos.get(i) ) for i in ['x', 'y', 'z'] ] for sx_pos in element.xpath('./sx_pos') ]
+        self.points      = [ [ float( sx_pos.get(i) ) for i in ['x', 'y', 'z'] ] for sx_pos in element.findall('sx_pos') ]
 
 
 class FinishMark(BaseGeometry):
@@ -0,0 +1,122 @@
+import math
+from array import array
+from lxml.etree import _Element
+from pycadsx.geometry import GeometryFactory, BaseGeometry
+
+
+XYZ   = ['x', 'y', 'z']
+VXYZ  = ['vx', 'vy', 'vz']
+MXYZ  = [ f'{a0}{a1}' for a0 in ['x', 'y', 'z'] for a1 in ['x', 'y', 'z'] ]
+DEG   = 180.0 / math.pi
+
+
+class GeometryGroup:
+    def __init__(self, tag: str, fields: list[tuple[str, list[str], str, float]]) -> None:
+        self.tag                        = tag
+        self.fields                     = fields
+        self.indexes                    = array('q')
+        self.ids                        = array('q')
+        self.columns: dict[str, array]  = { name : array(typecode) for name, _, typecode, _ in fields }
+        self.widths: dict[str, int]     = { name : len(attributes) for name, attributes, _, _ in fields }
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, name: str) -> array:
+        return self.columns[name]
+
+    def append(self, index: int, element: _Element):
+        get = element.get
+        self.indexes.append(index)
+        self.ids.append( int( get('id', 0) ) )
+        for name, attributes, typecode, scale in self.fields:
+            column = self.columns[name]
+            if typecode == 'd':
+                for attribute in attributes:
+                    column.append( float( get(attribute) ) * scale )
+            else:
+                for attribute in attributes:
+                    column.append( int( get(attribute) ) )
+
+    def rows(self, name: str) -> list:
+        column, width = self.columns[name], self.widths[name]
+        if width == 1:
+            return column.tolist()
+        return [ column[i : i + width].tolist() for i in range(0, len(column), width) ]
+
+
+class GeometryBatch:
+
+    # tag : [ (field, attributes, array typecode, scale) ]
+    specs = {
+        'sx_inf_geom_line3d'   : [ ('origin', XYZ, 'd', 1.0), ('vector', VXYZ, 'd', 1.0), ('length', ['leng'], 'd', 1.0),
+                                   ('csgsol', ['csgsol'], 'q', 1.0), ('prmno', ['prmno'], 'q', 1.0), ('edgeno', ['edgeno'], 'q', 1.0) ],
+        'sx_inf_geom_line2d'   : [ ('origin', XYZ, 'd', 1.0), ('vector', VXYZ, 'd', 1.0), ('length', ['leng'], 'd', 1.0) ],
+        'sx_inf_geom_pnt3d'    : [ ('origin', XYZ, 'd', 1.0) ],
+        'sx_inf_geom_pnt2d'    : [ ('origin', XYZ, 'd', 1.0) ],
+        'sx_inf_geom_arc3d'    : [ ('origin', XYZ, 'd', 1.0), ('radius', ['r'], 'd', 1.0), ('vector', VXYZ, 'd', 1.0),
+                                   ('vector_start', ['sx', 'sy', 'sz'], 'd', 1.0), ('vector_end', ['ex', 'ey', 'ez'], 'd', 1.0),
+                                   ('csgsol', ['csgsol'], 'q', 1.0), ('prmno', ['prmno'], 'q', 1.0), ('edgeno', ['edgeno'], 'q', 1.0) ],
+        'sx_inf_geom_arc2d'    : [ ('origin', XYZ, 'd', 1.0), ('radius', ['r'], 'd', 1.0),
+                                   ('angle_start', ['sang'], 'd', DEG), ('angle_end', ['eang'], 'd', DEG) ],
+        'sx_inf_geom_circle3d' : [ ('origin', XYZ, 'd', 1.0), ('radius', ['r'], 'd', 1.0), ('vector', VXYZ, 'd', 1.0),
+                                   ('csgsol', ['csgsol'], 'q', 1.0), ('prmno', ['prmno'], 'q', 1.0), ('edgeno', ['edgeno'], 'q', 1.0) ],
+        'sx_inf_geom_circle2d' : [ ('origin', XYZ, 'd', 1.0), ('radius', ['r'], 'd', 1.0),
+                                   ('angle_start', ['sang'], 'd', DEG), ('angle_end', ['eang'], 'd', DEG) ],
+        'sx_inf_geom_plane'    : [ ('origin', XYZ, 'd', 1.0), ('matrix', MXYZ, 'd', 1.0),
+                                   ('csgsol', ['csgsol'], 'q', 1.0), ('prmno', ['prmno'], 'q', 1.0), ('edgeno', ['edgeno'], 'q', 1.0) ],
+        'sx_inf_geom_cone'     : [ ('origin', XYZ, 'd', 1.0), ('matrix', MXYZ, 'd', 1.0), ('radius', ['r'], 'd', 1.0), ('half_angle', ['half_ang'], 'd', DEG),
+                                   ('csgsol', ['csgsol'], 'q', 1.0), ('prmno', ['prmno'], 'q', 1.0), ('faceno', ['faceno'], 'q', 1.0) ],
+        'sx_inf_geom_cylinder' : [ ('origin', XYZ, 'd', 1.0), ('matrix', MXYZ, 'd', 1.0), ('radius', ['r'], 'd', 1.0), ('half_angle', ['half_ang'], 'd', DEG),
+                                   ('csgsol', ['csgsol'], 'q', 1.0), ('prmno', ['prmno'], 'q', 1.0), ('faceno', ['faceno'], 'q', 1.0) ],
+        'sx_inf_geom_sphere'   : [ ('origin', XYZ, 'd', 1.0), ('matrix', MXYZ, 'd', 1.0), ('radius', ['r'], 'd', 1.0), ('half_angle', ['half_ang'], 'd', DEG),
+                                   ('csgsol', ['csgsol'], 'q', 1.0), ('prmno', ['prmno'], 'q', 1.0), ('faceno', ['faceno'], 'q', 1.0) ],
+        'sx_inf_geom_torus'    : [ ('origin', XYZ, 'd', 1.0), ('matrix', MXYZ, 'd', 1.0), ('max_radius', ['maxr'], 'd', 1.0), ('min_radius', ['minr'], 'd', 1.0),
+                                   ('csgsol', ['csgsol'], 'q', 1.0), ('prmno', ['prmno'], 'q', 1.0), ('faceno', ['faceno'], 'q', 1.0) ],
+    }
+
+    def __init__(self) -> None:
+        self.groups: dict[str, GeometryGroup]       = {}
+        self.others: list[tuple[int, BaseGeometry]] = []
+        self.count                                  = 0
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, key) -> GeometryGroup:
+        return self.get(key)
+
+    def get(self, key) -> GeometryGroup | None:
+        # タグ名またはジオメトリクラス (Line3D など) で取得
+        if not isinstance(key, str):
+            for tag, geometry_class in GeometryFactory.class_.items():
+                if geometry_class is key:
+                    key = tag
+                    break
+        return self.groups.get(key)
+
+    def append(self, element: _Element):
+        index = self.count
+        self.count += 1
+        fields = GeometryBatch.specs.get(element.tag)
+        if fields is None:
+            geometry = GeometryFactory.create(element)
+            if geometry is not None:
+                self.others.append( (index, geometry) )
+            return
+        group = self.groups.get(element.tag)
+        if group is None:
+            group = GeometryGroup(element.tag, fields)
+            self.groups[element.tag] = group
+        group.append(index, element)
+
+    def extend(self, element: _Element):
+        for child in element:
+            self.append(child)
+
+    @classmethod
+    def from_element(cls, element: _Element) -> 'GeometryBatch':
+        batch = cls()
+        if element is not None:
+            batch.extend(element)
+        return batch
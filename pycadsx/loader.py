@@ -0,0 +1,106 @@
+import typing
+if typing.TYPE_CHECKING:
+    from pycadsx.client import Client
+
+
+class Deferred:
+    def __init__(self, loader: 'BatchLoader', key: str, target) -> None:
+        self.loader   = loader
+        self.key      = key
+        self.target   = target
+        self.is_ready = False
+        self.result   = None
+        self.error    = None
+
+    def __repr__(self):
+        return f'Deferred({self.key}, {"failed" if self.error is not None else "ready" if self.is_ready else "pending"})'
+
+    def set(self, result):
+        self.result   = result
+        self.is_ready = True
+
+    def fail(self, error: Exception):
+        self.error    = error
+        self.is_ready = True
+
+    def get(self):
+        if not self.is_ready:
+            self.loader.flush()
+        if self.error is not None:
+            raise self.error
+        if not self.is_ready:
+            raise Exception(f'{self.key} was not resolved')
+        return self.result
+
+    @property
+    def value(self):
+        return self.get()
+
+
+class BatchLoader:
+    def __init__(self, client: 'Client', batch_size: int = 1000) -> None:
+        self.client                                  = client
+        self.batch_size                              = batch_size
+        self.pending: dict[str, dict[int, Deferred]] = {}
+        self.loaders                                 = {
+            'entity.geometry' : self.load_entity_geometries,
+            'part.info'       : self.load_part_infos,
+            'face.mass'       : self.load_face_masses,
+            'edge.end_points' : self.load_edge_end_points,
+        }
+
+    def defer(self, key: str, target) -> Deferred:
+        pending = self.pending.setdefault(key, {})
+        deferred = pending.get( id(target) )
+        if deferred is None:
+            deferred = Deferred(self, key, target)
+            pending[ id(target) ] = deferred
+        return deferred
+
+    def flush(self):
+        # 解決中に新しく追加された要求もまとめて処理する
+        while self.pending:
+            pending, self.pending = self.pending, {}
+            try:
+                for key, deferreds in pending.items():
+                    deferreds = list( deferreds.values() )
+                    for i in range(0, len(deferreds), self.batch_size):
+                        self.loaders[key]( deferreds[i : i + self.batch_size] )
+            except Exception as e:
+                # 取り出した要求のうち未解決のものは失敗として残す (get() で同じ例外を出す)
+                for deferreds in pending.values():
+                    for deferred in deferreds.values():
+                        if not deferred.is_ready:
+                            deferred.fail(e)
+                raise
+
+    def load_entity_geometries(self, deferreds: list[Deferred]):
+        entities = [ deferred.target for deferred in deferreds ]
+        for entity in entities:
+            entity.geometry = None
+        self.client.model.get_geometries(entities)
+        for deferred in deferreds:
+            deferred.set(deferred.target.geometry)
+
+    def load_part_infos(self, deferreds: list[Deferred]):
+        # id 0 (モデル) は情報が無いので None で解決する
+        infos = self.client.part.get_infs([ deferred.target for deferred in deferreds ])
+        for deferred, info in zip(deferreds, infos):
+            if info is None and deferred.target.id != 0:
+                deferred.fail( Exception(f'{deferred.key} : no reply for part {deferred.target.id}') )
+            else:
+                deferred.set(info)
+
+    def load_face_masses(self, deferreds: list[Deferred]):
+        masses = self.client.face.get_masses([ deferred.target for deferred in deferreds ])
+        for deferred, mass in zip(deferreds, masses):
+            if mass is None:
+                face = deferred.target
+                deferred.fail( Exception(f'{deferred.key} : no reply for face {face.id} {face.prmno} {face.faceno}') )
+            else:
+                deferred.set(mass)
+
+    def load_edge_end_points(self, deferreds: list[Deferred]):
+        points_list = self.client.edge.get_end_points_list([ deferred.target for deferred in deferreds ])
+        for deferred, points in zip(deferreds, points_list):
+            deferred.set(points)
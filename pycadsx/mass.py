@@ -1,38 +1,53 @@
 from lxml import etree
+from pycadsx.decoder import Decoder, raw, xyz
 
 
 class Moment:
-    def __init__(self, element: etree._Element) -> None:
-        self.origin = [ float( element.get(f'org{i}') ) for i in ['x', 'y', 'z'] ]
+    decoder = Decoder([
+        ('origin', xyz('org')                , float),
+        ('matrix', (xyz('xvec'), xyz('zvec')), float),
+        ('i_xx'  , 'i_xx'                    , float, 0.0),
+        ('i_yy'  , 'i_yy'                    , float, 0.0),
+        ('i_zz'  , 'i_zz'                    , float, 0.0),
+        ('pi_xy' , 'pi_xy'                   , float, 0.0),
+        ('pi_yz' , 'pi_yz'                   , float, 0.0),
+        ('pi_zx' , 'pi_zx'                   , float, 0.0),
+        ('r_gx'  , 'r_gx'                    , float, 0.0),
+        ('r_gy'  , 'r_gy'                    , float, 0.0),
+        ('r_gz'  , 'r_gz'                    , float, 0.0),
+    ])
 
-        self.matrix = [ [ float(element.get(f'{i}vec{j}')) for j in ['x', 'y', 'z'] ] for i in ['x', 'z'] ]
+    def __init__(self, element: etree._Element) -> None:
+        self.attributes = dict(element.attrib)
+        Moment.decoder.decode(element, self)
         self.matrix.insert(1, [
             self.matrix[1][1] * self.matrix[0][2] - self.matrix[1][2] * self.matrix[0][1],
             self.matrix[1][2] * self.matrix[0][0] - self.matrix[1][0] * self.matrix[0][2],
             self.matrix[1][0] * self.matrix[0][1] - self.matrix[1][1] * self.matrix[0][0]
         ])
-        self.i_xx  = float(element.get('i_xx', 0.0))
-        self.i_yy  = float(element.get('i_yy', 0.0))
-        self.i_zz  = float(element.get('i_zz', 0.0))
-        self.pi_xy = float(element.get('pi_xy', 0.0))
-        self.pi_yz = float(element.get('pi_yz', 0.0))
-        self.pi_zx = float(element.get('pi_zx', 0.0))
-        self.r_gx  = float(element.get('r_gx', 0.0))
-        self.r_gy  = float(element.get('r_gy', 0.0))
-        self.r_gz  = float(element.get('r_gz)', 0.0))
 
 
 class Mass:
+    decoder = Decoder([
+        ('is_SI'       , 'is_SI'           , raw  , False),
+        ('unit_type'   , 'unit_type'       , int  , 3),
+        ('volume'      , 'volume'          , float, 0.0),
+        ('area'        , 'area'            , float, 0.0),
+        ('length'      , 'length'          , float, 0.0),
+        ('density'     , 'density'         , float, 0.0),
+        ('mass'        , 'mass'            , float, 0.0),
+        ('weight'      , 'weight'          , float, 0.0),
+        ('center_point', ('cx', 'cy', 'cz'), float, 0.0),
+        ('id'          , 'id'              , int  , 0),
+        ('csgsol'      , 'csgsol'          , int  , 0),
+        ('prmno'       , 'prmno'           , int  , 0),
+        ('faceno'      , 'faceno'          , int  , 0),
+        ('edgeno'      , 'edgeno'          , int  , 0),
+    ])
+
     def __init__(self, element: etree._Element) -> None:
-        self.is_SI              = element.get('is_SI', False)
-        self.unit_type          = int( element.get('unit_type', 3) )
-        self.volume             = float( element.get('volume', 0.0) )
-        self.area               = float( element.get('area', 0.0) )
-        self.length             = float( element.get('length', 0.0) )
-        self.density            = float( element.get('density', 0.0) )
-        self.mass               = float( element.get('mass', 0.0) )
-        self.weight             = float( element.get('weight', 0.0) )
-        self.center_point       = [ float( element.get(i, 0.0) ) for i in ['cx', 'cy', 'cz'] ]
+        self.attributes         = dict(element.attrib)
+        Mass.decoder.decode(element, self)
         self.inf_global_moment  = None #element.get('', None)
         self.inf_gravity_moment = None #element.get('', None)
         self.inf_main_moment    = None #element.get('', None)
@@ -40,12 +55,7 @@ class Mass:
         self.specific_axis      = None #element.get('', None)
         self.specific_moment    = 0.0 #element.get('', 0.0)
         self.specific_radius    = 0.0 #element.get('', 0.0)
-        self.id                 = int( element.get('id', 0) )
-        self.csgsol             = int( element.get('csgsol', 0) )
-        self.prmno              = int( element.get('prmno', 0) )
-        self.faceno             = int( element.get('faceno', 0) )
-        self.edgeno             = int( element.get('edgeno', 0) )
 
         self.moments = []
-        for sx_inf_moment in element.xpath('./sx_inf_moment'):
+        for sx_inf_moment in element.findall('sx_inf_moment'):
             self.moments.append( Moment(sx_inf_moment) )
@@ -0,0 +1,133 @@
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from lxml import etree
+import typing
+if typing.TYPE_CHECKING:
+    from pycadsx.part import Part
+    from pycadsx.entity import Entity
+from pycadsx.cadtypes import CadTypes
+from pycadsx.mass import Mass
+from pycadsx.mass_rollup import mat_transpose, mat_vec
+
+
+class MassCache:
+
+    # 部品座標系へ変換して保存する属性 (点 / ベクトル)
+    points  = [ ['cx', 'cy', 'cz'], ['orgx', 'orgy', 'orgz'] ]
+    vectors = [ ['xvecx', 'xvecy', 'xvecz'], ['zvecx', 'zvecy', 'zvecz'] ]
+
+    def __init__(self, path: Path = None, max_entries: int = 1000) -> None:
+        self.path                            = Path(path) if path is not None else None
+        self.max_entries                     = max_entries
+        self.entries: OrderedDict[str, dict] = OrderedDict()
+        self.hits                            = 0
+        self.disk_hits                       = 0
+        self.misses                          = 0
+        self.skips                           = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits'      : self.hits,
+            'disk_hits' : self.disk_hits,
+            'misses'    : self.misses,
+            'skips'     : self.skips,
+            'entries'   : len(self.entries),
+            'hit_rate'  : self.hits / total if total > 0 else 0.0,
+        }
+
+    def key(self, part: 'Part', density, unit_type, is_si, mode_accuracy, is_create_point=False, entities: list['Entity'] = None):
+        # 外部部品で更新日時が分かり、未変更のものだけをキャッシュする
+        if part is None or is_create_point or not part.is_external or part.is_modified or part.is_mirror:
+            return None
+        if (part.date == 0 and part.time == 0) or len(part.matrix) != 3 or len(part.origin) != 3:
+            return None
+        if entities is not None:
+            body_types = CadTypes.Entity.body_types()
+            ids = set([ e.id for e in entities if e.type in body_types ])
+            if len(ids) == 0 or ids != set([ e.id for e in part.entities.values() if e.type in body_types ]):
+                return None
+        return '|'.join([
+            part.ref_model_name, str(part.path), str(part.date), str(part.time),
+            str(float(density)), str(int(unit_type)), '1' if is_si else '0', str(int(mode_accuracy))
+        ])
+
+    def file_path(self, key: str):
+        return self.path / f'{hashlib.sha1(key.encode("utf-8")).hexdigest()}.json'
+
+    def get(self, key: str, part: 'Part') -> Mass | None:
+        if key is None:
+            self.skips += 1
+            return None
+
+        record = self.entries.get(key)
+        if record is not None:
+            self.entries.move_to_end(key)
+        elif self.path is not None and self.file_path(key).is_file():
+            with open(self.file_path(key), 'r', encoding='utf-8') as f:
+                record = json.load(f)
+            if record.get('key') != key:
+                record = None
+            else:
+                self.disk_hits += 1
+                self.remember(key, record)
+
+        if record is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.to_mass(record, part)
+
+    def store(self, key: str, part: 'Part', mass: Mass):
+        if key is None or mass is None:
+            return
+        record = self.to_record(key, mass, part)
+        self.remember(key, record)
+        if self.path is not None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            with open(self.file_path(key), 'w', encoding='utf-8') as f:
+                json.dump(record, f)
+
+    def remember(self, key: str, record: dict):
+        self.entries[key] = record
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self, disk: bool = False):
+        self.entries.clear()
+        if disk and self.path is not None and self.path.is_dir():
+            for file_path in self.path.glob('*.json'):
+                file_path.unlink()
+
+    def convert(self, attributes: dict[str, str], point, vector):
+        attributes = dict(attributes)
+        for names, function in [ (names, point) for names in MassCache.points ] + [ (names, vector) for names in MassCache.vectors ]:
+            if all([ name in attributes for name in names ]):
+                values = function([ float(attributes[name]) for name in names ])
+                for name, value in zip(names, values):
+                    attributes[name] = str(value)
+        return attributes
+
+    def to_record(self, key: str, mass: Mass, part: 'Part'):
+        # グローバル座標 → 部品座標  (local = R (p - o))
+        rotation, origin = part.matrix, part.origin
+        point  = lambda p: mat_vec(rotation, [ p[i] - origin[i] for i in range(3) ])
+        vector = lambda v: mat_vec(rotation, v)
+        return {
+            'key'     : key,
+            'mass'    : self.convert(mass.attributes, point, vector),
+            'moments' : [ self.convert(moment.attributes, point, vector) for moment in mass.moments ],
+        }
+
+    def to_mass(self, record: dict, part: 'Part') -> Mass:
+        # 部品座標 → 呼び出し元の配置でのグローバル座標  (p = R^T l + o)
+        rotation, origin = mat_transpose(part.matrix), part.origin
+        point  = lambda p: [ v + o for v, o in zip(mat_vec(rotation, p), origin) ]
+        vector = lambda v: mat_vec(rotation, v)
+        element = etree.Element('sx_inf_mass', self.convert(record['mass'], point, vector))
+        for attributes in record['moments']:
+            etree.SubElement(element, 'sx_inf_moment', self.convert(attributes, point, vector))
+        return Mass(element)
@@ -0,0 +1,196 @@
+import math
+from lxml import etree
+import typing
+if typing.TYPE_CHECKING:
+    from pycadsx.model import Model
+from pycadsx.cadtypes import CadTypes
+from pycadsx.entity import Entity
+from pycadsx.mass import Mass
+from pycadsx.part import Part
+
+
+def mat_mul(a: list[list[float]], b: list[list[float]]):
+    return [ [ sum([ a[i][k] * b[k][j] for k in range(3) ]) for j in range(3) ] for i in range(3) ]
+
+
+def mat_transpose(a: list[list[float]]):
+    return [ [ a[j][i] for j in range(3) ] for i in range(3) ]
+
+
+def mat_vec(a: list[list[float]], v: list[float]):
+    return [ sum([ a[i][k] * v[k] for k in range(3) ]) for i in range(3) ]
+
+
+class MassRollup:
+
+    # 各部品の値 : (mass, volume, area, weight, center, inertia)  inertia は重心まわり・グローバル軸
+    class Value:
+        def __init__(self, mass=0.0, volume=0.0, area=0.0, weight=0.0, center=None, inertia=None) -> None:
+            self.mass    = mass
+            self.volume  = volume
+            self.area    = area
+            self.weight  = weight
+            self.center  = center if center is not None else [0.0, 0.0, 0.0]
+            self.inertia = inertia if inertia is not None else [ [0.0] * 3 for _ in range(3) ]
+
+    def __init__(
+                self, model: 'Model', density=1.0, unit_type=CadTypes.Mass.Unit.MM_KG, is_si=True,
+                mode_accuracy=CadTypes.Mass.Accuracy.Low, reuse_external: bool = True
+            ) -> None:
+        self.model                                 = model
+        self.client                                = model.client
+        self.density                               = density
+        self.unit_type                             = unit_type
+        self.is_si                                 = is_si
+        self.mode_accuracy                         = mode_accuracy
+        self.reuse_external                        = reuse_external
+        self.bodies: dict[int, list[Entity]]       = {}
+        self.values: dict[int, 'MassRollup.Value'] = {}
+        self.masses: dict[int, Mass]               = {}
+        self.measured                              = 0
+
+    def load(self):
+        if self.model.top_part is None or not self.model.parts:
+            self.model.get_tree()
+        self.collect_bodies()
+        self.measure()
+        self.rollup()
+        return self
+
+    def get(self, part: Part) -> Mass | None:
+        return self.masses.get(part.id)
+
+    def collect_bodies(self):
+        # 部品ごとの get_entities (2往復) の代わりにモデル全体を1回走査して部品IDで振り分ける
+        body_types = CadTypes.Entity.body_types()
+        self.bodies = {}
+        for entity in self.model.iter_entities(fields=['type', 'id', 'part_id']):
+            if entity.type not in body_types:
+                continue
+            part_id = entity.part_id if entity.part_id in self.model.parts else self.model.top_part.id
+            self.bodies.setdefault(part_id, []).append(entity)
+        return self.bodies
+
+    def reference_key(self, part: Part):
+        if not self.reuse_external or not part.is_external or part.is_mirror or len(part.matrix) != 3:
+            return None
+        return (part.ref_model_name, part.path, len(self.bodies.get(part.id, [])))
+
+    def measure(self):
+        # 同じ外部部品は1回だけ測定し、他の配置には Part.origin / matrix で座標変換して使う
+        references: dict[tuple, Part] = {}
+        self.values = {}
+        for part in [ self.model.top_part ] + list(self.model.parts.values()):
+            bodies = self.bodies.get(part.id, [])
+            if len(bodies) == 0:
+                continue
+            key = self.reference_key(part)
+            if key is not None and key in references:
+                reference = references[key]
+                self.values[part.id] = self.transform(self.values[reference.id], reference, part)
+                continue
+
+            # bodies は部品の全ボディなので部品単位のキーでキャッシュを引ける
+            cache_key = self.client.mass_cache.key(part, self.density, self.unit_type, self.is_si, self.mode_accuracy)
+            mass = self.client.mass_cache.get(cache_key, part)
+            if mass is None:
+                mass = self.client.part.get_entities_mass(bodies, self.density, self.unit_type, self.is_si, self.mode_accuracy)
+                self.measured += 1
+                self.client.mass_cache.store(cache_key, part, mass)
+            if mass is None:
+                continue
+            self.values[part.id] = self.from_mass(mass)
+            if key is not None:
+                references[key] = part
+        return self.values
+
+    def from_mass(self, mass: Mass):
+        value = MassRollup.Value(mass.mass, mass.volume, mass.area, mass.weight, list(mass.center_point))
+        if len(mass.moments) == 0:
+            return value
+
+        moment = mass.moments[0]
+        local = [
+            [  moment.i_xx,  -moment.pi_xy, -moment.pi_zx ],
+            [ -moment.pi_xy,  moment.i_yy,  -moment.pi_yz ],
+            [ -moment.pi_zx, -moment.pi_yz,  moment.i_zz  ]
+        ]
+        # モーメント軸からグローバル軸へ回転し、平行軸の定理で原点から重心まわりへ移す
+        rotation = moment.matrix
+        inertia = mat_mul( mat_mul(mat_transpose(rotation), local), rotation )
+        value.inertia = self.shift(inertia, mass.mass, [ c - o for c, o in zip(value.center, moment.origin) ], -1.0)
+        return value
+
+    def transform(self, value: 'MassRollup.Value', source: Part, target: Part):
+        rotation = mat_mul( mat_transpose(target.matrix), source.matrix )
+        center = mat_vec(rotation, [ c - o for c, o in zip(value.center, source.origin) ])
+        center = [ c + o for c, o in zip(center, target.origin) ]
+        inertia = mat_mul( mat_mul(rotation, value.inertia), mat_transpose(rotation) )
+        return MassRollup.Value(value.mass, value.volume, value.area, value.weight, center, inertia)
+
+    def shift(self, inertia: list[list[float]], mass: float, d: list[float], sign: float = 1.0):
+        d2 = d[0] ** 2 + d[1] ** 2 + d[2] ** 2
+        return [
+            [ inertia[i][j] + sign * mass * ((d2 if i == j else 0.0) - d[i] * d[j]) for j in range(3) ]
+            for i in range(3)
+        ]
+
+    def combine(self, values: list['MassRollup.Value']):
+        total = MassRollup.Value()
+        total.mass   = sum([ v.mass for v in values ])
+        total.volume = sum([ v.volume for v in values ])
+        total.area   = sum([ v.area for v in values ])
+        total.weight = sum([ v.weight for v in values ])
+        if total.mass == 0.0:
+            return total
+        total.center = [ sum([ v.mass * v.center[i] for v in values ]) / total.mass for i in range(3) ]
+        for v in values:
+            inertia = self.shift(v.inertia, v.mass, [ c - t for c, t in zip(v.center, total.center) ])
+            total.inertia = [ [ total.inertia[i][j] + inertia[i][j] for j in range(3) ] for i in range(3) ]
+        return total
+
+    def rollup(self):
+        totals: dict[int, MassRollup.Value] = {}
+        order: list[Part] = []
+        stack = [ self.model.top_part ]
+        while stack:
+            part = stack.pop()
+            order.append(part)
+            stack.extend(part.children)
+
+        # 子から親の順に集計する
+        for part in reversed(order):
+            values = [ totals[child.id] for child in part.children if child.id in totals ]
+            if part.id in self.values:
+                values.append( self.values[part.id] )
+            if values:
+                totals[part.id] = values[0] if len(values) == 1 else self.combine(values)
+
+        self.masses = { part_id : self.to_mass(value) for part_id, value in totals.items() }
+        return self.masses
+
+    def to_mass(self, value: 'MassRollup.Value') -> Mass:
+        element = etree.Element('sx_inf_mass', {
+            'is_SI'     : '1' if self.is_si else '0',
+            'unit_type' : str( int(self.unit_type) ),
+            'volume'    : str(value.volume),
+            'area'      : str(value.area),
+            'density'   : str(self.density),
+            'mass'      : str(value.mass),
+            'weight'    : str(value.weight),
+            'cx'        : str(value.center[0]),
+            'cy'        : str(value.center[1]),
+            'cz'        : str(value.center[2]),
+        })
+        inertia, m = value.inertia, value.mass
+        etree.SubElement(element, 'sx_inf_moment', {
+            'orgx'  : str(value.center[0]), 'orgy'  : str(value.center[1]), 'orgz'  : str(value.center[2]),
+            'xvecx' : '1.0', 'xvecy' : '0.0', 'xvecz' : '0.0',
+            'zvecx' : '0.0', 'zvecy' : '0.0', 'zvecz' : '1.0',
+            'i_xx'  : str(inertia[0][0]), 'i_yy'  : str(inertia[1][1]), 'i_zz'  : str(inertia[2][2]),
+            'pi_xy' : str(-inertia[0][1]), 'pi_yz' : str(-inertia[1][2]), 'pi_zx' : str(-inertia[2][0]),
+            'r_gx'  : str( math.sqrt(max(inertia[0][0], 0.0) / m) if m > 0.0 else 0.0 ),
+            'r_gy'  : str( math.sqrt(max(inertia[1][1], 0.0) / m) if m > 0.0 else 0.0 ),
+            'r_gz'  : str( math.sqrt(max(inertia[2][2], 0.0) / m) if m > 0.0 else 0.0 ),
+        })
+        return Mass(element)
@@ -7,6 +7,7 @@ from pycadsx.vs import VS
 from pycadsx.wf import WF
 from pycadsx.part import Part
 from pycadsx.entity import Entity
+from pycadsx.mass_rollup import MassRollup
 from pycadsx.print_info import PrintInfo
 from pycadsx.material import Material
 from pycadsx.plotter import Plotter
@@ -96,7 +97,8 @@ class Model:
                     front_view = vs
                 else:
                     self.delete_vs(vs)
-        self.delete_vs(front_view)
+        if front_view is not None:
+            self.delete_vs(front_view)
         if is_delete_global_entities:
             self.vs_global.set_active()
             entities = list( self.vs_global.get_entities(0, 0, True, True, True, True).values() )
@@ -172,8 +174,8 @@ class Model:
     def get_extra_infos(self, parts: list['Part']):
         self.client.model.get_extra_infos(parts)
     
-    def set_extra_infos(self, parts: list['Part'], extra_infos: list[dict[str, str]]):
-        self.client.model.set_extra_infos(parts, extra_infos)
+    def set_extra_infos(self, parts: list['Part'], extra_infos: list[dict[str, str]], force: bool = False):
+        return self.client.model.set_extra_infos(parts, extra_infos, force)
     
     def get_modified_parts_list(self):
         return self.client.model.get_modified_parts_list(self)
@@ -222,22 +224,22 @@ class Model:
             wf = self.wf_global
         return self.client.model.get_top_entities(self, wf, offset, num, visible, layer, _type)
     
+    def iter_entities(self, page_size: int = 100000, fields: list[str] = None, assign_parts: bool = False, visible=True, part=True, layer=True, _type=True, wf: WF = None, prefetch: bool = True):
+        if wf is None:
+            wf = self.wf_global
+        entity_types = CadTypes.Entity.entity_types()
+        for entity in self.client.model.iter_entities(self, wf, page_size, visible, part, layer, _type, fields, prefetch):
+            if assign_parts and entity.type in entity_types and entity.part_id in self.parts:
+                self.parts[entity.part_id].entities[entity.id] = entity
+            yield entity
+
     def get_all_entities(self):
-        entities: dict[int, Entity] = {}
-        for i in range(100):
-            _entities = self.get_entities(i*100000, 100000, True, True, True, True)
-            if not _entities:
-                break
-            entities |= _entities
-
-        entity_types = CadTypes.Entity().entity_types()
-        for entity in entities.values():
-            if entity.type in entity_types:
-                if entity.part_id in self.parts:
-                    part = self.parts[entity.part_id]
-                    part.entities[entity.id] = entity
-        
-        return entities
+        return { entity.id : entity for entity in self.iter_entities(assign_parts=True) }
+
+    def get_entity_table(self, page_size: int = 100000, visible=True, part=True, layer=True, _type=True, wf: WF = None):
+        if wf is None:
+            wf = self.wf_global
+        return self.client.model.get_entity_table(self, wf, page_size, visible, part, layer, _type)
 
     def get_entities_2d(self, offset: int, num: int, visible: bool, part: bool, layer: bool, _type: bool, vs: VS = None) -> dict[int, 'Entity']:
         if vs is None:
@@ -249,6 +251,11 @@ class Model:
 
     def get_materials(self, entities: list['Entity']):
         return self.client.model.get_materials(entities)
+
+    def get_parts_materials(self, parts: list[Part] = None, chunk_size: int = 1000):
+        if parts is None:
+            parts = list( self.parts.values() )
+        return self.client.part.get_materials_list(parts, chunk_size)
     
     def set_inf_material(self, material: Material, entities: list[Entity]):
         self.client.model.set_inf_material(material, entities)
@@ -338,8 +345,13 @@ class Model:
     def get_display_layer(self) -> list[bool]:
         return self.client.model.get_display_layer()
     
+    def get_mass_rollup(self, density=1.0, unit_type=CadTypes.Mass.Unit.MM_KG, is_si=True, mode_accuracy=CadTypes.Mass.Accuracy.Low, reuse_external: bool = True):
+        return MassRollup(self, density, unit_type, is_si, mode_accuracy, reuse_external).load()
+
     def get_mass(self, entities: list['Entity'], density=1.0, unit_type=CadTypes.Mass.Unit.MM_KG, is_si=True, mode_accuracy=CadTypes.Mass.Accuracy.Low, is_create_point=False, vector=[0.0, 0.0, 1.0]):
-        return self.client.model.get_mass(entities, density, unit_type, is_si, mode_accuracy, is_create_point, vector)
+        part_ids = set([ entity.part_id for entity in entities ])
+        part = self.parts.get( part_ids.pop() ) if len(part_ids) == 1 else None
+        return self.client.model.get_mass(entities, density, unit_type, is_si, mode_accuracy, is_create_point, vector, part)
 
     def print_drawing(self, print_info: PrintInfo, plotter: Plotter):
         self.client.model.print_drawing(print_info, plotter)
@@ -413,8 +425,11 @@ class Model:
     def project_drawing_isometric(self, point: list[float]):
         self.client.model.project_drawing_isometric(self, point)
 
-    def set_drawing_frame(self, frame_file_path: Path):
-        self.client.model.set_drawing_frame(self, frame_file_path)
+    def project_drawings(self, origins: list[tuple[CadTypes.VS.View, list[float]]]):
+        self.client.model.project_drawings(self, origins)
+
+    def set_drawing_frame(self, frame_file_path: Path, command: str = None):
+        self.client.model.set_drawing_frame(self, frame_file_path, command)
 
     def dimension_tree_entities(self):
         dimansions_tree_entities: list[Entity] = []
@@ -475,7 +490,14 @@ class Model:
         
         if template_path is not None:
             self.set_drawing_frame(template_path)
-        
+
+        self.project_drawings( self.drawing_origins(box, views, margin) )
+
+        self.vs_global.set_active()
+        self.set_scale(scale)
+        self.fit_views(margin)
+
+    def drawing_origins(self, box: list[list[float]], views: list[CadTypes.VS.View], margin: int = 20.0):
         w, h, d = box[1][0] - box[0][0], box[1][1] - box[0][1], box[1][2] - box[0][2]
 
         right_x  =   w/2 + margin * 3 + d/2
@@ -494,73 +516,79 @@ class Model:
             CadTypes.VS.View.ISOME  : [right_x,    top_y]
         }
 
-        for view_type, origin in origins.items():
-            if view_type in views:
-                if view_type == CadTypes.VS.View.ISOME:
-                    self.project_drawing_isometric(origin)
-                else:
-                    self.project_drawing(origin)
+        return [ (view_type, origin) for view_type, origin in origins.items() if view_type in views ]
 
-        self.vs_global.set_active()
-        self.set_scale(scale)
-        self.fit_views(margin)
-        
     def fit_views(self, margin: int = 20.0):
+        # 外形は最初に1回だけ取得し、配置はローカルで計算して VWTRNS をまとめて送る
         self.get_vs_list()
         vs_list = { vs.view_type : vs for vs in self.vs_list if vs.type == CadTypes.VS.Type.VIEW }
-        front = vs_list[CadTypes.VS.View.FRONT]
+        front = vs_list.get(CadTypes.VS.View.FRONT)
         if front is None:
             return
-        
-        front_extent = front.map_to_global( front.get_extent() )
 
-        if CadTypes.VS.View.TOP in vs_list:
-            vs = vs_list[CadTypes.VS.View.TOP]
-            extent = vs.map_to_global( vs.get_extent() )
-            d = extent[0][1] - front_extent[1][1] - margin
-            if d > 0.0001:
-                vs.move([ vs.origin[0], vs.origin[1] - d ])
-                vs.get_inf()
-        
-        if CadTypes.VS.View.BOTTOM in vs_list:
-            vs = vs_list[CadTypes.VS.View.BOTTOM]
-            extent = vs.map_to_global( vs.get_extent() )
-            d = front_extent[0][1] - extent[1][1] - margin
+        isome = [ vs for vs in self.vs_list if vs.view_type == CadTypes.VS.View.LOCAL ]
+        isome = isome[0] if len(isome) > 0 else None
+
+        extents: dict[int, list[list[float]]] = {}
+        moves: dict[int, list[float]] = {}
+        for vs in list( vs_list.values() ) + ([ isome ] if isome is not None else []):
+            if id(vs) in extents:
+                continue
+            extent = vs.get_extent()
+            if extent is None:
+                continue
+            extents[id(vs)] = vs.map_to_global(extent)
+            moves[id(vs)] = [ 0.0, 0.0 ]
+        if id(front) not in extents:
+            return
+
+        def shift(vs: VS, dx: float, dy: float):
+            e = extents[id(vs)]
+            extents[id(vs)] = [ [ e[0][0] + dx, e[0][1] + dy ], [ e[1][0] + dx, e[1][1] + dy ] ]
+            moves[id(vs)][0] += dx
+            moves[id(vs)][1] += dy
+
+        def view(view_type):
+            vs = vs_list.get(view_type)
+            return vs if vs is not None and id(vs) in extents else None
+
+        front_extent = extents[id(front)]
+
+        vs = view(CadTypes.VS.View.TOP)
+        if vs is not None:
+            d = extents[id(vs)][0][1] - front_extent[1][1] - margin
             if d > 0.0001:
-                vs.move([ vs.origin[0], vs.origin[1] + d ])
-                vs.get_inf()
-        
-        if CadTypes.VS.View.LEFT in vs_list:
-            vs = vs_list[CadTypes.VS.View.LEFT]
-            extent = vs.map_to_global( vs.get_extent() )
-            d = front_extent[0][0] - extent[1][0] - margin
+                shift(vs, 0.0, -d)
+
+        vs = view(CadTypes.VS.View.BOTTOM)
+        if vs is not None:
+            d = front_extent[0][1] - extents[id(vs)][1][1] - margin
             if d > 0.0001:
-                vs.move([ vs.origin[0] + d, vs.origin[1] ])
-                vs.get_inf()
-        
-        right_extent = None
-        if CadTypes.VS.View.RIGHT in vs_list:
-            vs = vs_list[CadTypes.VS.View.RIGHT]
-            right_extent = vs.map_to_global( vs.get_extent() )
-            d = right_extent[0][0] - front_extent[1][0] - margin
+                shift(vs, 0.0, d)
+
+        vs = view(CadTypes.VS.View.LEFT)
+        if vs is not None:
+            d = front_extent[0][0] - extents[id(vs)][1][0] - margin
             if d > 0.0001:
-                vs.move([ vs.origin[0] - d, vs.origin[1] ])
-                vs.get_inf()
-                right_extent = vs.map_to_global( vs.get_extent() )
-        
-        if CadTypes.VS.View.BACK in vs_list:
-            vs = vs_list[CadTypes.VS.View.BACK]
-            extent = vs.map_to_global( vs.get_extent() )
-            extent0 = right_extent if right_extent is not None else front_extent
-            d = extent[0][0] - extent0[1][0] - margin
+                shift(vs, d, 0.0)
+
+        right = view(CadTypes.VS.View.RIGHT)
+        if right is not None:
+            d = extents[id(right)][0][0] - front_extent[1][0] - margin
             if d > 0.0001:
-                vs.move([ vs.origin[0] - d, vs.origin[1] ])
-                vs.get_inf()
+                shift(right, -d, 0.0)
 
-        print_infos = self.get_print_infos()
+        vs = view(CadTypes.VS.View.BACK)
+        if vs is not None:
+            extent0 = extents[id(right)] if right is not None else front_extent
+            d = extents[id(vs)][0][0] - extent0[1][0] - margin
+            if d > 0.0001:
+                shift(vs, -d, 0.0)
 
-        drawing_extent = self.get_drawing_extent( list( vs_list.values() ) )
+        views = [ vs for vs in vs_list.values() if id(vs) in extents ]
+        drawing_extent = self.extent_union([ extents[id(vs)] for vs in views if vs.type != CadTypes.VS.Type.LOCAL_VIEW ])
 
+        print_infos = self.get_print_infos()
         if len(print_infos) > 0:
             print_center = [
                 (print_infos[0].right_top[0] + print_infos[0].left_bottom[0]) / 2,
@@ -576,38 +604,37 @@ class Model:
         else:
             diff = [ 0 - drawing_extent[0][0] + margin, 0 - drawing_extent[0][1] + margin ]
 
-        for vs in vs_list.values():
-            if (-0.0001 < diff[0] < 0.0001) and (-0.0001 < diff[1] < 0.0001):
-                continue
-            vs.move([ vs.origin[0] + diff[0], vs.origin[1] + diff[1] ])
-            vs.get_inf()
-        
-        isome = [ vs for vs in self.vs_list if vs.view_type == CadTypes.VS.View.LOCAL ]
-        isome = isome[0] if len(isome) > 0 else None
-        if isome is not None:
-            front.get_inf()
-            isome.get_inf()
-            front_extent = front.map_to_global( front.get_extent() )
-            isome_extent = isome.map_to_global( isome.get_extent() )
+        if not( (-0.0001 < diff[0] < 0.0001) and (-0.0001 < diff[1] < 0.0001) ):
+            for vs in views:
+                shift(vs, diff[0], diff[1])
+
+        if isome is not None and id(isome) in extents:
+            front_extent = extents[id(front)]
+            isome_extent = extents[id(isome)]
             diff = [ front_extent[1][0] - isome_extent[0][0] + margin, front_extent[1][1] - isome_extent[0][1] + margin ]
             if not( (-0.0001 < diff[0] < 0.0001) and (-0.0001 < diff[1] < 0.0001) ):
-                isome.move([ isome.origin[0] + diff[0], isome.origin[1] + diff[1] ])
+                shift(isome, diff[0], diff[1])
 
-    def get_drawing_extent(self, vs_list: list[VS]):
+        targets = { id(vs) : vs for vs in views + ([ isome ] if isome is not None and id(isome) in extents else []) }
+        self.client.vs.move_views([
+            (vs, [ vs.origin[0] + moves[key][0], vs.origin[1] + moves[key][1] ])
+            for key, vs in targets.items()
+            if not( (-0.0001 < moves[key][0] < 0.0001) and (-0.0001 < moves[key][1] < 0.0001) )
+        ])
+
+    def extent_union(self, extents: list[list[list[float]]]):
         x0, y0, x1, y1 = 999999999999999, 999999999999999, -999999999999999, -999999999999999
-        for vs in vs_list:
-            if vs.type == CadTypes.VS.Type.LOCAL_VIEW:
-                continue
-            e = vs.map_to_global( vs.get_extent() )
-            if e[0][0] < x0: x0 = e[0][0]
-            if e[1][0] < x0: x0 = e[1][0]
-            if e[0][0] > x1: x1 = e[0][0]
-            if e[1][0] > x1: x1 = e[1][0]
-            if e[0][1] < y0: y0 = e[0][1]
-            if e[1][1] < y0: y0 = e[1][1]
-            if e[0][1] > y1: y1 = e[0][1]
-            if e[1][1] > y1: y1 = e[1][1]
+        for e in extents:
+            x0 = min(x0, e[0][0], e[1][0])
+            x1 = max(x1, e[0][0], e[1][0])
+            y0 = min(y0, e[0][1], e[1][1])
+            y1 = max(y1, e[0][1], e[1][1])
         return [ [x0, y0], [x1, y1] ]
 
+    def get_drawing_extent(self, vs_list: list[VS]):
+        return self.extent_union([
+            vs.map_to_global( vs.get_extent() ) for vs in vs_list if vs.type != CadTypes.VS.Type.LOCAL_VIEW
+        ])
+
     def get_entities_in_box(self,  box: list[list[float]], part: bool, org: list[float] = [0, 0, 0], zvec: list[float] = [0, 0, 1], xvec: list[float] = [1, 0, 0]):
         return self.client.model.get_entities_in_box(self, box, part, org, zvec, xvec)
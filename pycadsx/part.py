@@ -84,7 +84,7 @@ class Part:
         if key == 'Sys_Parts_IsModified':
             return self.is_modified
         if key == 'Sys_Parts_MaterialNo':
-            return ','.join(self.material)
+            return ','.join([ material.matid for material in self.material ])
         if key == '__is_read_only__':
             if self.is_external:
                 file_path = Path(self.path) / f'{self.ref_model_name}.icd'
@@ -125,6 +125,9 @@ class Part:
     def get_inf(self):
         self.client.part.get_inf(self)
 
+    def defer_inf(self):
+        return self.client.loader.defer('part.info', self)
+
     def get_extra_info(self):
         return self.client.part.get_extra_info(self)
 
@@ -134,11 +137,11 @@ class Part:
     def get_edges(self, entities: list[Entity]):
         return self.client.part.get_edges(entities)
     
-    def get_edges_geometries(self, edges: list[Edge]):
-        return self.client.part.get_edges_geometries(edges)
+    def get_edges_geometries(self, edges: list[Edge], batch: bool = False):
+        return self.client.part.get_edges_geometries(edges, batch)
 
-    def get_geometries(self, entities: list[Entity]):
-        return self.client.part.get_geometries(entities)
+    def get_geometries(self, entities: list[Entity], batch: bool = False):
+        return self.client.part.get_geometries(entities, batch)
 
     def get_model_info(self):
         self.client.part.get_model_info(self)
@@ -171,7 +174,7 @@ class Part:
         return self.client.part.get_mass(self, density, unit_type, is_si, mode_accuracy, is_create_point)
 
     def get_entities_mass(self, entities: list[Entity], density=1.0, unit_type=CadTypes.Mass.Unit.MM_KG, is_si=True, mode_accuracy=CadTypes.Mass.Accuracy.Low, is_create_point=False):
-        return self.client.part.get_entities_mass(entities, density, unit_type, is_si, mode_accuracy, is_create_point)
+        return self.client.part.get_entities_mass(entities, density, unit_type, is_si, mode_accuracy, is_create_point, self)
         
     def put(self, filepath: Path, point: list[float], matrix: list[list[float]], is_external: bool = True, is_all_level: bool = False, is_read_only: bool = True, password: str = ''):
         return self.client.part.put(self, filepath, point, matrix, is_external, is_all_level, is_read_only, password)
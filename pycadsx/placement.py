@@ -0,0 +1,84 @@
+class LabelPlacer:
+    def __init__(self, obstacles: list[list[list[float]]], area: list[list[float]], margin: float = 1.0) -> None:
+        self.obstacles: list[list[float]]    = [ self.normalize(rect) for rect in obstacles ]
+        self.area: list[float]               = self.normalize(area)
+        self.margin                          = margin
+        self.placed: list[list[list[float]]] = []
+
+    def normalize(self, rect: list[list[float]]):
+        return [ min(rect[0][0], rect[1][0]), min(rect[0][1], rect[1][1]), max(rect[0][0], rect[1][0]), max(rect[0][1], rect[1][1]) ]
+
+    def free_intervals(self, x: float, width: float, height: float, margin: float):
+        # x を左下とした幅 width の矩形と重なる障害物の、左下 y の禁止区間 (開区間)
+        y_min, y_max = self.area[1], self.area[3] - height
+        blocked = sorted([
+            (r[1] - height - margin, r[3] + margin)
+            for r in self.obstacles
+            if r[0] - width - margin < x < r[2] + margin
+        ])
+        intervals, y = [], y_min
+        for b0, b1 in blocked:
+            if y > y_max:
+                break
+            if b0 >= y:
+                intervals.append([ y, min(b0, y_max) ])
+            y = max(y, b1)
+        if y <= y_max:
+            intervals.append([ y, y_max ])
+        return intervals
+
+    def candidates_x(self, width: float, margin: float, anchor: list[float] = None):
+        x_min, x_max = self.area[0], self.area[2] - width
+        xs = { x_min, x_max }
+        for r in self.obstacles:
+            xs.add(r[2] + margin)
+            xs.add(r[0] - width - margin)
+        if anchor is not None:
+            xs.add(anchor[0] - width / 2)
+        return sorted([ x for x in xs if x_min <= x <= x_max ])
+
+    def find_position(self, size: list[float], anchor: list[float] = None, margin: float = None):
+        if margin is None:
+            margin = self.margin
+        width, height = size[0], size[1]
+        if self.area[2] - self.area[0] < width or self.area[3] - self.area[1] < height:
+            return None
+
+        xs = self.candidates_x(width, margin, anchor)
+        if anchor is None:
+            for x in xs:
+                intervals = self.free_intervals(x, width, height, margin)
+                if intervals:
+                    return [ x, intervals[0][0] ]
+            return None
+
+        # アンカーに近い x から調べ、x 方向の距離だけで最良値を超えたら打ち切る
+        best, best_distance = None, None
+        for x in sorted(xs, key=lambda x: abs(x + width / 2 - anchor[0])):
+            if best_distance is not None and (x + width / 2 - anchor[0]) ** 2 >= best_distance:
+                break
+            intervals = self.free_intervals(x, width, height, margin)
+            ty = anchor[1] - height / 2
+            for y0, y1 in intervals:
+                y = min( max(ty, y0), y1 )
+                distance = (x + width / 2 - anchor[0]) ** 2 + (y + height / 2 - anchor[1]) ** 2
+                if best_distance is None or distance < best_distance:
+                    best, best_distance = [ x, y ], distance
+        return best
+
+    def place(self, size: list[float], anchor: list[float] = None):
+        position = self.find_position(size, anchor)
+        if position is None:
+            return None
+        rect = [ position, [ position[0] + size[0], position[1] + size[1] ] ]
+        self.obstacles.append( self.normalize(rect) )
+        self.placed.append(rect)
+        return rect
+
+    def place_all(self, sizes: list[list[float]], anchors: list[list[float]] = None):
+        if anchors is None:
+            anchors = [ None ] * len(sizes)
+        return [ self.place(size, anchor) for size, anchor in zip(sizes, anchors) ]
+
+    def find_point(self, anchor: list[float] = None):
+        return self.find_position([ 0.0, 0.0 ], anchor)
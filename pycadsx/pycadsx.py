@@ -1,6 +1,9 @@
 import os
 import subprocess
+import time
+from functools import cached_property
 from pathlib import Path
+from pycadsx.config import CadConfig, IniFileParser
 from pycadsx.model import Model
 from pycadsx.material import Material
 from pycadsx.part import Part
@@ -39,10 +42,24 @@ class PyCadSx:
         self.default_plotter: Plotter = None
 
         self.icaddir = Path( os.getenv('ICADDIR') )
-        self.ini = IniFileParser(self.icaddir / 'ETC/ICAD.ini')
-        self.model_info_titles  = ['設計情報', '加工情報', '組付情報'] + [ self.ini.get('@PARTSINFO').get(f'TAB_NAME{i}') for i in range(1, 5) ]
+        self.config: CadConfig = self.client.config
         self.materials: list[Material] = []
-        self.db_lock = DBLock(self.icaddir / 'bin/DBLOCK.exe')
+        self.timings: dict[str, float] = {}
+        # fast で接続した時は self.model にアクティブなモデルしか入っていない
+        self.is_partial: bool          = False
+
+    # ICAD.ini や DBLOCK は使う時まで読まない
+    @property
+    def ini(self) -> IniFileParser:
+        return self.config.ini
+
+    @property
+    def model_info_titles(self) -> list[str]:
+        return self.config.get_model_info_titles()
+
+    @cached_property
+    def db_lock(self) -> 'DBLock':
+        return DBLock(self.icaddir / 'bin/DBLOCK.exe')
 
     def model_set_active(self, model: 'Model'):
         self.active_model = model
@@ -53,8 +70,11 @@ class PyCadSx:
         self.get_inf_sys()
         return self.active_model
 
-    def get_inf_sys(self):
-        system_data                  = self.client.system.get_inf_sys()
+    def get_inf_sys(self, reuse_models: bool = False, fast: bool = False):
+        # fast の場合はアクティブなモデルだけを作り、プロッタも取得しない
+        # (他のモデルが必要になったら fast=False で呼び直す)
+        start                        = time.perf_counter()
+        system_data                  = self.client.system.get_inf_sys(self.model if reuse_models else None, fast)
         self.version                 = system_data.version
         self.level                   = system_data.level
         self.path: str               = system_data.path
@@ -88,11 +108,24 @@ class PyCadSx:
         if system_data.active_model.id in self.model:
             self.active_model = self.model[system_data.active_model.id]
 
-        self.get_plotters()
+        self.is_partial              = system_data.is_partial
 
-    def open_model(self, path: Path, read_only: bool = False, password: str = None):
-        self.client.system.open_model(self, path, read_only, password)
-        self.get_inf_sys()
+        if not fast:
+            self.get_plotters()
+        self.timings['fast_attach' if fast else 'attach'] = time.perf_counter() - start
+
+    def refresh_models(self):
+        # 開いているモデルを全部見る前に、fast で省いたモデルを取り直す
+        if self.is_partial:
+            self.get_inf_sys(reuse_models=True)
+
+    def open_model(self, path: Path, read_only: bool = False, password: str = None, reuse_models: bool = False):
+        model = self.client.system.open_model(self, path, read_only, password)
+        if model is not None:
+            # 既に開いているモデルは読み直さずにアクティブにする
+            model.set_active()
+        self.get_inf_sys(reuse_models)
+        return self.active_model
 
     def get_materials(self):
         self.materials: list[Material] = self.client.system.get_materials()
@@ -106,33 +139,7 @@ class PyCadSx:
         return self.plotters, self.default_plotter
     
     def get_language(self):
-        language = IniFileParser(f'{self.icaddir}\\LANG\\Language')
-        return int( language.get('LANGUAGE').get('ILANGID', '1') )
-
-
-class IniFileParser:
-    def __init__(self, filepath: Path) -> None:
-        self._data = {}
-        with open(filepath, encoding='cp932') as f:
-            lines = f.readlines()
-        for line in lines:
-            if line[-1] == '\n':
-                line = line[:-1]
-            if line == '' or line.startswith(';') or line.startswith('；'):
-                continue
-            elif line.startswith('[') and line.endswith(']'):
-                section = line[1:-1]
-                self._data[section] = {}
-                continue
-            else:
-                splitted = line.split('=') + ['', '']
-                self._data[section][splitted[0]] = splitted[1]
-
-    def __getitem__(self, key) -> dict:
-        return self._data.get(key, {})
-    
-    def get(self, key) -> dict:
-        return self.__getitem__(key)
+        return self.config.get_language()
 
 
 class DBLock:
@@ -7,6 +7,14 @@ from pycadsx.cadtypes import CadTypes
 
 
 class RPart:
+
+    __slots__ = (
+        'client', 'model_id', 'wfno', 'vsno', 'type', 'id', 'prmno', 'kind', 'part_id', 'is3d', 'vswfno', 'layer', 'visi',
+        'is_25d', 'member_kind', 'prim_num', 'ent_len', 'grp_kind', 'cg_attr', 'profile_attr', 'arrow_id', 'body_type',
+        'vwtype', 'fc_state', 'is_transparent', 'is_draft', 'ref_model_name', 'part3d_name', 'has_pos', 'is_mirror',
+        'ref_vs_name', 'angle', 'origin', 'name', 'comment'
+    )
+
     def __init__(self, client: 'Client', model_id: int = 0, wfno: int = 0, vsno: int = 0):
         self.client         = client
         self.model_id       = model_id
@@ -0,0 +1,130 @@
+import heapq
+import typing
+if typing.TYPE_CHECKING:
+    from pycadsx.client import Client
+    from pycadsx.model import Model
+    from pycadsx.entity import Entity
+    from pycadsx.part import Part
+
+
+class SpatialIndex:
+    def __init__(self, items: list, boxes: list[list[list[float]]], leaf_size: int = 8) -> None:
+        self.items                    = list(items)
+        self.boxes: list[list[float]] = [ self.normalize(box) for box in boxes ]
+        self.leaf_size                = leaf_size
+        self.order: list[int]         = []
+        self.nodes: list[list]        = []
+        if len(self.items) != len(self.boxes):
+            raise Exception(f'items and boxes differ in length ({len(self.items)} != {len(self.boxes)})')
+        if self.items:
+            self.build( list( range( len(self.items) ) ) )
+
+    def __len__(self):
+        return len(self.items)
+
+    @classmethod
+    def from_entities(cls, client: 'Client', entities: list['Entity'], leaf_size: int = 8) -> 'SpatialIndex':
+        return cls(entities, client.model.get_extent_list(entities), leaf_size)
+
+    @classmethod
+    def from_parts(cls, client: 'Client', parts: list['Part'], leaf_size: int = 8) -> 'SpatialIndex':
+        # JVBOX2 は部品IDも受け付けるため Part.get_extent を個別に呼ばずにまとめて取得する
+        return cls(parts, client.model.get_extent_list(parts), leaf_size)
+
+    def normalize(self, box: list[list[float]]):
+        p0, p1 = box[0], box[1]
+        p0 = list(p0) + [0.0] * (3 - len(p0))
+        p1 = list(p1) + [0.0] * (3 - len(p1))
+        return [ min(p0[0], p1[0]), min(p0[1], p1[1]), min(p0[2], p1[2]), max(p0[0], p1[0]), max(p0[1], p1[1]), max(p0[2], p1[2]) ]
+
+    def union(self, indexes: list[int]):
+        boxes = self.boxes
+        return [
+            min([ boxes[i][0] for i in indexes ]), min([ boxes[i][1] for i in indexes ]), min([ boxes[i][2] for i in indexes ]),
+            max([ boxes[i][3] for i in indexes ]), max([ boxes[i][4] for i in indexes ]), max([ boxes[i][5] for i in indexes ])
+        ]
+
+    def build(self, indexes: list[int]):
+        # node : [box, left, right, start, end]  (left == -1 なら葉)
+        self.nodes.append(None)
+        stack = [ (0, indexes) ]
+        while stack:
+            node_no, indexes = stack.pop()
+            box = self.union(indexes)
+            if len(indexes) <= self.leaf_size:
+                start = len(self.order)
+                self.order.extend(indexes)
+                self.nodes[node_no] = [ box, -1, -1, start, len(self.order) ]
+                continue
+            extents = [ box[3] - box[0], box[4] - box[1], box[5] - box[2] ]
+            axis = extents.index( max(extents) )
+            boxes = self.boxes
+            indexes = sorted(indexes, key=lambda i: boxes[i][axis] + boxes[i][axis + 3])
+            half = len(indexes) // 2
+            left, right = len(self.nodes), len(self.nodes) + 1
+            self.nodes.extend([ None, None ])
+            self.nodes[node_no] = [ box, left, right, 0, 0 ]
+            stack.append( (left, indexes[:half]) )
+            stack.append( (right, indexes[half:]) )
+
+    def is_overlap(self, a: list[float], b: list[float]):
+        return a[0] <= b[3] and b[0] <= a[3] and a[1] <= b[4] and b[1] <= a[4] and a[2] <= b[5] and b[2] <= a[5]
+
+    def distance2(self, box: list[float], point: list[float]):
+        d = 0.0
+        for i in range(3):
+            if point[i] < box[i]:
+                d += (box[i] - point[i]) ** 2
+            elif point[i] > box[i + 3]:
+                d += (point[i] - box[i + 3]) ** 2
+        return d
+
+    def query_indexes(self, box: list[float]):
+        result = []
+        if not self.nodes:
+            return result
+        stack = [0]
+        while stack:
+            node_box, left, right, start, end = self.nodes[ stack.pop() ]
+            if not self.is_overlap(node_box, box):
+                continue
+            if left == -1:
+                result.extend([ i for i in self.order[start:end] if self.is_overlap(self.boxes[i], box) ])
+            else:
+                stack.append(left)
+                stack.append(right)
+        return sorted(result)
+
+    def query_box(self, box: list[list[float]], exact: bool = False, model: 'Model' = None, part: bool = False):
+        items = [ self.items[i] for i in self.query_indexes( self.normalize(box) ) ]
+        if exact and model is not None and items:
+            ids = model.get_entities_in_box(box, part).keys()
+            items = [ item for item in items if item.id in ids ]
+        return items
+
+    def query_point(self, point: list[float]):
+        point = list(point) + [0.0] * (3 - len(point))
+        return self.query_box([ point, point ])
+
+    def nearest(self, point: list[float], k: int = 1, max_distance: float = None):
+        point = list(point) + [0.0] * (3 - len(point))
+        result: list[tuple[float, object]] = []
+        if not self.nodes:
+            return result
+        limit = None if max_distance is None else max_distance ** 2
+        heap = [ (self.distance2(self.nodes[0][0], point), 0, 0) ]
+        while heap and len(result) < k:
+            d, is_item, no = heapq.heappop(heap)
+            if limit is not None and d > limit:
+                break
+            if is_item:
+                result.append( (d ** 0.5, self.items[no]) )
+                continue
+            node_box, left, right, start, end = self.nodes[no]
+            if left == -1:
+                for i in self.order[start:end]:
+                    heapq.heappush(heap, (self.distance2(self.boxes[i], point), 1, i))
+            else:
+                for child in [left, right]:
+                    heapq.heappush(heap, (self.distance2(self.nodes[child][0], point), 0, child))
+        return result
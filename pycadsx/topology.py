@@ -0,0 +1,165 @@
+from array import array
+import typing
+if typing.TYPE_CHECKING:
+    from pycadsx.client import Client
+from pycadsx.edge import Edge
+from pycadsx.entity import Entity
+from pycadsx.face import Face
+
+
+class Topology:
+    def __init__(self, client: 'Client', entities: list[Entity], tolerance: float = 1e-6, chunk_size: int = 1000) -> None:
+        self.client                           = client
+        self.entities                         = entities
+        self.tolerance                        = tolerance
+        self.chunk_size                       = chunk_size
+        self.edges: list[Edge]                = []
+        self.faces: list[Face]                = []
+        self.vertices: list[list[float]]      = []
+        self.middle_points: list[list[float]] = []
+        self.edge_indexes: dict[tuple, int]   = {}
+        self.face_indexes: dict[tuple, int]   = {}
+        self.edge_faces_offsets               = array('l', [0])
+        self.edge_faces                       = array('l')
+        self.face_edges_offsets               = array('l', [0])
+        self.face_edges                       = array('l')
+        self.vertex_edges_offsets             = array('l', [0])
+        self.vertex_edges                     = array('l')
+        self.edge_vertices                    = array('l')
+
+    def edge_key(self, edge: Edge):
+        return ( int(edge.id), int(edge.prmno), int(edge.edgeno), int(edge.csgsol) )
+
+    def face_key(self, face: Face):
+        return ( int(face.id), int(face.prmno), int(face.faceno), int(face.csgsol) )
+
+    def vertex_index(self, point: list[float], vertex_indexes: dict[tuple, int]):
+        key = tuple([ round(c / self.tolerance) for c in point ])
+        index = vertex_indexes.get(key)
+        if index is None:
+            index = len(self.vertices)
+            vertex_indexes[key] = index
+            self.vertices.append(point)
+        return index
+
+    def load(self):
+        self.edges = self.client.part.get_edges(self.entities)
+        self.edge_indexes = { self.edge_key(edge) : i for i, edge in enumerate(self.edges) }
+
+        edge_faces: list[list[int]] = []
+        vertex_indexes: dict[tuple, int] = {}
+        for i in range(0, len(self.edges), self.chunk_size):
+            edges = self.edges[i : i + self.chunk_size]
+            faces_list, middle_points = self.client.edge.get_edges_faces(edges)
+            end_points_list = self.client.edge.get_end_points_list(edges)
+            self.middle_points.extend(middle_points)
+
+            for faces in faces_list:
+                indexes = []
+                for face in faces:
+                    key = self.face_key(face)
+                    if key not in self.face_indexes:
+                        self.face_indexes[key] = len(self.faces)
+                        self.faces.append(face)
+                    indexes.append( self.face_indexes[key] )
+                edge_faces.append(indexes)
+
+            for end_points in end_points_list:
+                if len(end_points) == 0:
+                    self.edge_vertices.extend([ -1, -1 ])
+                    continue
+                v0 = self.vertex_index(end_points[0], vertex_indexes)
+                v1 = self.vertex_index(end_points[-1], vertex_indexes)
+                self.edge_vertices.extend([ v0, v1 ])
+
+        # 辺ごとの応答は get_edges_faces / get_end_points_list で揃えてあるので、ずれていたら止める
+        if len(edge_faces) != len(self.edges) or len(self.edge_vertices) != len(self.edges) * 2:
+            raise Exception(f'topology replies do not match the edges ({len(edge_faces)} faces, {len(self.edge_vertices) // 2} vertices, {len(self.edges)} edges)')
+
+        face_edges: list[list[int]] = [ [] for _ in self.faces ]
+        for edge_index, indexes in enumerate(edge_faces):
+            for face_index in indexes:
+                face_edges[face_index].append(edge_index)
+
+        vertex_edges: list[list[int]] = [ [] for _ in self.vertices ]
+        for edge_index in range( len(self.edges) ):
+            v0, v1 = self.edge_vertices[edge_index * 2], self.edge_vertices[edge_index * 2 + 1]
+            for v in ([ v0 ] if v0 == v1 else [ v0, v1 ]):
+                if v != -1:
+                    vertex_edges[v].append(edge_index)
+
+        self.edge_faces_offsets, self.edge_faces     = self.compact(edge_faces)
+        self.face_edges_offsets, self.face_edges     = self.compact(face_edges)
+        self.vertex_edges_offsets, self.vertex_edges = self.compact(vertex_edges)
+        return self
+
+    def compact(self, lists: list[list[int]]):
+        offsets, values = array('l', [0]), array('l')
+        for items in lists:
+            values.extend(items)
+            offsets.append( len(values) )
+        return offsets, values
+
+    def edge_index(self, edge: Edge) -> int | None:
+        return self.edge_indexes.get( self.edge_key(edge) )
+
+    def face_index(self, face: Face) -> int | None:
+        return self.face_indexes.get( self.face_key(face) )
+
+    def faces_of_edge(self, edge_index: int) -> list[int]:
+        return self.edge_faces[ self.edge_faces_offsets[edge_index] : self.edge_faces_offsets[edge_index + 1] ].tolist()
+
+    def edges_of_face(self, face_index: int) -> list[int]:
+        return self.face_edges[ self.face_edges_offsets[face_index] : self.face_edges_offsets[face_index + 1] ].tolist()
+
+    def edges_of_vertex(self, vertex_index: int) -> list[int]:
+        return self.vertex_edges[ self.vertex_edges_offsets[vertex_index] : self.vertex_edges_offsets[vertex_index + 1] ].tolist()
+
+    def vertices_of_edge(self, edge_index: int) -> list[int]:
+        return [ self.edge_vertices[edge_index * 2], self.edge_vertices[edge_index * 2 + 1] ]
+
+    def neighbor_faces(self, face_index: int) -> list[int]:
+        neighbors = set()
+        for edge_index in self.edges_of_face(face_index):
+            neighbors.update( self.faces_of_edge(edge_index) )
+        neighbors.discard(face_index)
+        return sorted(neighbors)
+
+    def adjacent_edges(self, edge_index: int) -> list[int]:
+        adjacents = set()
+        for vertex_index in self.vertices_of_edge(edge_index):
+            if vertex_index != -1:
+                adjacents.update( self.edges_of_vertex(vertex_index) )
+        adjacents.discard(edge_index)
+        return sorted(adjacents)
+
+    def loops(self, face_index: int) -> list[list[int]]:
+        edges = self.edges_of_face(face_index)
+        vertex_edges: dict[int, list[int]] = {}
+        for edge_index in edges:
+            for vertex_index in set( self.vertices_of_edge(edge_index) ):
+                vertex_edges.setdefault(vertex_index, []).append(edge_index)
+
+        loops, visited = [], set()
+        for start in edges:
+            if start in visited:
+                continue
+            loop, edge_index = [], start
+            v_start, vertex_index = self.vertices_of_edge(start)
+            while edge_index is not None:
+                visited.add(edge_index)
+                loop.append(edge_index)
+                if vertex_index == v_start or vertex_index == -1:
+                    break
+                next_edge = None
+                for candidate in vertex_edges.get(vertex_index, []):
+                    if candidate not in visited:
+                        next_edge = candidate
+                        break
+                if next_edge is None:
+                    break
+                v0, v1 = self.vertices_of_edge(next_edge)
+                vertex_index = v1 if v0 == vertex_index else v0
+                edge_index = next_edge
+            loops.append(loop)
+        return loops
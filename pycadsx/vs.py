@@ -13,6 +13,7 @@ class VS:
         self.vsno = 0
         self.type = CadTypes.VS.Type(0)
         self.refid = 0
+        self.has_inf = False
 
     def from_data(self, data: 'VsCommand.Data'):
         self.model_id = data.model_id
@@ -32,6 +33,7 @@ class VS:
         self.view_type    = info.view_type
         self.local_origin = info.local_origin
         self.local_matrix = info.local_matrix
+        self.has_inf      = True
 
     def get_r_parts(self, partname: str=None) -> dict[int, RPart]:
         return self.client.vs.get_r_parts(self, partname)
@@ -51,73 +53,66 @@ class VS:
     def get_extent(self):
         return self.client.vs.get_extent(self)
 
+    def ensure_inf(self):
+        if not self.has_inf:
+            self.get_inf()
+
+    def invalidate(self):
+        # 移動・尺度変更など、サーバー側でビューの変換が変わったときに呼ぶ
+        self.has_inf = False
+
+    def is_transformed(self):
+        return self.type in [CadTypes.VS.Type.VIEW, CadTypes.VS.Type.LOCAL_VIEW]
+
+    def transform(self):
+        # (cos * scale, sin * scale, origin x, origin y)
+        self.ensure_inf()
+        rad = math.radians(self.angle)
+        return math.cos(rad) * self.scale, math.sin(rad) * self.scale, self.origin[0], self.origin[1]
+
+    def to_global(self, points: list[list[float]]) -> list[list[float]]:
+        if not self.is_transformed():
+            return [ list(p) for p in points ]
+        c, s, ox, oy = self.transform()
+        return [ [ p[0] * c - p[1] * s + ox, p[0] * s + p[1] * c + oy, *p[2:] ] for p in points ]
+
+    def to_local(self, points: list[list[float]]) -> list[list[float]]:
+        if not self.is_transformed():
+            return [ list(p) for p in points ]
+        c, s, ox, oy = self.transform()
+        d = c * c + s * s
+        return [ [ ((p[0] - ox) * c + (p[1] - oy) * s) / d, ((p[1] - oy) * c - (p[0] - ox) * s) / d, *p[2:] ] for p in points ]
+
     def map_to_global(self, points1: list[ list[float] ]):
         
-        if self.type not in [CadTypes.VS.Type.VIEW, CadTypes.VS.Type.LOCAL_VIEW]:
+        if not self.is_transformed():
             return [points1[0][:], points1[1][:]]
-        
-        points2 = [[0.0, 0.0], [0.0, 0.0]]
-
-        if self.angle == 0.0:
-            points2[0][0] = points1[0][0] * self.scale + self.origin[0]
-            points2[0][1] = points1[0][1] * self.scale + self.origin[1]
-            points2[1][0] = points1[1][0] * self.scale + self.origin[0]
-            points2[1][1] = points1[1][1] * self.scale + self.origin[1]
-        else:
-            rad = math.radians(self.angle)
-            cos = math.cos(rad)
-            sin = math.sin(rad)
-
-            points = [
-                [points1[0][0], points1[0][1]],
-                [points1[1][0], points1[0][1]],
-                [points1[0][0], points1[1][1]],
-                [points1[1][0], points1[1][1]]
-            ]
-
-            transformed_points = [
-                [
-                    (p[0] * cos - p[1] * sin) * self.scale + self.origin[0],
-                    (p[0] * sin + p[1] * cos) * self.scale + self.origin[1]
-                ] for p in points
-            ]
-
-            points2[0][0] = min(p[0] for p in transformed_points)
-            points2[0][1] = min(p[1] for p in transformed_points)
-            points2[1][0] = max(p[0] for p in transformed_points)
-            points2[1][1] = max(p[1] for p in transformed_points)
-
-        return points2
+
+        points = self.to_global([
+            [points1[0][0], points1[0][1]],
+            [points1[1][0], points1[0][1]],
+            [points1[0][0], points1[1][1]],
+            [points1[1][0], points1[1][1]]
+        ])
+        return [
+            [ min(p[0] for p in points), min(p[1] for p in points) ],
+            [ max(p[0] for p in points), max(p[1] for p in points) ]
+        ]
 
     def convert_point(self, point: list[float], to_global: bool=True):
-        if not self.type in [CadTypes.VS.Type.VIEW, CadTypes.VS.Type.LOCAL_VIEW]:
-            return point
-        
-        self.get_inf()
-        angle = self.angle / 180.0 * math.pi
-
-        if to_global:
-            if math.isclose(angle, 0.0, abs_tol=0.001):
-                point[0] = point[0] * self.scale + self.origin[0]
-                point[1] = point[1] * self.scale + self.origin[1]
-                return point
-            cos, sin = math.cos(angle), math.sin(angle)
-            point[0] = (point[0] * cos - point[1] * sin) * self.scale + self.origin[0]
-            point[1] = (point[0] * sin + point[1] * cos) * self.scale + self.origin[1]
+        if not self.is_transformed():
             return point
-        
-        if math.isclose(angle, 0.0, abs_tol=0.001):
-            point[0] = (point[0] - self.origin[0]) * self.scale
-            point[1] = (point[1] - self.origin[1]) * self.scale
-            return point
-            
-        cos, sin = math.cos(angle), math.sin(angle)
-        point[0] = ((point[0] - self.origin[0]) * cos - (point[1] - self.origin[1]) * sin) * self.scale
-        point[1] = ((point[0] - self.origin[0]) * sin + (point[1] - self.origin[1]) * cos) * self.scale
-        return point
+        return self.to_global([ point ])[0] if to_global else self.to_local([ point ])[0]
 
     def move(self, point: list[float]):
         self.client.vs.move(self, point)
 
+    @staticmethod
+    def move_views(moves: list[tuple['VS', list[float]]]):
+        # 複数のビューを1回のコマンドで移動する (クライアントは先頭のビューのものを使う)
+        if len(moves) == 0:
+            return
+        moves[0][0].client.vs.move_views(moves)
+
     def set_scale(self, scale: float, move: bool = False):
         self.client.vs.set_scale(self, scale, move)
\ No newline at end of file
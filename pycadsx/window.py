@@ -5,10 +5,25 @@ from pycadsx.cadtypes import CadTypes
 
 
 class Window:
+
+    # JVGPIF で取得する属性 (最初に参照した時に問い合わせる)
+    inf_names = [ 'is_base', 'model_id', 'vsno', 'vstype', 'wfno', 'wftype', 'status', 'rect', 'mdi_rect' ]
+
     def __init__(self, client: 'Client', pdno: int) -> None:
         self.client = client
         self.pdno = pdno
+
+    def __getattr__(self, name: str):
+        if name not in Window.inf_names:
+            raise AttributeError(name)
         self.get_inf()
+        if name not in self.__dict__:
+            raise AttributeError(name)
+        return self.__dict__[name]
+
+    def invalidate(self):
+        for name in Window.inf_names:
+            self.__dict__.pop(name, None)
 
     def from_inf(self, window: 'WindowCommand.Info'):
         self.is_base  = window.is_base
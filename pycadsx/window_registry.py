@@ -0,0 +1,55 @@
+import typing
+if typing.TYPE_CHECKING:
+    from pycadsx.client import Client
+from pycadsx.window import Window
+
+
+class WindowRegistry:
+    def __init__(self, client: 'Client') -> None:
+        self.client                                 = client
+        self.pdnos: dict[tuple[int, int, int], int] = {}
+        self.windows: dict[int, Window]             = {}
+        self.hits                                   = 0
+        self.misses                                 = 0
+
+    def get(self, model_id: int, vsno: int = 0, wfno: int = 0) -> Window | None:
+        # (モデル, VS, WF) → pdno は JVGPD を1回だけ問い合わせて覚えておく
+        key = (model_id, vsno, wfno)
+        pdno = self.pdnos.get(key)
+        if pdno is not None:
+            self.hits += 1
+            return self.window(pdno)
+
+        self.misses += 1
+        element = self.client.send(f';JVGPD .MODEL {model_id} .VS {vsno} .WF {wfno} : ;@JVEND', 'window.get_pdno.xml')
+        for sx_pd in element.findall('sx_pd'):
+            pdno = int( sx_pd.get('pdno') )
+            self.pdnos[key] = pdno
+            return self.window(pdno)
+
+    def window(self, pdno: int) -> Window:
+        window = self.windows.get(pdno)
+        if window is None:
+            window = Window(self.client, pdno)
+            self.windows[pdno] = window
+        return window
+
+    def discard_window(self, pdno: int):
+        self.windows.pop(pdno, None)
+        for key in [ key for key, value in self.pdnos.items() if value == pdno ]:
+            del self.pdnos[key]
+
+    def discard_vs(self, model_id: int, vsno: int):
+        self.pdnos.pop( (model_id, vsno, 0), None )
+
+    def discard_model(self, model_id: int):
+        for key in [ key for key in self.pdnos if key[0] == model_id ]:
+            del self.pdnos[key]
+
+    def invalidate_infs(self):
+        for window in self.windows.values():
+            window.invalidate()
+
+    def clear(self):
+        self.pdnos.clear()
+        self.windows.clear()
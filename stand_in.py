@@ -0,0 +1,72 @@
+import socket
+import threading
+import time
+import typing
+
+
+class StandInServer:
+    # CAD の代わりに Client の要求を受けて XML を返すサーバー (ClientPool などを CAD 無しで確認する用)
+    # CAD と同じく1接続ずつ順番に処理する
+    def __init__(
+                self, handler: typing.Callable[[str], str] = None, host: str = 'localhost', port: int = 0,
+                encoding: str = 'utf-16le', delay: float = 0.0
+            ) -> None:
+        self.handler              = handler if handler is not None else StandInServer.default_handler
+        self.host                 = host
+        self.encoding             = encoding
+        self.delay                = delay
+        self.requests: list[str]  = []
+        self.is_running           = False
+        self.thread               = None
+        self.server               = socket.create_server( (host, port) )
+        self.server.settimeout(0.1)
+        self.port                 = self.server.getsockname()[1]
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @staticmethod
+    def default_handler(command: str) -> str:
+        return '<sx_msg></sx_msg>'
+
+    def start(self):
+        self.is_running = True
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        # 以降の接続は拒否される (CAD が落ちた状態)
+        self.is_running = False
+        if self.thread is not None:
+            self.thread.join()
+        self.server.close()
+
+    def serve(self):
+        while self.is_running:
+            try:
+                connection, _ = self.server.accept()
+            except socket.timeout:
+                continue
+            with connection:
+                self.respond(connection)
+
+    def respond(self, connection: socket.socket):
+        end  = 'SxMsg_End'.encode(self.encoding)
+        data = b''
+        while end not in data:
+            chunk = connection.recv(4096)
+            if not chunk:
+                return
+            data += chunk
+
+        # license=, mode=, ret_ent= の行と末尾の SxMsg_End を除いた部分がコマンド
+        lines   = data.decode(self.encoding).split('\n')
+        command = '\n'.join([ line for line in lines[3:] if line != 'SxMsg_End' ])
+        self.requests.append(command)
+        if self.delay > 0.0:
+            time.sleep(self.delay)
+        connection.sendall( self.handler(command).encode(self.encoding) )
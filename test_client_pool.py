@@ -0,0 +1,27 @@
+import pycadsx
+from pycadsx.client_pool import ClientPool
+from stand_in import StandInServer
+
+def main():
+    # CAD の代わりに3つのスタンドインサーバーを立て、1つは途中で止め、1つのポートにはサーバーを置かない
+    servers = [ StandInServer(delay=0.01).start() for i in range(3) ]
+    dead_server = StandInServer()
+    dead_server.stop()
+    dead_port = dead_server.port
+    pool = ClientPool([ server.port for server in servers ] + [ dead_port ])
+
+    def job(client: pycadsx.Client, item: int):
+        if item == 20:
+            servers[0].stop()
+        client.send(f';GXDMY;@JVEND', 'job.xml')
+        return item * 2
+
+    results = pool.map(job, range(100))
+    for server in servers[1:]:
+        server.stop()
+
+    assert pool.values(results) == [ i * 2 for i in range(100) ], pool.failures(results)
+    print('done :', [ (worker.no, worker.is_alive, worker.done, worker.stolen) for worker in pool.workers ])
+
+if __name__ == '__main__':
+    main()
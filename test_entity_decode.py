@@ -0,0 +1,32 @@
+from lxml import etree
+import pycadsx
+
+INFO_KEYS = [
+    'userid', 'dim', 'vswfno', 'layer', 'visi', 'is_25d', 'member_kind', 'prim_num', 'ent_len', 'model_id', 'grp_kind',
+    'cg_attr', 'profile_attr', 'parts_id', 'arrow_id', 'vwtype', 'is_transparent', 'is_draft'
+]
+
+def entinf(kind: int, body_type: int = 1, fc_state: int = 1):
+    attributes = { key : '0' for key in INFO_KEYS }
+    attributes.update({ 'id' : '10', 'type' : '1', 'kind' : str(kind), 'body_type' : str(body_type), 'fc_state' : str(fc_state) })
+    return etree.Element('sx_entinf', attributes)
+
+def main():
+    Kind = pycadsx.CadTypes.Entity.Kind
+
+    # 既知の種別は enum になる (2 はグループ種別で分ける)
+    assert pycadsx.EntityCommand.Info( entinf(6) ).kind == Kind.Part
+    assert pycadsx.EntityCommand.Info( entinf(4) ).kind == Kind.Segment
+    assert pycadsx.EntityCommand.Info( entinf(2) ).kind == Kind.Group
+
+    # 未知の値は例外にせず int のまま残す
+    info = pycadsx.EntityCommand.Info( entinf(9, body_type=99, fc_state=99) )
+    assert info.kind == 9 and not isinstance(info.kind, Kind), info.kind
+    assert info.body_type == 99 and info.fc_state == 99
+
+    data = pycadsx.EntityCommand.Data( etree.Element('sx_ent', { 'type' : '9999', 'id' : '10', 'prmno' : '0', 'kind' : '9', 'part_id' : '0', 'dim' : '1' }) )
+    assert data.kind == 9 and data.type == 9999 and data.is3d
+    print('done')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import re
+from lxml import etree
+import pycadsx
+from pycadsx.topology import Topology
+
+# 正方形の4辺と、その4辺を共有する表裏2面
+POINTS = [ (0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0) ]
+EDGES  = { edgeno : (POINTS[edgeno - 1], POINTS[edgeno % 4]) for edgeno in range(1, 5) }
+FACES  = [ 1, 2 ]
+
+
+class FakeClient(pycadsx.Client):
+    # 一括の JVUEN2 で 3 番の辺の中点 (KIND 8) だけが返らない CAD の代わり
+    def __init__(self) -> None:
+        super().__init__()
+        self.commands: list[str] = []
+
+    def face_xml(self, faceno: int):
+        return f'<sx_face id="1" prmno="0" faceno="{faceno}" csgsol="0" type="0" face_type="0"/>'
+
+    def pos_xml(self, point):
+        return f'<sx_pos x="{point[0]}" y="{point[1]}" z="{point[2]}"/>'
+
+    def reply(self, kind: int, edgeno: int):
+        start, end = EDGES[edgeno]
+        if kind == 3:
+            return ''.join([ self.face_xml(faceno) for faceno in FACES ])
+        if kind == 5:
+            return self.pos_xml(start) + self.pos_xml(end)
+        if kind == 8:
+            return self.pos_xml([ (a + b) / 2 for a, b in zip(start, end) ])
+        return ''
+
+    def send(self, command: str, xml_file_name=None, is_recieve=True, is_macro=False, ret_ent=True):
+        self.commands.append(command.split()[0])
+        if command.startswith(';JVEDGS'):
+            body = ''.join([ f'<sx_edge id="1" prmno="0" edgeno="{edgeno}" csgsol="0" type="0" edge_type="0"/>' for edgeno in EDGES ])
+        else:
+            body = ''
+            for kind, edgeno in re.findall(r'\.KIND (\d+) \.ENTID \d+ \.PRMNO \d+ \.DSPID \d+ \.EDGENO (\d+)', command):
+                if command.startswith(';JVUEN2') and kind == '8' and edgeno == '3':
+                    continue
+                body += self.reply(int(kind), int(edgeno))
+        return etree.fromstring(f'<sx_msg>{body}</sx_msg>')
+
+
+def main():
+    client = FakeClient()
+    entity = pycadsx.Entity(client)
+    entity.id = 1
+    topology = Topology(client, [ entity ]).load()
+
+    assert len(topology.edges) == 4 and len(topology.faces) == 2
+    for edge_index, edge in enumerate(topology.edges):
+        start, end = EDGES[edge.edgeno]
+        assert topology.faces_of_edge(edge_index) == [ 0, 1 ], topology.faces_of_edge(edge_index)
+        assert topology.middle_points[edge_index] == [ (a + b) / 2 for a, b in zip(start, end) ], topology.middle_points[edge_index]
+        assert [ tuple(topology.vertices[v]) for v in topology.vertices_of_edge(edge_index) ] == [ tuple(map(float, start)), tuple(map(float, end)) ]
+    assert topology.loops(0) == [ [ 0, 1, 2, 3 ] ], topology.loops(0)
+    print('done :', client.commands)
+
+if __name__ == '__main__':
+    main()